@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import signal
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -12,16 +14,24 @@ from rich.table import Table
 from kalshi_weather_hitbot.config import AppConfig, EnvSettings, load_yaml_config, save_yaml_config
 from kalshi_weather_hitbot.data.city_bootstrap import build_city_mapping, dump_city_mapping_yaml, is_daily_high_temp_series
 from kalshi_weather_hitbot.data.city_mapping import load_city_mapping
-from kalshi_weather_hitbot.data.metar import MetarClient, max_observed_temp_f
-from kalshi_weather_hitbot.data.nws import NWSClient, max_forecast_temp_f
+from kalshi_weather_hitbot.data.geo_store import GeoMetadataStore
+from kalshi_weather_hitbot.data.http_cache import HTTPCache
+from kalshi_weather_hitbot.data.metar import MetarClient, parse_observations
+from kalshi_weather_hitbot.data.nws import NWSClient
+from kalshi_weather_hitbot.data.observations import ObservationStore
+from kalshi_weather_hitbot.data.weather_context import CityWeatherContext, build_city_weather_context
 from kalshi_weather_hitbot.db import DB
 from kalshi_weather_hitbot.kalshi.client import APIError, KalshiClient
-from kalshi_weather_hitbot.kalshi.models import normalize_orderbook
-from kalshi_weather_hitbot.strategy.calibration import build_lock_calibration
-from kalshi_weather_hitbot.strategy.execution import build_client_order_id_deterministic, select_exit_order, select_order
+from kalshi_weather_hitbot.kalshi.ledger import ShadowLedger
+from kalshi_weather_hitbot.kalshi.models import Market, Order, OrderBookTop
+from kalshi_weather_hitbot.kalshi.order_pipeline import OrderSubmitPipeline, OrderSubmitStats, SubmitOutcome
+from kalshi_weather_hitbot.kalshi.orderbook_cache import OrderbookCache
+from kalshi_weather_hitbot.strategy.batch_decisions import decide_entries
+from kalshi_weather_hitbot.strategy.calibration import build_lock_calibration, record_settlement_outcomes
+from kalshi_weather_hitbot.strategy.execution import build_client_order_id_deterministic, select_exit_order
 from kalshi_weather_hitbot.strategy.fees import kalshi_fee_cents
 from kalshi_weather_hitbot.strategy.maker import maker_first_entry_price
-from kalshi_weather_hitbot.strategy.model import evaluate_lock
+from kalshi_weather_hitbot.strategy.model import BracketLadder
 from kalshi_weather_hitbot.strategy.order_maintenance import (
     build_amend_payload,
     order_age_seconds,
@@ -29,14 +39,17 @@ from kalshi_weather_hitbot.strategy.order_maintenance import (
     should_amend,
 )
 from kalshi_weather_hitbot.strategy.risk import (
+    ExposureIndex,
     check_entry_risk_limits,
     compute_cap_dollars,
-    compute_open_orders_exposure,
-    compute_positions_exposure,
     enforce_cap,
 )
 from kalshi_weather_hitbot.strategy.sizing import compute_contracts
-from kalshi_weather_hitbot.strategy.screener import climate_window_start, parse_temperature_market
+from kalshi_weather_hitbot.strategy.triggers import LockTriggerIndex, TriggerHit
+from kalshi_weather_hitbot.strategy.screener import ParsedMarket, climate_window_start, parse_temperature_market
+from kalshi_weather_hitbot.utils.concurrency import HostConcurrencyLimiter
+from kalshi_weather_hitbot.utils.deadline import CycleDeadline
+from kalshi_weather_hitbot.utils.rate_governor import Priority, RateGovernor, kalshi_rates_from_account_limits
 
 app = typer.Typer(
     help="Kalshi weather hit-rate bot. Environment via KALSHI_ENV=demo|production (demo default)."
@@ -50,6 +63,15 @@ def _signal_handler(_sig, _frame):
     RUNNING = False
 
 
+def _sleep_while_running(seconds: float) -> None:
+    deadline = time.monotonic() + max(0.0, float(seconds))
+    while RUNNING:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(1.0, remaining))
+
+
 try:
     signal.signal(signal.SIGINT, _signal_handler)
 except ValueError:
@@ -166,18 +188,6 @@ def _entry_total_cost_cents(cfg: AppConfig, price_cents: int, count: int) -> int
     return (price_cents * count) + _entry_fee_total_cents(cfg, price_cents, count)
 
 
-def _entry_priority_key(entry: dict) -> tuple[float, int, float]:
-    decision = entry["decision"]
-    book = entry["book"]
-    close_ts = entry["close_ts"]
-    net_ev_cents = int(getattr(decision, "expected_net_ev_cents", 0) or 0)
-    price_cents = int(getattr(decision, "price_cents", 0) or 0)
-    fee_cents = int(getattr(decision, "expected_fee_cents", 0) or 0)
-    total_cost_cents = max(1, price_cents + fee_cents)
-    liquidity_size = int(book.yes_ask_size if getattr(decision, "side", None) == "YES" else book.no_ask_size)
-    return (net_ev_cents / total_cost_cents, liquidity_size, -close_ts.timestamp())
-
-
 def _set_order_price_field(order: dict, side: str, price_cents: int, send_price_in_dollars: bool) -> None:
     if send_price_in_dollars:
         if str(side).upper() == "YES":
@@ -195,6 +205,56 @@ def _set_order_price_field(order: dict, side: str, price_cents: int, send_price_
             order["no_price"] = int(price_cents)
 
 
+def _reconcile_ledger(cfg: AppConfig, client: KalshiClient, ledger: ShadowLedger) -> None:
+    # Full REST snapshot: balance, positions and both open/resting order lists.
+    if not cfg.api_key_id:
+        ledger.reconcile(_available_dollars({"balance": 0}), [], [])
+        return
+    balance = client.get_balance()
+    positions = client.get_positions()
+    open_orders = client.list_orders(status="open")
+    try:
+        resting_orders = client.list_orders(status="resting")
+    except APIError:
+        resting_orders = []
+    ledger.reconcile(_available_dollars(balance), positions, [*open_orders, *resting_orders])
+
+
+def _probe_ledger_fills(cfg: AppConfig, client: KalshiClient, ledger: ShadowLedger) -> None:
+    # Resting orders can fill between cycles without any response of ours saying so.
+    if not cfg.api_key_id or ledger.reconciled_at is None or ledger.needs_reconcile():
+        return
+    try:
+        fills = client.get_fills(min_ts=int(ledger.reconciled_at))
+    except APIError:
+        ledger.mark_drift("fills_probe_failed")
+        return
+    if fills:
+        ledger.mark_drift(f"fill:{fills[0].get('ticker') or '?'}")
+
+
+def _ledger_summary(ledger: ShadowLedger, reconciled: bool) -> str:
+    stats = ledger.stats()
+    return (
+        "Ledger: "
+        f"reconciled={'yes' if reconciled else 'no'} "
+        f"reconciles={stats.reconciles} "
+        f"orders={stats.orders} "
+        f"positions={stats.positions} "
+        f"drift={','.join(stats.drift_reasons[:5]) or '-'}"
+    )
+
+
+def _build_orderbook_cache(cfg: AppConfig, client: KalshiClient) -> OrderbookCache:
+    return OrderbookCache(
+        client.get_orderbook,
+        max_age_by_use={
+            "exit": cfg.risk.exit_orderbook_max_age_seconds,
+            "retry": cfg.risk.retry_orderbook_max_age_seconds,
+        },
+    )
+
+
 def _place_entry_order_with_post_only_cross_fallback(
     client: KalshiClient,
     order: dict,
@@ -202,35 +262,118 @@ def _place_entry_order_with_post_only_cross_fallback(
     ticker: str,
     side: str,
     cfg: AppConfig,
+    orderbooks: OrderbookCache | None = None,
 ) -> dict | None:
     try:
         return client.place_order(order)
     except APIError as exc:
-        message = str(exc).lower()
-        if "order_already_exists" in message:
-            raise
-        if (not cfg.risk.post_only_cross_retry_once) or ("post" not in message or "cross" not in message):
-            raise
-        book = normalize_orderbook(client.get_orderbook(ticker))
-        current_implied_ask = book.best_yes_ask_cents if str(side).upper() == "YES" else book.best_no_ask_cents
-        previous_price_cents = parse_order_price_cents(order) or 1
-        if current_implied_ask is None:
-            console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry missing orderbook ask")
-            return None
-        retry_price_cents = max(1, min(int(current_implied_ask) - 1, int(previous_price_cents) - 1))
-        if retry_price_cents >= previous_price_cents:
-            console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry could not improve price")
-            return None
-        retry_order = dict(order)
-        _set_order_price_field(retry_order, side=side, price_cents=retry_price_cents, send_price_in_dollars=cfg.risk.send_price_in_dollars)
-        console.print(
-            f"[ORDER RETRY] ticker={ticker} post-only cross fallback repricing {previous_price_cents}->{retry_price_cents}"
+        return _retry_post_only_cross(client, order, exc, ticker=ticker, side=side, cfg=cfg, orderbooks=orderbooks)
+
+
+def _retry_post_only_cross(
+    client: KalshiClient,
+    order: dict,
+    exc: APIError,
+    *,
+    ticker: str,
+    side: str,
+    cfg: AppConfig,
+    orderbooks: OrderbookCache | None = None,
+) -> dict | None:
+    # Re-raises exc unless it is a post-only cross rejection we are allowed to reprice once.
+    message = str(exc).lower()
+    if "order_already_exists" in message:
+        raise exc
+    if (not cfg.risk.post_only_cross_retry_once) or ("post" not in message or "cross" not in message):
+        raise exc
+    book = (orderbooks or _build_orderbook_cache(cfg, client)).get(ticker, use="retry")
+    current_implied_ask = book.best_yes_ask_cents if str(side).upper() == "YES" else book.best_no_ask_cents
+    previous_price_cents = parse_order_price_cents(order) or 1
+    if current_implied_ask is None:
+        console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry missing orderbook ask")
+        return None
+    retry_price_cents = max(1, min(int(current_implied_ask) - 1, int(previous_price_cents) - 1))
+    if retry_price_cents >= previous_price_cents:
+        console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry could not improve price")
+        return None
+    retry_order = dict(order)
+    _set_order_price_field(retry_order, side=side, price_cents=retry_price_cents, send_price_in_dollars=cfg.risk.send_price_in_dollars)
+    console.print(
+        f"[ORDER RETRY] ticker={ticker} post-only cross fallback repricing {previous_price_cents}->{retry_price_cents}"
+    )
+    try:
+        return client.place_order(retry_order)
+    except APIError as retry_exc:
+        console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry failed: {retry_exc}")
+        return None
+
+
+def _submit_entry_orders(
+    client: KalshiClient,
+    planned: list[dict],
+    *,
+    cfg: AppConfig,
+    orderbooks: OrderbookCache | None = None,
+    pipeline: OrderSubmitPipeline | None = None,
+) -> list[SubmitOutcome]:
+    # `planned` is highest priority first with exposure and cash already reserved.
+    # With batch support the entries go out as one batched create and only post-only
+    # cross rejections are repriced through the pipeline; otherwise every place (and
+    # its repricing retry) runs through the pipeline, max_in_flight_orders at a time.
+    if not planned:
+        return []
+    pipeline = pipeline or OrderSubmitPipeline(cfg.risk.max_in_flight_orders)
+
+    def place(p: dict) -> dict | None:
+        return _place_entry_order_with_post_only_cross_fallback(
+            client, p["order"], ticker=p["ticker"], side=p["side"], cfg=cfg, orderbooks=orderbooks
         )
+
+    if len(planned) == 1 or not hasattr(client, "batch_place_orders") or not getattr(client, "batch_supported", True):
+        return pipeline.submit_all(planned, place)
+
+    started = time.perf_counter()
+    results = client.batch_place_orders([p["order"] for p in planned])
+    batch_ms = (time.perf_counter() - started) * 1000.0
+    outcomes = [SubmitOutcome(r.response, r.error, batch_ms) for r in results]
+    rejected = [(i, p, outcomes[i].error) for i, p in enumerate(planned) if outcomes[i].error is not None]
+
+    def reprice(item: tuple[int, dict, APIError]) -> dict | None:
+        _i, p, exc = item
+        return _retry_post_only_cross(client, p["order"], exc, ticker=p["ticker"], side=p["side"], cfg=cfg, orderbooks=orderbooks)
+
+    for (i, _p, _exc), retried in zip(rejected, pipeline.submit_all(rejected, reprice)):
+        outcomes[i] = SubmitOutcome(retried.response, retried.error, batch_ms + retried.latency_ms)
+    return outcomes
+
+
+def _order_submit_summary(outcomes: list[SubmitOutcome], pipeline: OrderSubmitPipeline) -> str | None:
+    if not outcomes:
+        return None
+    stats = OrderSubmitStats.from_outcomes(outcomes, pipeline.peak_in_flight)
+    return (
+        "Order submit: "
+        f"orders={stats.submitted} "
+        f"errors={stats.errors} "
+        f"max_in_flight={pipeline.max_in_flight} "
+        f"peak_in_flight={stats.peak_in_flight} "
+        f"avg_latency_ms={stats.avg_latency_ms:.0f} "
+        f"max_latency_ms={stats.max_latency_ms:.0f}"
+    )
+
+
+def _cancel_orders(client: KalshiClient, order_ids: list[str]) -> list[tuple[dict | None, APIError | None]]:
+    if not order_ids:
+        return []
+    if hasattr(client, "batch_cancel_orders"):
+        return [(r.response, r.error) for r in client.batch_cancel_orders(order_ids)]
+    out: list[tuple[dict | None, APIError | None]] = []
+    for oid in order_ids:
         try:
-            return client.place_order(retry_order)
-        except APIError as retry_exc:
-            console.print(f"[ORDER SKIP] ticker={ticker} post-only cross retry failed: {retry_exc}")
-            return None
+            out.append((client.cancel_order(oid), None))
+        except APIError as exc:
+            out.append((None, exc))
+    return out
 
 
 def _order_payload(
@@ -382,6 +525,7 @@ def bootstrap_cities(
         station_cache_path=cfg.data.awc_station_cache_path,
         cache_ttl_seconds=cfg.data.cache_ttl_seconds,
         nws_base_url=cfg.data.nws_base_url,
+        geo_store=_build_geo_store(cfg),
     )
     yaml_text = dump_city_mapping_yaml(mapping)
 
@@ -461,74 +605,304 @@ def init() -> None:
     console.print(f"Wrote config to {config_path}.")
 
 
-def _scan_once(
+def _build_rate_governor(cfg: AppConfig, client: KalshiClient | None = None) -> RateGovernor | None:
+    limits = cfg.rate_limits
+    if not limits.enabled:
+        return None
+    read_rate, write_rate = limits.kalshi_read_per_second, limits.kalshi_write_per_second
+    if client is not None and limits.use_account_limits and hasattr(client, "get_account_limits"):
+        try:
+            account_read, account_write = kalshi_rates_from_account_limits(client.get_account_limits())
+            read_rate = account_read or read_rate
+            write_rate = account_write or write_rate
+        except APIError as exc:
+            console.print(f"[RATE LIMITS] account limits unavailable, using configured defaults: {exc}")
+    governor = RateGovernor()
+    kalshi_host = RateGovernor.key_for(cfg.base_url)
+    for host, rate in (
+        (kalshi_host, read_rate),
+        (f"{kalshi_host}#write", write_rate),
+        (cfg.data.aviationweather_base_url, limits.aviationweather_per_second),
+        (cfg.data.nws_base_url, limits.nws_per_second),
+    ):
+        governor.configure(host, rate, burst=max(1.0, rate * limits.burst_seconds))
+    return governor
+
+
+def _rate_governor_summary(governor: RateGovernor | None) -> str | None:
+    if governor is None:
+        return None
+    parts = []
+    for host, stats in governor.stats().items():
+        lanes = ",".join(f"{lane}={seconds * 1000:.0f}" for lane, seconds in sorted(stats.wait_seconds_by_priority.items()))
+        parts.append(
+            f"{host}(rate={stats.rate_per_second:g}/s acquired={stats.acquired} waited={stats.waited} "
+            f"total_wait_ms={stats.total_wait_seconds * 1000:.0f} max_wait_ms={stats.max_wait_seconds * 1000:.0f} "
+            f"lane_wait_ms={lanes or '-'} penalties={stats.penalties})"
+        )
+    return "Rate governor: " + " ".join(parts)
+
+
+def _build_cycle_deadline(cfg: AppConfig, interval_seconds: float) -> CycleDeadline | None:
+    budget = cfg.cycle_budget
+    if not budget.enabled:
+        return None
+    return CycleDeadline(
+        budget.budget_seconds or interval_seconds,
+        discovery_reserve_fraction=budget.discovery_reserve_fraction,
+        read_reserve_fraction=budget.read_reserve_fraction,
+        min_retry_seconds=budget.min_retry_seconds,
+    )
+
+
+def _attach_deadline(deadline: CycleDeadline | None, *clients: Any) -> None:
+    for client in clients:
+        client.deadline = deadline
+
+
+def _wait_for_next_cycle(
     cfg: AppConfig,
-    calibration_lookup=None,
-    client: KalshiClient | None = None,
-    metar: MetarClient | None = None,
-    nws: NWSClient | None = None,
-) -> list[dict]:
-    db = DB(cfg.db_path)
-    client = client or KalshiClient(cfg)
-    metar = metar or MetarClient(
+    seconds: float,
+    metar: MetarClient,
+    triggers: LockTriggerIndex | None,
+) -> list[TriggerHit]:
+    # Sleeps up to `seconds`. With a trigger index, polls METAR for its stations every
+    # lock_triggers.poll_seconds and returns early once a new report flips a lock.
+    if triggers is None or not len(triggers) or not cfg.lock_triggers.enabled:
+        _sleep_while_running(seconds)
+        return []
+    # The finished cycle's deadline would shed these reads; waiting has no budget.
+    _attach_deadline(None, metar)
+    end = time.monotonic() + max(0.0, float(seconds))
+    poll_seconds = max(1.0, float(cfg.lock_triggers.poll_seconds))
+    while RUNNING:
+        remaining = end - time.monotonic()
+        if remaining <= poll_seconds:
+            _sleep_while_running(remaining)
+            return []
+        _sleep_while_running(poll_seconds)
+        if not RUNNING:
+            break
+        now_utc = datetime.now(timezone.utc)
+        hits: list[TriggerHit] = []
+        try:
+            for station, records in metar.fetch_metar_bulk(triggers.stations()).items():
+                hits.extend(triggers.observe(station, parse_observations(records), now_utc))
+        except Exception as exc:
+            # Outside the cycle's error handling; a bad poll must not end the run.
+            console.print(f"Lock trigger poll failed; waiting out the interval: {exc}")
+            _sleep_while_running(max(0.0, end - time.monotonic()))
+            return []
+        if hits:
+            return hits
+    return []
+
+
+def _trigger_summary(hits: list[TriggerHit]) -> str:
+    shown = " ".join(
+        f"{h.market_ticker}({h.station} obs={h.observed_max:.1f}F {h.previous_status}->{h.lock_status})" for h in hits[:5]
+    )
+    more = f" +{len(hits) - 5} more" if len(hits) > 5 else ""
+    return f"Lock trigger: starting next cycle early; {shown}{more}"
+
+
+def _cycle_budget_summary(deadline: CycleDeadline | None) -> str | None:
+    if deadline is None:
+        return None
+    stats = deadline.stats()
+    shed = ",".join(f"{kind}:{count}" for kind, count in sorted(stats.shed.items())) or "-"
+    return (
+        "Cycle budget: "
+        f"budget_s={stats.budget_seconds:.0f} "
+        f"elapsed_s={stats.elapsed_seconds:.1f} "
+        f"overrun_s={stats.overrun_seconds:.1f} "
+        f"retries_skipped={stats.retries_skipped} "
+        f"backoffs_shortened={stats.waits_shortened} "
+        f"shed={shed}"
+    )
+
+
+def _build_http_cache(cfg: AppConfig) -> HTTPCache | None:
+    if not cfg.data.honor_cache_headers:
+        return None
+    return HTTPCache(
+        max_entries=cfg.data.cache_max_entries,
+        min_ttl_seconds=cfg.data.http_cache_min_ttl_seconds,
+        max_ttl_seconds=cfg.data.http_cache_max_ttl_seconds,
+    )
+
+
+def _build_metar_client(
+    cfg: AppConfig,
+    host_limiter: HostConcurrencyLimiter | None = None,
+    http_cache: HTTPCache | None = None,
+    rate_governor: RateGovernor | None = None,
+) -> MetarClient:
+    return MetarClient(
         cfg.data.aviationweather_base_url,
         cfg.user_agent,
         cfg.data.cache_ttl_seconds,
         cfg.data.metar_timeout_seconds,
         cfg.data.metar_station_cooldown_seconds,
+        host_limiter=host_limiter,
+        bulk_chunk_size=cfg.data.metar_bulk_chunk_size,
+        cache_max_entries=cfg.data.cache_max_entries,
+        http_cache=http_cache,
+        rate_governor=rate_governor,
+        incremental_hours=cfg.data.metar_incremental_hours if cfg.data.metar_incremental_fetch else None,
     )
-    nws = nws or NWSClient(cfg.data.nws_base_url, cfg.user_agent, cfg.data.cache_ttl_seconds, cfg.data.nws_timeout_seconds)
 
-    cities = load_city_mapping(Path("./configs/cities.yaml"))
-    if not cities:
-        cities = load_city_mapping(Path("./configs/cities.example.yaml"))
 
-    out = []
-    for city_key, city in cities.items():
-        if city.get("lat") is None or city.get("lon") is None or not city.get("tz"):
-            continue
-        if not city.get("icao_station"):
+def _build_geo_store(cfg: AppConfig) -> GeoMetadataStore | None:
+    if not cfg.data.nws_geo_cache_path:
+        return None
+    return GeoMetadataStore(cfg.data.nws_geo_cache_path, cfg.data.nws_geo_cache_ttl_seconds)
+
+
+def _build_nws_client(
+    cfg: AppConfig,
+    host_limiter: HostConcurrencyLimiter | None = None,
+    http_cache: HTTPCache | None = None,
+    rate_governor: RateGovernor | None = None,
+) -> NWSClient:
+    return NWSClient(
+        cfg.data.nws_base_url,
+        cfg.user_agent,
+        cfg.data.cache_ttl_seconds,
+        cfg.data.nws_timeout_seconds,
+        host_limiter=host_limiter,
+        cache_max_entries=cfg.data.cache_max_entries,
+        stale_while_revalidate_seconds=cfg.data.nws_stale_while_revalidate_seconds,
+        geo_store=_build_geo_store(cfg),
+        http_cache=http_cache,
+        rate_governor=rate_governor,
+    )
+
+
+def _open_db(cfg: AppConfig) -> DB:
+    db = DB(cfg.db_path, persistent=cfg.database.persistent_connection, wal=cfg.database.wal)
+    if cfg.database.write_behind:
+        db.start_write_behind(
+            max_queue=cfg.database.write_behind_queue_size,
+            max_batch=cfg.database.write_behind_batch_size,
+            flush_interval_seconds=cfg.database.write_behind_flush_interval_seconds,
+        )
+    return db
+
+
+def _data_cache_summary(*clients: Any) -> str | None:
+    parts: list[str] = []
+    for data_client in clients:
+        if not hasattr(data_client, "cache_stats"):
             continue
+        for name, stats in data_client.cache_stats().items():
+            parts.append(
+                f"{name}(size={stats.size} hits={stats.hits} misses={stats.misses} "
+                f"stale_hits={stats.stale_hits} evictions={stats.evictions} expirations={stats.expirations})"
+            )
+    return ("Data caches: " + " ".join(parts)) if parts else None
 
-        series_tickers = city.get("kalshi_series_tickers") or []
-        for series_ticker in series_tickers:
-            if not _is_high_temp_series(series_ticker):
+
+def _db_writer_summary(db: DB) -> str | None:
+    stats = db.writer_stats()
+    if stats is None:
+        return None
+    return (
+        "DB writer: "
+        f"queue_depth={stats.queue_depth} "
+        f"max_queue_depth={stats.max_queue_depth} "
+        f"rows_written={stats.rows_written} "
+        f"last_flush_ms={stats.last_flush_ms:.1f} "
+        f"avg_flush_ms={stats.avg_flush_ms:.1f} "
+        f"max_flush_ms={stats.max_flush_ms:.1f} "
+        f"backpressure_waits={stats.backpressure_waits} "
+        f"errors={stats.errors}"
+    )
+
+
+def _city_is_scannable(city: dict) -> bool:
+    if city.get("lat") is None or city.get("lon") is None or not city.get("tz"):
+        return False
+    return bool(city.get("icao_station"))
+
+
+def _city_metar_stations(cfg: AppConfig, city: dict) -> list[str]:
+    primary_station = str(city["icao_station"])
+    station_fallbacks = city.get("icao_station_fallbacks") or []
+    if not isinstance(station_fallbacks, list):
+        station_fallbacks = []
+    return [primary_station] + [str(s) for s in station_fallbacks if s][: cfg.data.metar_max_fallbacks]
+
+
+def _ticker_in_series(market_ticker: str, series_tickers: set[str]) -> bool:
+    # Kalshi market tickers start with their series ticker and a dash.
+    return any(market_ticker.startswith(f"{series}-") for series in series_tickers)
+
+
+def _scan_city(
+    cfg: AppConfig,
+    city_key: str,
+    city: dict,
+    *,
+    client: KalshiClient,
+    metar: MetarClient,
+    nws: NWSClient,
+    calibration_lookup=None,
+    deadline: CycleDeadline | None = None,
+    observations: ObservationStore | None = None,
+) -> tuple[list[dict], list[dict]]:
+    snapshots: list[dict] = []
+    out: list[dict] = []
+    weather: CityWeatherContext | None = None
+    series_tickers = city.get("kalshi_series_tickers") or []
+    for series_ticker in series_tickers:
+        if not _is_high_temp_series(series_ticker):
+            continue
+        if deadline is not None and not deadline.allows(Priority.DISCOVERY):
+            deadline.shed("discovery", key=series_ticker)
+            continue
+        markets = client.iter_markets(
+            series_ticker=series_ticker, page_size=cfg.scan.limit_markets, max_items=cfg.scan.max_markets_per_series
+        )
+        # Brackets of one event share a close time, hence one observation window and
+        # one conservative interval; classify each event's ladder in one pass.
+        events: dict[tuple[str, datetime], list[tuple[Market, ParsedMarket, float]]] = {}
+        now_utc = datetime.now(timezone.utc)
+        for m in markets:
+            market = Market.from_api(m)
+            parsed = parse_temperature_market(market)
+            if not parsed:
                 continue
-            markets = client.list_markets(series_ticker=series_ticker, limit=cfg.scan.limit_markets)
-            for m in markets:
-                parsed = parse_temperature_market(m)
-                if not parsed:
-                    continue
-                db.insert_market_snapshot(m)
-                now_utc = datetime.now(timezone.utc)
-                close_ts = parsed.close_ts
-                hours_to_close = (close_ts - now_utc).total_seconds() / 3600
-                if hours_to_close < cfg.risk.min_hours_to_close or hours_to_close > cfg.risk.max_hours_to_close:
-                    continue
-                start_ts = climate_window_start(close_ts, city["tz"])
-                primary_station = str(city["icao_station"])
-                station_fallbacks = city.get("icao_station_fallbacks") or []
-                if not isinstance(station_fallbacks, list):
-                    station_fallbacks = []
-                stations = [primary_station] + [str(s) for s in station_fallbacks if s][: cfg.data.metar_max_fallbacks]
-                metars, used_station, metar_status = metar.fetch_metar_with_fallbacks(stations)
-                obs_max = max_observed_temp_f(metars, start_ts, now_utc)
-                if obs_max is None:
-                    continue
-                periods = nws.hourly_forecast(float(city["lat"]), float(city["lon"]))
-                fc_max = max_forecast_temp_f(periods, now_utc, close_ts) or obs_max
-                lock = evaluate_lock(
-                    parsed.bracket_low,
-                    parsed.bracket_high,
-                    obs_max,
-                    fc_max,
-                    cfg.risk.safety_bias_f,
-                    cfg.risk.lock_yes_probability,
-                    cfg.risk.lock_no_probability,
-                    cfg.risk.station_uncertainty_f,
+            snapshots.append(m)
+            hours_to_close = (parsed.close_ts - now_utc).total_seconds() / 3600
+            if hours_to_close < cfg.risk.min_hours_to_close or hours_to_close > cfg.risk.max_hours_to_close:
+                continue
+            events.setdefault((market.event_ticker, parsed.close_ts), []).append((market, parsed, hours_to_close))
+        for (_event_ticker, close_ts), event_markets in events.items():
+            if weather is None:
+                weather = build_city_weather_context(
+                    metar, nws, city, _city_metar_stations(cfg, city), now_utc, observations=observations
                 )
+            start_ts = climate_window_start(close_ts, city["tz"])
+            obs_max = weather.observed_max(start_ts)
+            if obs_max is None:
+                continue
+            fc_max = weather.forecast_max(now_utc, close_ts) or obs_max
+            ladder = BracketLadder(
+                (i, parsed.bracket_low, parsed.bracket_high) for i, (_market, parsed, _hours) in enumerate(event_markets)
+            )
+            locks = ladder.evaluate(
+                obs_max,
+                fc_max,
+                cfg.risk.safety_bias_f,
+                cfg.risk.lock_yes_probability,
+                cfg.risk.lock_no_probability,
+                cfg.risk.station_uncertainty_f,
+            )
+            for i, (market, parsed, hours_to_close) in enumerate(event_markets):
+                lock = locks[i]
                 rec = {
-                    "market_ticker": m.get("ticker"),
+                    "market_ticker": market.ticker,
                     "city_key": city_key,
                     "observed_max": obs_max,
                     "forecast_max_remaining": fc_max,
@@ -544,16 +918,81 @@ def _scan_once(
                         calibration_lookup=calibration_lookup,
                     ),
                     "reason": "lock-eval",
-                    "metar_station_primary": primary_station,
-                    "metar_station_used": used_station,
-                    "metar_status": metar_status,
-                    "metar_station_candidates_count": len(stations),
-                    "metar_station_list": stations,
+                    "metar_station_primary": weather.stations[0],
+                    "metar_station_used": weather.used_station,
+                    "metar_status": weather.metar_status,
+                    "metar_station_candidates_count": len(weather.stations),
+                    "metar_station_list": weather.stations,
                     "hours_to_close": hours_to_close,
                     "close_ts": close_ts.isoformat(),
+                    "window_start": start_ts.isoformat(),
+                    "bracket_low": parsed.bracket_low,
+                    "bracket_high": parsed.bracket_high,
                 }
-                db.insert_evaluation(rec)
                 out.append(rec)
+    return snapshots, out
+
+
+def _scan_once(
+    cfg: AppConfig,
+    calibration_lookup=None,
+    client: KalshiClient | None = None,
+    metar: MetarClient | None = None,
+    nws: NWSClient | None = None,
+    db: DB | None = None,
+    deadline: CycleDeadline | None = None,
+    observations: ObservationStore | None = None,
+) -> list[dict]:
+    db = db or DB(cfg.db_path)
+    rate_governor = getattr(client, "rate_governor", None)
+    if client is None:
+        rate_governor = _build_rate_governor(cfg)
+        client = KalshiClient(cfg)
+        client.rate_governor = rate_governor
+    host_limiter = HostConcurrencyLimiter(cfg.scan.max_requests_per_host)
+    http_cache = _build_http_cache(cfg)
+    metar = metar or _build_metar_client(cfg, host_limiter, http_cache, rate_governor)
+    nws = nws or _build_nws_client(cfg, host_limiter, http_cache, rate_governor)
+
+    cities = load_city_mapping(Path("./configs/cities.yaml"))
+    if not cities:
+        cities = load_city_mapping(Path("./configs/cities.example.yaml"))
+
+    scannable = [(city_key, city) for city_key, city in cities.items() if _city_is_scannable(city)]
+    if cfg.data.metar_bulk_fetch and hasattr(metar, "fetch_metar_bulk"):
+        # One (chunked) AviationWeather request warms the per-station cache for every city this cycle.
+        metar.fetch_metar_bulk([s for _city_key, city in scannable for s in _city_metar_stations(cfg, city)])
+
+    def _scan(item: tuple[str, dict]) -> tuple[list[dict], list[dict]]:
+        city_key, city = item
+        return _scan_city(
+            cfg,
+            city_key,
+            city,
+            client=client,
+            metar=metar,
+            nws=nws,
+            calibration_lookup=calibration_lookup,
+            deadline=deadline,
+            observations=observations,
+        )
+
+    workers = max(1, min(int(cfg.scan.max_workers), len(scannable)))
+    if workers <= 1:
+        results = [_scan(item) for item in scannable]
+    else:
+        # Executor.map yields in submission order, so the candidate list stays in city-mapping order.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            results = list(pool.map(_scan, scannable))
+
+    snapshots = [m for city_snapshots, _recs in results for m in city_snapshots]
+    out = [rec for _snapshots, recs in results for rec in recs]
+    with db.transaction():
+        if deadline is not None and not deadline.allows(Priority.DISCOVERY):
+            deadline.shed("snapshots", len(snapshots))
+        else:
+            db.insert_market_snapshots(snapshots)
+        db.insert_evaluations(out)
     return out
 
 
@@ -595,22 +1034,22 @@ def sync_settlements(
     cfg = _load_cfg()
     client = KalshiClient(cfg)
     db = DB(cfg.db_path)
-    cursor: str | None = None
-    pages = 0
+    max_items = max_pages * limit
+    seen = 0
     rows_inserted = 0
-    while pages < max_pages:
-        payload = client.get_settlements(limit=limit, cursor=cursor)
-        settlements = payload.get("settlements") or []
-        for settlement in settlements:
-            if isinstance(settlement, dict):
-                db.insert_settlement(settlement)
-                rows_inserted += 1
-        pages += 1
-        next_cursor = payload.get("cursor")
-        cursor = str(next_cursor) if next_cursor else None
-        if not cursor:
-            break
-    console.print(f"Settlements sync complete: pages={pages} rows_inserted={rows_inserted} next_cursor={cursor or ''}")
+    tickers: list[str] = []
+    for settlement in client.iter_settlements(page_size=limit, max_items=max_items):
+        seen += 1
+        if isinstance(settlement, dict):
+            db.insert_settlement(settlement)
+            rows_inserted += 1
+            tickers.append(str(settlement.get("ticker") or settlement.get("market_ticker") or ""))
+    outcomes = record_settlement_outcomes(db, tickers, list(cfg.calibration.buckets_hours_to_close))
+    more = " (stopped at --max-pages; more may remain)" if seen >= max_items else ""
+    console.print(
+        f"Settlements sync complete: pages={-(-seen // limit)} rows_inserted={rows_inserted} "
+        f"calibration_outcomes={outcomes}{more}"
+    )
 
 
 @app.command()
@@ -622,340 +1061,589 @@ def run(
     """Run main loop; defaults to dry-run."""
     cfg = _load_cfg()
     effective_trading = resolve_trading_enabled(enable_trading, cfg.trading_enabled)
-    db = DB(cfg.db_path)
-    client = KalshiClient(cfg)
-    metar = MetarClient(
-        cfg.data.aviationweather_base_url,
-        cfg.user_agent,
-        cfg.data.cache_ttl_seconds,
-        cfg.data.metar_timeout_seconds,
-        cfg.data.metar_station_cooldown_seconds,
-    )
-    nws = NWSClient(cfg.data.nws_base_url, cfg.user_agent, cfg.data.cache_ttl_seconds, cfg.data.nws_timeout_seconds)
-
-    if effective_trading and cfg.env == "production":
-        typed = typer.prompt("Type I_UNDERSTAND_THIS_WILL_TRADE_REAL_MONEY to continue")
-        if typed.strip() != "I_UNDERSTAND_THIS_WILL_TRADE_REAL_MONEY":
-            raise typer.Exit("Confirmation mismatch; aborting.")
-
-    if cap:
-        console.print(f"Using run-time capital cap override: {cap} (config file unchanged).")
-
-    cities = load_city_mapping(Path("./configs/cities.yaml"))
-    if not cities:
-        cities = load_city_mapping(Path("./configs/cities.example.yaml"))
-    total_cities, usable_cities, skipped_cities = _city_mapping_counts(cities)
-    console.print(f"Cities loaded: total={total_cities} usable={usable_cities} skipped={skipped_cities}")
-    console.print("DRY-RUN mode" if not effective_trading else "TRADING ENABLED")
-    session_start_available_cash: float | None = None
-    calibration_lookup = _build_calibration_lookup_if_enabled(cfg)
-    while RUNNING:
-        try:
-            cycle_counts: dict[str, int] = {
-                "entry_unlocked": 0,
-                "entry_outside_exit_window": 0,
-                "orderbook_missing": 0,
-                "spread_too_wide": 0,
-                "liquidity_too_low": 0,
-                "edge_failed": 0,
-                "risk_positions_limit_failed": 0,
-                "risk_orders_per_market_failed": 0,
-                "risk_per_market_notional_failed": 0,
-                "cap_failed": 0,
-                "cash_failed": 0,
-                "entry_submitted": 0,
-                "entry_dry_run": 0,
-                "stale_orders_canceled": 0,
-                "stale_orders_cancel_failed": 0,
-                "aged_orders_canceled": 0,
-                "aged_orders_cancel_failed": 0,
-                "orders_amended": 0,
-                "orders_amend_failed": 0,
-                "exit_considered": 0,
-                "exit_not_eligible": 0,
-                "exit_decision_blocked": 0,
-                "exit_submitted": 0,
-                "exit_dry_run": 0,
-                "duplicate_order_skipped": 0,
-                "ticker_side_guard_skipped": 0,
-            }
-            blocked_examples: dict[str, list[str]] = {
-                "orderbook_missing": [],
-                "edge_failed": [],
-                "spread_too_wide": [],
-                "liquidity_too_low": [],
-            }
-            balance = client.get_balance() if cfg.api_key_id else {"balance": 0}
-            available = _available_dollars(balance)
-            available_cash_dollars = available
-            cap_dollars = _parse_cap_override(cap, available, cfg)
-
-            positions = client.get_positions() if cfg.api_key_id else []
-            open_orders = client.list_orders(status="open") if cfg.api_key_id else []
-            resting_orders: list[dict] = []
-            if cfg.api_key_id:
-                try:
-                    resting_orders = client.list_orders(status="resting")
-                except APIError:
-                    resting_orders = []
-            active_orders_by_id: dict[str, dict] = {}
-            for order in [*open_orders, *resting_orders]:
-                oid = str(order.get("order_id") or order.get("id") or "")
-                if oid:
-                    active_orders_by_id[oid] = order
-                else:
-                    # Fallback key if order id is absent
-                    fallback_key = str(order.get("client_order_id") or f"noid-{len(active_orders_by_id)}")
-                    active_orders_by_id[fallback_key] = order
-            active_orders = list(active_orders_by_id.values())
-            existing_client_order_ids = {
-                str(o.get("client_order_id") or "")
-                for o in active_orders
-                if o.get("client_order_id")
-            }
-            active_entry_orders_by_ticker_side = {
-                (
-                    str(o.get("ticker") or o.get("market_ticker") or ""),
-                    str(o.get("side") or "").lower(),
+    db = _open_db(cfg)
+    try:
+        client = KalshiClient(cfg)
+        # Initial Kalshi budgets come from the account's tier; fetched before the governor is attached.
+        rate_governor = _build_rate_governor(cfg, client)
+        client.rate_governor = rate_governor
+        host_limiter = HostConcurrencyLimiter(cfg.scan.max_requests_per_host)
+        http_cache = _build_http_cache(cfg)
+        metar = _build_metar_client(cfg, host_limiter, http_cache, rate_governor)
+        nws = _build_nws_client(cfg, host_limiter, http_cache, rate_governor)
+        # METAR history per station survives between cycles.
+        observations = ObservationStore(cfg.data.observation_horizon_hours)
+
+        if effective_trading and cfg.env == "production":
+            typed = typer.prompt("Type I_UNDERSTAND_THIS_WILL_TRADE_REAL_MONEY to continue")
+            if typed.strip() != "I_UNDERSTAND_THIS_WILL_TRADE_REAL_MONEY":
+                raise typer.Exit("Confirmation mismatch; aborting.")
+
+        if cap:
+            console.print(f"Using run-time capital cap override: {cap} (config file unchanged).")
+
+        cities = load_city_mapping(Path("./configs/cities.yaml"))
+        if not cities:
+            cities = load_city_mapping(Path("./configs/cities.example.yaml"))
+        total_cities, usable_cities, skipped_cities = _city_mapping_counts(cities)
+        console.print(f"Cities loaded: total={total_cities} usable={usable_cities} skipped={skipped_cities}")
+        console.print("DRY-RUN mode" if not effective_trading else "TRADING ENABLED")
+        session_start_available_cash: float | None = None
+        calibration_lookup = _build_calibration_lookup_if_enabled(cfg)
+        ledger = ShadowLedger(cfg.risk.ledger_reconcile_every_cycles)
+        while RUNNING:
+            # Rebuilt from each cycle's scan; without one the wait is a plain sleep.
+            trigger_index: LockTriggerIndex | None = None
+            deadline = _build_cycle_deadline(cfg, interval_seconds)
+            _attach_deadline(deadline, client, metar, nws)
+            try:
+                cycle_counts: dict[str, int] = {
+                    "entry_unlocked": 0,
+                    "entry_outside_exit_window": 0,
+                    "orderbook_missing": 0,
+                    "spread_too_wide": 0,
+                    "liquidity_too_low": 0,
+                    "edge_failed": 0,
+                    "risk_positions_limit_failed": 0,
+                    "risk_orders_per_market_failed": 0,
+                    "risk_per_market_notional_failed": 0,
+                    "cap_failed": 0,
+                    "cash_failed": 0,
+                    "entry_submitted": 0,
+                    "entry_dry_run": 0,
+                    "stale_orders_canceled": 0,
+                    "stale_orders_cancel_failed": 0,
+                    "aged_orders_canceled": 0,
+                    "aged_orders_cancel_failed": 0,
+                    "orders_amended": 0,
+                    "orders_amend_failed": 0,
+                    "exit_considered": 0,
+                    "exit_not_eligible": 0,
+                    "exit_decision_blocked": 0,
+                    "exit_submitted": 0,
+                    "exit_dry_run": 0,
+                    "duplicate_order_skipped": 0,
+                    "ticker_side_guard_skipped": 0,
+                }
+                blocked_examples: dict[str, list[str]] = {
+                    "orderbook_missing": [],
+                    "edge_failed": [],
+                    "spread_too_wide": [],
+                    "liquidity_too_low": [],
+                }
+                _probe_ledger_fills(cfg, client, ledger)
+                ledger_reconciled = ledger.needs_reconcile()
+                if ledger_reconciled:
+                    _reconcile_ledger(cfg, client, ledger)
+                ledger.start_cycle()
+                available = ledger.available_dollars
+                available_cash_dollars = available
+                cap_dollars = _parse_cap_override(cap, available, cfg)
+
+                positions = ledger.positions()
+                active_orders = ledger.active_orders()
+                existing_client_order_ids = {o.client_order_id for o in active_orders if o.client_order_id}
+                active_entry_orders_by_ticker_side = {(o.ticker, o.side) for o in active_orders if o.action == "buy"}
+                current_exposure = ledger.exposure_dollars()
+                if session_start_available_cash is None:
+                    # Reconstruct a practical baseline so restarts with existing active orders
+                    # do not reset reserved-cap tracking to zero.
+                    session_start_available_cash = available_cash_dollars + current_exposure
+                session_reserved_cash = max(0.0, (session_start_available_cash or 0.0) - available_cash_dollars)
+                effective_exposure_for_cap = max(current_exposure, session_reserved_cash)
+                cash_floor_dollars = max(0.0, (session_start_available_cash or 0.0) - cap_dollars)
+
+                candidates = _scan_once(
+                    cfg,
+                    calibration_lookup=calibration_lookup,
+                    client=client,
+                    metar=metar,
+                    nws=nws,
+                    db=db,
+                    deadline=deadline,
+                    observations=observations,
+                )
+                if cfg.lock_triggers.enabled:
+                    trigger_index = LockTriggerIndex.from_candidates(candidates, cfg.risk)
+                lock_by_ticker = {
+                    str(c.get("market_ticker")): str(c.get("lock_status") or "UNLOCKED")
+                    for c in candidates
+                    if c.get("market_ticker")
+                }
+                candidate_by_ticker = {
+                    str(c.get("market_ticker")): c
+                    for c in candidates
+                    if c.get("market_ticker")
+                }
+                orderbooks = _build_orderbook_cache(cfg, client)
+                locked_yes = sum(1 for c in candidates if c.get("lock_status") == "LOCKED_YES")
+                locked_no = sum(1 for c in candidates if c.get("lock_status") == "LOCKED_NO")
+                console.print(
+                    "Cycle summary: "
+                    f"candidates={len(candidates)} "
+                    f"locked_yes={locked_yes} "
+                    f"locked_no={locked_no} "
+                    f"positions={len(positions)} "
+                    f"open_orders={len(active_orders)} "
+                    f"cash=${available_cash_dollars:.2f} "
+                    f"exposure=${current_exposure:.2f} "
+                    f"reserved=${session_reserved_cash:.2f} "
+                    f"cash_floor=${cash_floor_dollars:.2f} "
+                    f"cap=${cap_dollars:.2f}"
                 )
-                for o in active_orders
-                if str(o.get("action") or "").lower() == "buy"
-            }
-            current_exposure = compute_positions_exposure(positions) + compute_open_orders_exposure(active_orders)
-            if session_start_available_cash is None:
-                # Reconstruct a practical baseline so restarts with existing active orders
-                # do not reset reserved-cap tracking to zero.
-                session_start_available_cash = available_cash_dollars + current_exposure
-            session_reserved_cash = max(0.0, (session_start_available_cash or 0.0) - available_cash_dollars)
-            effective_exposure_for_cap = max(current_exposure, session_reserved_cash)
-            cash_floor_dollars = max(0.0, (session_start_available_cash or 0.0) - cap_dollars)
-
-            candidates = _scan_once(cfg, calibration_lookup=calibration_lookup, client=client, metar=metar, nws=nws)
-            lock_by_ticker = {
-                str(c.get("market_ticker")): str(c.get("lock_status") or "UNLOCKED")
-                for c in candidates
-                if c.get("market_ticker")
-            }
-            candidate_by_ticker = {
-                str(c.get("market_ticker")): c
-                for c in candidates
-                if c.get("market_ticker")
-            }
-            cycle_orderbooks: dict[str, Any] = {}
-            locked_yes = sum(1 for c in candidates if c.get("lock_status") == "LOCKED_YES")
-            locked_no = sum(1 for c in candidates if c.get("lock_status") == "LOCKED_NO")
-            console.print(
-                "Cycle summary: "
-                f"candidates={len(candidates)} "
-                f"locked_yes={locked_yes} "
-                f"locked_no={locked_no} "
-                f"positions={len(positions)} "
-                f"open_orders={len(active_orders)} "
-                f"cash=${available_cash_dollars:.2f} "
-                f"exposure=${current_exposure:.2f} "
-                f"reserved=${session_reserved_cash:.2f} "
-                f"cash_floor=${cash_floor_dollars:.2f} "
-                f"cap=${cap_dollars:.2f}"
-            )
 
-            remaining_active_orders: list[dict] = []
-            for order in active_orders:
-                action = str(order.get("action") or "").lower()
-                ticker = str(order.get("ticker") or order.get("market_ticker") or "")
-                side = str(order.get("side") or "").lower()
-                oid = str(order.get("order_id") or order.get("id") or "")
-                if action != "buy" or not ticker or not side or not oid:
-                    remaining_active_orders.append(order)
-                    continue
-                lock_status = lock_by_ticker.get(ticker)
-                if order_aligned_with_lock(side, lock_status):
-                    remaining_active_orders.append(order)
-                    continue
+                # Series skipped for time were never scanned, so their markets have no
+                # lock status this cycle; their orders are kept rather than read as stale.
+                unscanned_series = deadline.shed_keys("discovery") if deadline is not None else set()
+                remaining_active_orders: list[Order] = []
+                stale_cancels: list[tuple[Order, str, str, str, dict, tuple[str, str]]] = []
+                for order in active_orders:
+                    action, ticker, side, oid = order.action, order.ticker, order.side, order.order_id
+                    if action != "buy" or not ticker or not side or not oid:
+                        remaining_active_orders.append(order)
+                        continue
+                    lock_status = lock_by_ticker.get(ticker)
+                    if order_aligned_with_lock(side, lock_status):
+                        remaining_active_orders.append(order)
+                        continue
+                    if lock_status is None and _ticker_in_series(ticker, unscanned_series):
+                        remaining_active_orders.append(order)
+                        continue
 
-                reason = f"Stale buy order: side={side} lock_status={lock_status or 'MISSING'}"
-                request_json = {"order_id": oid, "ticker": ticker, "reason": reason}
-                client_order_id = str(order.get("client_order_id") or f"cancel-{oid}")
-                ticker_side_key = (ticker, side)
-                if not effective_trading:
-                    console.print(f"[DRY-RUN CANCEL] {request_json}")
-                    db.insert_order(ticker, client_order_id, request_json, {"dry_run": True}, "CANCEL_DRY_RUN")
-                    cycle_counts["stale_orders_canceled"] += 1
-                    existing_client_order_ids.discard(client_order_id)
-                    active_entry_orders_by_ticker_side.discard(ticker_side_key)
-                    continue
-                try:
-                    cancel_resp = client.cancel_order(oid)
+                    reason = f"Stale buy order: side={side} lock_status={lock_status or 'MISSING'}"
+                    request_json = {"order_id": oid, "ticker": ticker, "reason": reason}
+                    client_order_id = order.client_order_id or f"cancel-{oid}"
+                    ticker_side_key = (ticker, side)
+                    if not effective_trading:
+                        console.print(f"[DRY-RUN CANCEL] {request_json}")
+                        db.insert_order(ticker, client_order_id, request_json, {"dry_run": True}, "CANCEL_DRY_RUN")
+                        cycle_counts["stale_orders_canceled"] += 1
+                        existing_client_order_ids.discard(client_order_id)
+                        active_entry_orders_by_ticker_side.discard(ticker_side_key)
+                        continue
+                    stale_cancels.append((order, oid, ticker, client_order_id, request_json, ticker_side_key))
+                for (order, oid, ticker, client_order_id, request_json, ticker_side_key), (cancel_resp, exc) in zip(
+                    stale_cancels, _cancel_orders(client, [item[1] for item in stale_cancels])
+                ):
+                    if exc is not None:
+                        console.print(f"[CANCEL ERROR] ticker={ticker} order_id={oid} error={exc}")
+                        cycle_counts["stale_orders_cancel_failed"] += 1
+                        remaining_active_orders.append(order)
+                        ledger.mark_drift(f"cancel_failed:{oid}")
+                        continue
                     console.print(cancel_resp)
                     db.insert_order(ticker, client_order_id, request_json, cancel_resp, "CANCEL_SUBMITTED")
+                    ledger.apply_cancel(oid, cancel_resp)
                     cycle_counts["stale_orders_canceled"] += 1
                     existing_client_order_ids.discard(client_order_id)
                     active_entry_orders_by_ticker_side.discard(ticker_side_key)
-                except APIError as exc:
-                    console.print(f"[CANCEL ERROR] ticker={ticker} order_id={oid} error={exc}")
-                    cycle_counts["stale_orders_cancel_failed"] += 1
-                    remaining_active_orders.append(order)
-            active_orders = remaining_active_orders
-
-            amend_attempts_this_cycle = 0
-            if cfg.risk.order_maintenance_enabled or cfg.risk.cancel_unfilled_after_minutes is not None:
-                now_utc = datetime.now(timezone.utc)
-                for order in active_orders:
-                    if str(order.get("action") or "").lower() != "buy":
-                        continue
-                    ticker = str(order.get("ticker") or order.get("market_ticker") or "")
-                    side = str(order.get("side") or "").lower()
-                    oid = str(order.get("order_id") or order.get("id") or "")
-                    if not ticker or side not in {"yes", "no"} or not oid:
-                        continue
-                    lock_status = lock_by_ticker.get(ticker)
-                    if not order_aligned_with_lock(side, lock_status):
-                        continue
+                active_orders = remaining_active_orders
+
+                amend_attempts_this_cycle = 0
+                aged_cancels: list[tuple[str, str, str, dict, tuple[str, str]]] = []
+                if cfg.risk.order_maintenance_enabled or cfg.risk.cancel_unfilled_after_minutes is not None:
+                    now_utc = datetime.now(timezone.utc)
+                    for order in active_orders:
+                        if order.action != "buy":
+                            continue
+                        ticker, side, oid = order.ticker, order.side, order.order_id
+                        if not ticker or side not in {"yes", "no"} or not oid:
+                            continue
+                        lock_status = lock_by_ticker.get(ticker)
+                        if not order_aligned_with_lock(side, lock_status):
+                            continue
+
+                        age_seconds = order_age_seconds(order, now_utc)
+                        if cfg.risk.cancel_unfilled_after_minutes is not None and age_seconds >= (cfg.risk.cancel_unfilled_after_minutes * 60):
+                            request_json = {"order_id": oid, "ticker": ticker, "reason": f"Age exceeded {cfg.risk.cancel_unfilled_after_minutes}m"}
+                            client_order_id = order.client_order_id or f"cancel-{oid}"
+                            ticker_side_key = (ticker, side)
+                            if not effective_trading:
+                                console.print(f"[DRY-RUN CANCEL AGE] {request_json}")
+                                db.insert_order(ticker, client_order_id, request_json, {"dry_run": True}, "CANCEL_AGE_DRY_RUN")
+                                cycle_counts["aged_orders_canceled"] += 1
+                                existing_client_order_ids.discard(client_order_id)
+                                active_entry_orders_by_ticker_side.discard(ticker_side_key)
+                                continue
+                            aged_cancels.append((oid, ticker, client_order_id, request_json, ticker_side_key))
+                            continue
 
-                    age_seconds = order_age_seconds(order, now_utc)
-                    if cfg.risk.cancel_unfilled_after_minutes is not None and age_seconds >= (cfg.risk.cancel_unfilled_after_minutes * 60):
-                        request_json = {"order_id": oid, "ticker": ticker, "reason": f"Age exceeded {cfg.risk.cancel_unfilled_after_minutes}m"}
-                        client_order_id = str(order.get("client_order_id") or f"cancel-{oid}")
-                        ticker_side_key = (ticker, side)
+                        if not cfg.risk.order_maintenance_enabled:
+                            continue
+                        if amend_attempts_this_cycle >= cfg.risk.amend_max_per_cycle:
+                            break
+                        c = candidate_by_ticker.get(ticker)
+                        if not c:
+                            continue
+                        if deadline is not None and not deadline.allows(Priority.READ):
+                            deadline.shed("amend_reads")
+                            continue
+                        book = orderbooks.get(ticker, use="maintenance")
+                        target_side = "YES" if side == "yes" else "NO"
+                        max_allowed = int((c["p_yes"] - cfg.risk.edge_buffer) * 100) if target_side == "YES" else int(((1 - c["p_yes"]) - cfg.risk.edge_buffer) * 100)
+                        maker = maker_first_entry_price(target_side, book, max_allowed, cfg.risk)
+                        if not maker.should_place or maker.price_cents is None:
+                            continue
+                        existing_price = order.price_cents
+                        if existing_price is None:
+                            continue
+                        if not should_amend(existing_price, int(maker.price_cents), age_seconds, cfg.risk):
+                            continue
+                        amend_count = int(order.remaining_count) or 1
+                        amend_payload = build_amend_payload(
+                            order_id=oid,
+                            ticker=ticker,
+                            side=target_side,
+                            action=order.action or "buy",
+                            desired_price_cents=int(maker.price_cents),
+                            count=max(1, amend_count),
+                            cfg_price_in_dollars_flag=cfg.risk.send_price_in_dollars,
+                        )
                         if not effective_trading:
-                            console.print(f"[DRY-RUN CANCEL AGE] {request_json}")
-                            db.insert_order(ticker, client_order_id, request_json, {"dry_run": True}, "CANCEL_AGE_DRY_RUN")
-                            cycle_counts["aged_orders_canceled"] += 1
-                            existing_client_order_ids.discard(client_order_id)
-                            active_entry_orders_by_ticker_side.discard(ticker_side_key)
+                            console.print(f"[DRY-RUN AMEND] {amend_payload}")
+                            db.insert_order(ticker, order.client_order_id or f"amend-{oid}", amend_payload, {"dry_run": True}, "AMEND_DRY_RUN")
+                            cycle_counts["orders_amended"] += 1
+                            amend_attempts_this_cycle += 1
                             continue
                         try:
-                            cancel_resp = client.cancel_order(oid)
-                            console.print(cancel_resp)
-                            db.insert_order(ticker, client_order_id, request_json, cancel_resp, "CANCEL_AGE_SUBMITTED")
-                            cycle_counts["aged_orders_canceled"] += 1
-                            existing_client_order_ids.discard(client_order_id)
-                            active_entry_orders_by_ticker_side.discard(ticker_side_key)
-                            continue
+                            amend_resp = client.amend_order(oid, amend_payload)
+                            console.print(amend_resp)
+                            db.insert_order(ticker, order.client_order_id or f"amend-{oid}", amend_payload, amend_resp, "AMENDED")
+                            ledger.apply_amend(oid, amend_payload, amend_resp)
+                            cycle_counts["orders_amended"] += 1
+                            amend_attempts_this_cycle += 1
                         except APIError as exc:
-                            console.print(f"[CANCEL AGE ERROR] ticker={ticker} order_id={oid} error={exc}")
-                            cycle_counts["aged_orders_cancel_failed"] += 1
+                            console.print(f"[AMEND ERROR] ticker={ticker} order_id={oid} error={exc}")
+                            cycle_counts["orders_amend_failed"] += 1
+                            ledger.mark_drift(f"amend_failed:{oid}")
+                for (oid, ticker, client_order_id, request_json, ticker_side_key), (cancel_resp, exc) in zip(
+                    aged_cancels, _cancel_orders(client, [item[0] for item in aged_cancels])
+                ):
+                    if exc is not None:
+                        console.print(f"[CANCEL AGE ERROR] ticker={ticker} order_id={oid} error={exc}")
+                        cycle_counts["aged_orders_cancel_failed"] += 1
+                        ledger.mark_drift(f"cancel_failed:{oid}")
+                        continue
+                    console.print(cancel_resp)
+                    db.insert_order(ticker, client_order_id, request_json, cancel_resp, "CANCEL_AGE_SUBMITTED")
+                    ledger.apply_cancel(oid, cancel_resp)
+                    cycle_counts["aged_orders_canceled"] += 1
+                    existing_client_order_ids.discard(client_order_id)
+                    active_entry_orders_by_ticker_side.discard(ticker_side_key)
+
+                if cfg.risk.strategy_mode == "MAX_CYCLES" and cfg.risk.enable_exit_sells:
+                    for position in positions:
+                        ticker = position.ticker
+                        if not ticker:
+                            cycle_counts["exit_not_eligible"] += 1
+                            continue
+                        cycle_counts["exit_considered"] += 1
+                        candidate = next((c for c in candidates if c.get("market_ticker") == ticker), None)
+                        if not candidate:
+                            cycle_counts["exit_not_eligible"] += 1
+                            continue
+                        if candidate["hours_to_close"] > cfg.risk.max_exit_hours_to_close:
+                            cycle_counts["exit_not_eligible"] += 1
+                            continue
+                        if (candidate["lock_status"] == "LOCKED_YES" and position.side != "YES") or (
+                            candidate["lock_status"] == "LOCKED_NO" and position.side != "NO"
+                        ):
+                            cycle_counts["exit_not_eligible"] += 1
+                            continue
+                        book = orderbooks.get(ticker, use="exit")
+                        exit_decision = select_exit_order(position, book, cfg.risk, cfg.fees)
+                        if not exit_decision.should_trade:
+                            cycle_counts["exit_decision_blocked"] += 1
+                            continue
+                        cycle_key = f"EXIT-{datetime.now(timezone.utc).strftime('%Y%m%d')}"
+                        exit_order = _order_payload(
+                            cfg=cfg,
+                            ticker=ticker,
+                            decision=exit_decision,
+                            count=int(position.contracts) or 1,
+                            tif=cfg.risk.taker_time_in_force,
+                            post_only=False,
+                            strategy_mode=cfg.risk.strategy_mode,
+                            cycle_key=cycle_key,
+                        )
+                        if not effective_trading:
+                            console.print(f"[DRY-RUN EXIT] {exit_order}")
+                            db.insert_order(ticker, exit_order["client_order_id"], exit_order, {"dry_run": True}, "DRY_RUN")
+                            cycle_counts["exit_dry_run"] += 1
                             continue
+                        if exit_order["client_order_id"] in existing_client_order_ids:
+                            cycle_counts["duplicate_order_skipped"] += 1
+                            continue
+                        resp = client.place_order(exit_order)
+                        console.print(resp)
+                        db.insert_order(ticker, exit_order["client_order_id"], exit_order, resp, "SUBMITTED")
+                        ledger.apply_place(exit_order, resp)
+                        existing_client_order_ids.add(str(exit_order["client_order_id"]))
+                        cycle_counts["exit_submitted"] += 1
+
+                if cfg.risk.strategy_mode == "MAX_CYCLES" and (
+                    effective_exposure_for_cap > cap_dollars or available_cash_dollars < cash_floor_dollars
+                ):
+                    console.print("MAX_CYCLES: skipping new entries because current exposure exceeds cap.")
+                    console.print(
+                        "Cycle gates: "
+                        f"entry_unlocked={cycle_counts['entry_unlocked']} "
+                        f"entry_outside_exit_window={cycle_counts['entry_outside_exit_window']} "
+                        f"orderbook_missing={cycle_counts['orderbook_missing']} "
+                        f"spread_too_wide={cycle_counts['spread_too_wide']} "
+                            f"liquidity_too_low={cycle_counts['liquidity_too_low']} "
+                            f"edge_failed={cycle_counts['edge_failed']} "
+                            f"risk_positions_limit_failed={cycle_counts['risk_positions_limit_failed']} "
+                            f"risk_orders_per_market_failed={cycle_counts['risk_orders_per_market_failed']} "
+                            f"risk_per_market_notional_failed={cycle_counts['risk_per_market_notional_failed']} "
+                            f"cap_failed={cycle_counts['cap_failed']} "
+                            f"cash_failed={cycle_counts['cash_failed']} "
+                            f"stale_orders_canceled={cycle_counts['stale_orders_canceled']} "
+                            f"stale_orders_cancel_failed={cycle_counts['stale_orders_cancel_failed']} "
+                            f"aged_orders_canceled={cycle_counts['aged_orders_canceled']} "
+                            f"aged_orders_cancel_failed={cycle_counts['aged_orders_cancel_failed']} "
+                            f"orders_amended={cycle_counts['orders_amended']} "
+                            f"orders_amend_failed={cycle_counts['orders_amend_failed']} "
+                            f"entry_dry_run={cycle_counts['entry_dry_run']} "
+                            f"entry_submitted={cycle_counts['entry_submitted']} "
+                        f"duplicate_order_skipped={cycle_counts['duplicate_order_skipped']} "
+                        f"ticker_side_guard_skipped={cycle_counts['ticker_side_guard_skipped']} "
+                        f"exit_considered={cycle_counts['exit_considered']} "
+                        f"exit_not_eligible={cycle_counts['exit_not_eligible']} "
+                        f"exit_blocked={cycle_counts['exit_decision_blocked']} "
+                        f"exit_dry_run={cycle_counts['exit_dry_run']} "
+                        f"exit_submitted={cycle_counts['exit_submitted']}"
+                    )
+                    console.print(_ledger_summary(ledger, ledger_reconciled))
+                    budget_summary = _cycle_budget_summary(deadline)
+                    if budget_summary:
+                        console.print(budget_summary)
+                    trigger_hits = _wait_for_next_cycle(cfg, int(interval_seconds), metar, trigger_index)
+                    if trigger_hits:
+                        console.print(_trigger_summary(trigger_hits))
+                    continue
 
-                    if not cfg.risk.order_maintenance_enabled:
+                entry_candidates: list[dict] = []
+                entry_books: list[OrderBookTop] = []
+                for c in candidates:
+                    if c["lock_status"] == "UNLOCKED":
+                        cycle_counts["entry_unlocked"] += 1
                         continue
-                    if amend_attempts_this_cycle >= cfg.risk.amend_max_per_cycle:
-                        break
-                    c = candidate_by_ticker.get(ticker)
-                    if not c:
+                    if cfg.risk.strategy_mode == "MAX_CYCLES" and c["hours_to_close"] > cfg.risk.max_exit_hours_to_close:
+                        cycle_counts["entry_outside_exit_window"] += 1
                         continue
-                    if ticker not in cycle_orderbooks:
-                        cycle_orderbooks[ticker] = normalize_orderbook(client.get_orderbook(ticker))
-                    book = cycle_orderbooks[ticker]
-                    target_side = "YES" if side == "yes" else "NO"
-                    max_allowed = int((c["p_yes"] - cfg.risk.edge_buffer) * 100) if target_side == "YES" else int(((1 - c["p_yes"]) - cfg.risk.edge_buffer) * 100)
-                    maker = maker_first_entry_price(target_side, book, max_allowed, cfg.risk)
-                    if not maker.should_place or maker.price_cents is None:
+                    if deadline is not None and not deadline.allows(Priority.READ):
+                        deadline.shed("entry_reads")
                         continue
-                    existing_price = parse_order_price_cents(order)
-                    if existing_price is None:
-                        continue
-                    if not should_amend(existing_price, int(maker.price_cents), age_seconds, cfg.risk):
+                    entry_candidates.append(c)
+                    entry_books.append(orderbooks.get(str(c["market_ticker"]), use="entry"))
+
+                entry_batch = decide_entries(
+                    [c["lock_status"] for c in entry_candidates],
+                    [c["p_yes"] for c in entry_candidates],
+                    entry_books,
+                    [datetime.fromisoformat(c["close_ts"]) for c in entry_candidates],
+                    cfg.risk,
+                    fees_cfg=cfg.fees,
+                )
+                entry_opportunities: list[dict] = []
+                for c, book, decision, priority_key in zip(
+                    entry_candidates, entry_books, entry_batch.decisions, entry_batch.priority_keys
+                ):
+                    if not decision.should_trade:
+                        if decision.reason == "Missing orderbook prices":
+                            cycle_counts["orderbook_missing"] += 1
+                            if len(blocked_examples["orderbook_missing"]) < 5:
+                                blocked_examples["orderbook_missing"].append(str(c["market_ticker"]))
+                        elif decision.reason == "Spread too wide":
+                            cycle_counts["spread_too_wide"] += 1
+                            if len(blocked_examples["spread_too_wide"]) < 5:
+                                blocked_examples["spread_too_wide"].append(str(c["market_ticker"]))
+                        elif decision.reason == "Insufficient liquidity":
+                            cycle_counts["liquidity_too_low"] += 1
+                            if len(blocked_examples["liquidity_too_low"]) < 5:
+                                blocked_examples["liquidity_too_low"].append(str(c["market_ticker"]))
+                        elif decision.reason in {"Price above edge-adjusted threshold", "Net edge below threshold"}:
+                            cycle_counts["edge_failed"] += 1
+                            if len(blocked_examples["edge_failed"]) < 5:
+                                blocked_examples["edge_failed"].append(str(c["market_ticker"]))
                         continue
-                    amend_count = int(order.get("remaining_count") or order.get("count") or 1)
-                    amend_payload = build_amend_payload(
-                        order_id=oid,
-                        ticker=ticker,
-                        side=target_side,
-                        action=str(order.get("action") or "buy"),
-                        desired_price_cents=int(maker.price_cents),
-                        count=max(1, amend_count),
-                        cfg_price_in_dollars_flag=cfg.risk.send_price_in_dollars,
+                    entry_opportunities.append(
+                        {
+                            "candidate": c,
+                            "decision": decision,
+                            "book": book,
+                            "priority_key": priority_key,
+                        }
                     )
-                    if not effective_trading:
-                        console.print(f"[DRY-RUN AMEND] {amend_payload}")
-                        db.insert_order(ticker, str(order.get("client_order_id") or f"amend-{oid}"), amend_payload, {"dry_run": True}, "AMEND_DRY_RUN")
-                        cycle_counts["orders_amended"] += 1
-                        amend_attempts_this_cycle += 1
-                        continue
-                    try:
-                        amend_resp = client.amend_order(oid, amend_payload)
-                        console.print(amend_resp)
-                        db.insert_order(ticker, str(order.get("client_order_id") or f"amend-{oid}"), amend_payload, amend_resp, "AMENDED")
-                        cycle_counts["orders_amended"] += 1
-                        amend_attempts_this_cycle += 1
-                    except APIError as exc:
-                        console.print(f"[AMEND ERROR] ticker={ticker} order_id={oid} error={exc}")
-                        cycle_counts["orders_amend_failed"] += 1
-
-            if cfg.risk.strategy_mode == "MAX_CYCLES" and cfg.risk.enable_exit_sells:
-                for position in positions:
-                    ticker = position.get("ticker") or position.get("market_ticker")
-                    if not ticker:
-                        cycle_counts["exit_not_eligible"] += 1
+
+                planned_entries: list[dict] = []
+                exposure_index = ExposureIndex(positions, active_orders)
+                for entry in sorted(entry_opportunities, key=lambda e: e["priority_key"], reverse=True):
+                    c = entry["candidate"]
+                    decision = entry["decision"]
+                    bankroll_for_sizing = min(available_cash_dollars, cap_dollars)
+                    if cfg.risk.strategy_mode == "MAX_CYCLES":
+                        bankroll_for_sizing = min(bankroll_for_sizing, max(0.0, cap_dollars - effective_exposure_for_cap))
+                    side_prob = c["p_yes"] if decision.side == "YES" else (1 - c["p_yes"])
+                    count = compute_contracts(
+                        bankroll_dollars=bankroll_for_sizing,
+                        price_cents=int(decision.price_cents),
+                        p=float(side_prob),
+                        cfg_sizing=cfg.sizing,
+                        risk=cfg.risk,
+                    )
+                    if count <= 0:
                         continue
-                    cycle_counts["exit_considered"] += 1
-                    candidate = next((c for c in candidates if c.get("market_ticker") == ticker), None)
-                    if not candidate:
-                        cycle_counts["exit_not_eligible"] += 1
+
+                    order_notional = (int(decision.price_cents) * count) / 100.0
+                    total_order_cost_dollars = _entry_total_cost_cents(cfg, int(decision.price_cents), count) / 100.0
+                    risk_ok, risk_reason = check_entry_risk_limits(
+                        ticker=str(c["market_ticker"]),
+                        new_order_notional=order_notional,
+                        positions=positions,
+                        active_orders=active_orders,
+                        risk=cfg.risk,
+                        index=exposure_index,
+                    )
+                    if not risk_ok:
+                        if risk_reason == "Max open positions reached":
+                            cycle_counts["risk_positions_limit_failed"] += 1
+                        elif risk_reason == "Max orders per market reached":
+                            cycle_counts["risk_orders_per_market_failed"] += 1
+                        elif risk_reason == "Max per-market notional exceeded":
+                            cycle_counts["risk_per_market_notional_failed"] += 1
                         continue
-                    if candidate["hours_to_close"] > cfg.risk.max_exit_hours_to_close:
-                        cycle_counts["exit_not_eligible"] += 1
+                    if not enforce_cap(effective_exposure_for_cap, order_notional, cap_dollars):
+                        cycle_counts["cap_failed"] += 1
                         continue
-                    if (candidate["lock_status"] == "LOCKED_YES" and str(position.get("side", "")).upper() != "YES") or (
-                        candidate["lock_status"] == "LOCKED_NO" and str(position.get("side", "")).upper() != "NO"
-                    ):
-                        cycle_counts["exit_not_eligible"] += 1
+                    if (available_cash_dollars - total_order_cost_dollars) < cash_floor_dollars:
+                        cycle_counts["cap_failed"] += 1
                         continue
-                    book = normalize_orderbook(client.get_orderbook(ticker))
-                    exit_decision = select_exit_order(position, book, cfg.risk, cfg.fees)
-                    if not exit_decision.should_trade:
-                        cycle_counts["exit_decision_blocked"] += 1
+                    if available_cash_dollars < total_order_cost_dollars:
+                        cycle_counts["cash_failed"] += 1
                         continue
-                    cycle_key = f"EXIT-{datetime.now(timezone.utc).strftime('%Y%m%d')}"
-                    exit_order = _order_payload(
+
+                    close_key = datetime.fromisoformat(c["close_ts"]).strftime("%Y%m%d")
+                    order = _order_payload(
                         cfg=cfg,
-                        ticker=ticker,
-                        decision=exit_decision,
-                        count=int(position.get("contracts") or position.get("position") or 1),
-                        tif=cfg.risk.taker_time_in_force,
-                        post_only=False,
+                        ticker=c["market_ticker"],
+                        decision=decision,
+                        count=count,
+                        tif=cfg.risk.maker_time_in_force,
+                        post_only=True,
                         strategy_mode=cfg.risk.strategy_mode,
-                        cycle_key=cycle_key,
+                        cycle_key=f"ENTRY-{close_key}",
                     )
                     if not effective_trading:
-                        console.print(f"[DRY-RUN EXIT] {exit_order}")
-                        db.insert_order(ticker, exit_order["client_order_id"], exit_order, {"dry_run": True}, "DRY_RUN")
-                        cycle_counts["exit_dry_run"] += 1
+                        console.print(f"[DRY-RUN] {order}")
+                        db.insert_order(c["market_ticker"], order["client_order_id"], order, {"dry_run": True}, "DRY_RUN")
+                        current_exposure += order_notional
+                        effective_exposure_for_cap += order_notional
+                        available_cash_dollars = max(0.0, available_cash_dollars - total_order_cost_dollars)
+                        cycle_counts["entry_dry_run"] += 1
+                        continue
+                    ticker_side_key = (str(order.get("ticker") or ""), str(order.get("side") or "").lower())
+                    if ticker_side_key in active_entry_orders_by_ticker_side:
+                        cycle_counts["ticker_side_guard_skipped"] += 1
+                        continue
+                    if order["client_order_id"] in existing_client_order_ids:
+                        cycle_counts["duplicate_order_skipped"] += 1
+                        continue
+                    # Reserve up front so later entries in this cycle see the exposure, cash
+                    # and per-market order count of the ones queued before them.
+                    active_order = Order.from_api(
+                        {
+                            "ticker": c["market_ticker"],
+                            "action": "buy",
+                            "side": str(order.get("side") or ""),
+                            "count": count,
+                            "buy_max_cost_dollars": order_notional,
+                        }
+                    )
+                    current_exposure += order_notional
+                    effective_exposure_for_cap += order_notional
+                    available_cash_dollars = max(0.0, available_cash_dollars - total_order_cost_dollars)
+                    existing_client_order_ids.add(str(order["client_order_id"]))
+                    active_entry_orders_by_ticker_side.add(ticker_side_key)
+                    active_orders.append(active_order)
+                    exposure_index.add_order(active_order)
+                    planned_entries.append(
+                        {
+                            "ticker": str(c["market_ticker"]),
+                            "side": str(decision.side),
+                            "order": order,
+                            "ticker_side_key": ticker_side_key,
+                            "order_notional": order_notional,
+                            "total_cost_dollars": total_order_cost_dollars,
+                            "active_order": active_order,
+                        }
+                    )
+
+                entry_error: APIError | None = None
+                submit_pipeline = OrderSubmitPipeline(cfg.risk.max_in_flight_orders)
+                submit_outcomes = _submit_entry_orders(
+                    client, planned_entries, cfg=cfg, orderbooks=orderbooks, pipeline=submit_pipeline
+                )
+                for planned, outcome in zip(planned_entries, submit_outcomes):
+                    order = planned["order"]
+                    resp, exc = outcome.response, outcome.error
+                    if resp is not None:
+                        console.print(f"[ORDER SUBMITTED] ticker={planned['ticker']} latency_ms={outcome.latency_ms:.0f}")
+                        console.print(resp)
+                        db.insert_order(planned["ticker"], order["client_order_id"], order, resp, "SUBMITTED")
+                        ledger.apply_place(
+                            order,
+                            resp,
+                            exposure_dollars=planned["order_notional"],
+                            cost_dollars=planned["total_cost_dollars"],
+                        )
+                        cycle_counts["entry_submitted"] += 1
                         continue
-                    if exit_order["client_order_id"] in existing_client_order_ids:
+                    # Not placed: hand back the reservation.
+                    current_exposure -= planned["order_notional"]
+                    effective_exposure_for_cap -= planned["order_notional"]
+                    available_cash_dollars += planned["total_cost_dollars"]
+                    active_orders.remove(planned["active_order"])
+                    exposure_index.remove_order(planned["active_order"])
+                    if exc is not None and "order_already_exists" in str(exc):
                         cycle_counts["duplicate_order_skipped"] += 1
+                        ledger.mark_drift(f"duplicate:{order['client_order_id']}")
                         continue
-                    resp = client.place_order(exit_order)
-                    console.print(resp)
-                    db.insert_order(ticker, exit_order["client_order_id"], exit_order, resp, "SUBMITTED")
-                    existing_client_order_ids.add(str(exit_order["client_order_id"]))
-                    cycle_counts["exit_submitted"] += 1
-
-            if cfg.risk.strategy_mode == "MAX_CYCLES" and (
-                effective_exposure_for_cap > cap_dollars or available_cash_dollars < cash_floor_dollars
-            ):
-                console.print("MAX_CYCLES: skipping new entries because current exposure exceeds cap.")
+                    existing_client_order_ids.discard(str(order["client_order_id"]))
+                    active_entry_orders_by_ticker_side.discard(planned["ticker_side_key"])
+                    if exc is not None:
+                        console.print(f"[ORDER ERROR] ticker={planned['ticker']} payload={order} error={exc}")
+                        ledger.mark_drift(f"order_error:{planned['ticker']}")
+                        entry_error = entry_error or exc
+                submit_summary = _order_submit_summary(submit_outcomes, submit_pipeline)
+                if submit_summary:
+                    console.print(submit_summary)
+                if entry_error is not None:
+                    # Same outcome as a failed single submit: the cycle ends with an API error,
+                    # after every accepted order above has been recorded.
+                    raise entry_error
                 console.print(
                     "Cycle gates: "
                     f"entry_unlocked={cycle_counts['entry_unlocked']} "
                     f"entry_outside_exit_window={cycle_counts['entry_outside_exit_window']} "
                     f"orderbook_missing={cycle_counts['orderbook_missing']} "
                     f"spread_too_wide={cycle_counts['spread_too_wide']} "
-                        f"liquidity_too_low={cycle_counts['liquidity_too_low']} "
-                        f"edge_failed={cycle_counts['edge_failed']} "
-                        f"risk_positions_limit_failed={cycle_counts['risk_positions_limit_failed']} "
-                        f"risk_orders_per_market_failed={cycle_counts['risk_orders_per_market_failed']} "
-                        f"risk_per_market_notional_failed={cycle_counts['risk_per_market_notional_failed']} "
-                        f"cap_failed={cycle_counts['cap_failed']} "
-                        f"cash_failed={cycle_counts['cash_failed']} "
-                        f"stale_orders_canceled={cycle_counts['stale_orders_canceled']} "
-                        f"stale_orders_cancel_failed={cycle_counts['stale_orders_cancel_failed']} "
-                        f"aged_orders_canceled={cycle_counts['aged_orders_canceled']} "
-                        f"aged_orders_cancel_failed={cycle_counts['aged_orders_cancel_failed']} "
-                        f"orders_amended={cycle_counts['orders_amended']} "
-                        f"orders_amend_failed={cycle_counts['orders_amend_failed']} "
-                        f"entry_dry_run={cycle_counts['entry_dry_run']} "
-                        f"entry_submitted={cycle_counts['entry_submitted']} "
+                    f"liquidity_too_low={cycle_counts['liquidity_too_low']} "
+                    f"edge_failed={cycle_counts['edge_failed']} "
+                    f"risk_positions_limit_failed={cycle_counts['risk_positions_limit_failed']} "
+                    f"risk_orders_per_market_failed={cycle_counts['risk_orders_per_market_failed']} "
+                    f"risk_per_market_notional_failed={cycle_counts['risk_per_market_notional_failed']} "
+                    f"cap_failed={cycle_counts['cap_failed']} "
+                    f"cash_failed={cycle_counts['cash_failed']} "
+                    f"stale_orders_canceled={cycle_counts['stale_orders_canceled']} "
+                    f"stale_orders_cancel_failed={cycle_counts['stale_orders_cancel_failed']} "
+                    f"aged_orders_canceled={cycle_counts['aged_orders_canceled']} "
+                    f"aged_orders_cancel_failed={cycle_counts['aged_orders_cancel_failed']} "
+                    f"orders_amended={cycle_counts['orders_amended']} "
+                    f"orders_amend_failed={cycle_counts['orders_amend_failed']} "
+                    f"entry_dry_run={cycle_counts['entry_dry_run']} "
+                    f"entry_submitted={cycle_counts['entry_submitted']} "
                     f"duplicate_order_skipped={cycle_counts['duplicate_order_skipped']} "
                     f"ticker_side_guard_skipped={cycle_counts['ticker_side_guard_skipped']} "
                     f"exit_considered={cycle_counts['exit_considered']} "
@@ -964,212 +1652,63 @@ def run(
                     f"exit_dry_run={cycle_counts['exit_dry_run']} "
                     f"exit_submitted={cycle_counts['exit_submitted']}"
                 )
-                time.sleep(int(interval_seconds))
-                continue
-
-            entry_opportunities: list[dict] = []
-            for c in candidates:
-                if c["lock_status"] == "UNLOCKED":
-                    cycle_counts["entry_unlocked"] += 1
-                    continue
-                if cfg.risk.strategy_mode == "MAX_CYCLES" and c["hours_to_close"] > cfg.risk.max_exit_hours_to_close:
-                    cycle_counts["entry_outside_exit_window"] += 1
-                    continue
-                ticker_key = str(c["market_ticker"])
-                if ticker_key not in cycle_orderbooks:
-                    cycle_orderbooks[ticker_key] = normalize_orderbook(client.get_orderbook(ticker_key))
-                book = cycle_orderbooks[ticker_key]
-                decision = select_order(c["lock_status"], c["p_yes"], book, cfg.risk, fees_cfg=cfg.fees)
-                if not decision.should_trade:
-                    if decision.reason == "Missing orderbook prices":
-                        cycle_counts["orderbook_missing"] += 1
-                        if len(blocked_examples["orderbook_missing"]) < 5:
-                            blocked_examples["orderbook_missing"].append(str(c["market_ticker"]))
-                    elif decision.reason == "Spread too wide":
-                        cycle_counts["spread_too_wide"] += 1
-                        if len(blocked_examples["spread_too_wide"]) < 5:
-                            blocked_examples["spread_too_wide"].append(str(c["market_ticker"]))
-                    elif decision.reason == "Insufficient liquidity":
-                        cycle_counts["liquidity_too_low"] += 1
-                        if len(blocked_examples["liquidity_too_low"]) < 5:
-                            blocked_examples["liquidity_too_low"].append(str(c["market_ticker"]))
-                    elif decision.reason in {"Price above edge-adjusted threshold", "Net edge below threshold"}:
-                        cycle_counts["edge_failed"] += 1
-                        if len(blocked_examples["edge_failed"]) < 5:
-                            blocked_examples["edge_failed"].append(str(c["market_ticker"]))
-                    continue
-
-                target_side = decision.side
-                max_allowed = int((c["p_yes"] - cfg.risk.edge_buffer) * 100) if target_side == "YES" else int(((1 - c["p_yes"]) - cfg.risk.edge_buffer) * 100)
-                maker = maker_first_entry_price(target_side, book, max_allowed, cfg.risk)
-                if maker.should_place and maker.price_cents is not None:
-                    decision.price_cents = maker.price_cents
-                    confidence = c["p_yes"] if target_side == "YES" else (1 - c["p_yes"])
-                    decision.expected_fee_cents = _entry_fee_total_cents(cfg, int(decision.price_cents), 1)
-                    decision.expected_net_ev_cents = int(round(confidence * 100)) - int(decision.price_cents) - int(decision.expected_fee_cents or 0)
-
-                entry_opportunities.append(
-                    {
-                        "candidate": c,
-                        "decision": decision,
-                        "book": book,
-                        "close_ts": datetime.fromisoformat(c["close_ts"]),
-                    }
-                )
-
-            for entry in sorted(entry_opportunities, key=_entry_priority_key, reverse=True):
-                c = entry["candidate"]
-                decision = entry["decision"]
-                bankroll_for_sizing = min(available_cash_dollars, cap_dollars)
-                if cfg.risk.strategy_mode == "MAX_CYCLES":
-                    bankroll_for_sizing = min(bankroll_for_sizing, max(0.0, cap_dollars - effective_exposure_for_cap))
-                side_prob = c["p_yes"] if decision.side == "YES" else (1 - c["p_yes"])
-                count = compute_contracts(
-                    bankroll_dollars=bankroll_for_sizing,
-                    price_cents=int(decision.price_cents),
-                    p=float(side_prob),
-                    cfg_sizing=cfg.sizing,
-                    risk=cfg.risk,
-                )
-                if count <= 0:
-                    continue
-
-                order_notional = (int(decision.price_cents) * count) / 100.0
-                total_order_cost_dollars = _entry_total_cost_cents(cfg, int(decision.price_cents), count) / 100.0
-                risk_ok, risk_reason = check_entry_risk_limits(
-                    ticker=str(c["market_ticker"]),
-                    new_order_notional=order_notional,
-                    positions=positions,
-                    active_orders=active_orders,
-                    risk=cfg.risk,
-                )
-                if not risk_ok:
-                    if risk_reason == "Max open positions reached":
-                        cycle_counts["risk_positions_limit_failed"] += 1
-                    elif risk_reason == "Max orders per market reached":
-                        cycle_counts["risk_orders_per_market_failed"] += 1
-                    elif risk_reason == "Max per-market notional exceeded":
-                        cycle_counts["risk_per_market_notional_failed"] += 1
-                    continue
-                if not enforce_cap(effective_exposure_for_cap, order_notional, cap_dollars):
-                    cycle_counts["cap_failed"] += 1
-                    continue
-                if (available_cash_dollars - total_order_cost_dollars) < cash_floor_dollars:
-                    cycle_counts["cap_failed"] += 1
-                    continue
-                if available_cash_dollars < total_order_cost_dollars:
-                    cycle_counts["cash_failed"] += 1
-                    continue
-
-                close_key = datetime.fromisoformat(c["close_ts"]).strftime("%Y%m%d")
-                order = _order_payload(
-                    cfg=cfg,
-                    ticker=c["market_ticker"],
-                    decision=decision,
-                    count=count,
-                    tif=cfg.risk.maker_time_in_force,
-                    post_only=True,
-                    strategy_mode=cfg.risk.strategy_mode,
-                    cycle_key=f"ENTRY-{close_key}",
+                blocked_parts = []
+                if blocked_examples["orderbook_missing"]:
+                    blocked_parts.append("orderbook_missing=" + ", ".join(blocked_examples["orderbook_missing"]))
+                if blocked_examples["edge_failed"]:
+                    blocked_parts.append("edge_failed=" + ", ".join(blocked_examples["edge_failed"]))
+                if blocked_examples["spread_too_wide"]:
+                    blocked_parts.append("spread_too_wide=" + ", ".join(blocked_examples["spread_too_wide"]))
+                if blocked_examples["liquidity_too_low"]:
+                    blocked_parts.append("liquidity_too_low=" + ", ".join(blocked_examples["liquidity_too_low"]))
+                if blocked_parts:
+                    console.print("Cycle blocked tickers: " + " | ".join(blocked_parts))
+                book_stats = orderbooks.stats()
+                console.print(
+                    "Orderbook cache: "
+                    f"hits={book_stats.hits} "
+                    f"misses={book_stats.misses} "
+                    f"stale_refreshes={book_stats.stale_refreshes} "
+                    f"single_flight_waits={book_stats.single_flight_waits} "
+                    f"errors={book_stats.errors}"
                 )
-                if not effective_trading:
-                    console.print(f"[DRY-RUN] {order}")
-                    db.insert_order(c["market_ticker"], order["client_order_id"], order, {"dry_run": True}, "DRY_RUN")
-                    current_exposure += order_notional
-                    effective_exposure_for_cap += order_notional
-                    available_cash_dollars = max(0.0, available_cash_dollars - total_order_cost_dollars)
-                    cycle_counts["entry_dry_run"] += 1
-                    continue
-                ticker_side_key = (str(order.get("ticker") or ""), str(order.get("side") or "").lower())
-                if ticker_side_key in active_entry_orders_by_ticker_side:
-                    cycle_counts["ticker_side_guard_skipped"] += 1
-                    continue
-                if order["client_order_id"] in existing_client_order_ids:
-                    cycle_counts["duplicate_order_skipped"] += 1
-                    continue
-                try:
-                    resp = _place_entry_order_with_post_only_cross_fallback(
-                        client,
-                        order,
-                        ticker=str(c["market_ticker"]),
-                        side=str(decision.side),
-                        cfg=cfg,
+                console.print(_ledger_summary(ledger, ledger_reconciled))
+                governor_summary = _rate_governor_summary(rate_governor)
+                if governor_summary:
+                    console.print(governor_summary)
+                cache_summary = _data_cache_summary(metar, nws)
+                if cache_summary:
+                    console.print(cache_summary)
+                if http_cache is not None:
+                    http_stats = http_cache.stats()
+                    console.print(
+                        "HTTP cache: "
+                        f"size={http_stats.size} "
+                        f"fresh_hits={http_stats.fresh_hits} "
+                        f"revalidated_304={http_stats.revalidated} "
+                        f"fetched={http_stats.fetched}"
                     )
-                    if resp is None:
-                        continue
-                except APIError as exc:
-                    if "order_already_exists" in str(exc):
-                        cycle_counts["duplicate_order_skipped"] += 1
-                        existing_client_order_ids.add(str(order["client_order_id"]))
-                        active_entry_orders_by_ticker_side.add(ticker_side_key)
-                        continue
-                    console.print(f"[ORDER ERROR] ticker={c['market_ticker']} payload={order}")
-                    raise
-                console.print(resp)
-                db.insert_order(c["market_ticker"], order["client_order_id"], order, resp, "SUBMITTED")
-                current_exposure += order_notional
-                effective_exposure_for_cap += order_notional
-                available_cash_dollars = max(0.0, available_cash_dollars - total_order_cost_dollars)
-                existing_client_order_ids.add(str(order["client_order_id"]))
-                active_entry_orders_by_ticker_side.add(ticker_side_key)
-                active_orders.append(
-                    {
-                        "ticker": c["market_ticker"],
-                        "action": "buy",
-                        "side": str(order.get("side") or ""),
-                        "count": count,
-                        "buy_max_cost_dollars": order_notional,
-                    }
-                )
-                cycle_counts["entry_submitted"] += 1
-            console.print(
-                "Cycle gates: "
-                f"entry_unlocked={cycle_counts['entry_unlocked']} "
-                f"entry_outside_exit_window={cycle_counts['entry_outside_exit_window']} "
-                f"orderbook_missing={cycle_counts['orderbook_missing']} "
-                f"spread_too_wide={cycle_counts['spread_too_wide']} "
-                f"liquidity_too_low={cycle_counts['liquidity_too_low']} "
-                f"edge_failed={cycle_counts['edge_failed']} "
-                f"risk_positions_limit_failed={cycle_counts['risk_positions_limit_failed']} "
-                f"risk_orders_per_market_failed={cycle_counts['risk_orders_per_market_failed']} "
-                f"risk_per_market_notional_failed={cycle_counts['risk_per_market_notional_failed']} "
-                f"cap_failed={cycle_counts['cap_failed']} "
-                f"cash_failed={cycle_counts['cash_failed']} "
-                f"stale_orders_canceled={cycle_counts['stale_orders_canceled']} "
-                f"stale_orders_cancel_failed={cycle_counts['stale_orders_cancel_failed']} "
-                f"aged_orders_canceled={cycle_counts['aged_orders_canceled']} "
-                f"aged_orders_cancel_failed={cycle_counts['aged_orders_cancel_failed']} "
-                f"orders_amended={cycle_counts['orders_amended']} "
-                f"orders_amend_failed={cycle_counts['orders_amend_failed']} "
-                f"entry_dry_run={cycle_counts['entry_dry_run']} "
-                f"entry_submitted={cycle_counts['entry_submitted']} "
-                f"duplicate_order_skipped={cycle_counts['duplicate_order_skipped']} "
-                f"ticker_side_guard_skipped={cycle_counts['ticker_side_guard_skipped']} "
-                f"exit_considered={cycle_counts['exit_considered']} "
-                f"exit_not_eligible={cycle_counts['exit_not_eligible']} "
-                f"exit_blocked={cycle_counts['exit_decision_blocked']} "
-                f"exit_dry_run={cycle_counts['exit_dry_run']} "
-                f"exit_submitted={cycle_counts['exit_submitted']}"
-            )
-            blocked_parts = []
-            if blocked_examples["orderbook_missing"]:
-                blocked_parts.append("orderbook_missing=" + ", ".join(blocked_examples["orderbook_missing"]))
-            if blocked_examples["edge_failed"]:
-                blocked_parts.append("edge_failed=" + ", ".join(blocked_examples["edge_failed"]))
-            if blocked_examples["spread_too_wide"]:
-                blocked_parts.append("spread_too_wide=" + ", ".join(blocked_examples["spread_too_wide"]))
-            if blocked_examples["liquidity_too_low"]:
-                blocked_parts.append("liquidity_too_low=" + ", ".join(blocked_examples["liquidity_too_low"]))
-            if blocked_parts:
-                console.print("Cycle blocked tickers: " + " | ".join(blocked_parts))
-        except APIError as exc:
-            console.print(f"Run loop API error: {exc}")
-        except Exception as exc:
-            console.print(f"Run loop failed gracefully: {exc}")
-
-        if not RUNNING:
-            break
-        time.sleep(int(interval_seconds))
+                writer_summary = _db_writer_summary(db)
+                if writer_summary:
+                    console.print(writer_summary)
+            except APIError as exc:
+                console.print(f"Run loop API error: {exc}")
+                ledger.mark_drift("cycle_error")
+            except Exception as exc:
+                console.print(f"Run loop failed gracefully: {exc}")
+                ledger.mark_drift("cycle_error")
+            budget_summary = _cycle_budget_summary(deadline)
+            if budget_summary:
+                console.print(budget_summary)
+
+            if not RUNNING:
+                break
+            trigger_hits = _wait_for_next_cycle(cfg, int(interval_seconds), metar, trigger_index)
+            if trigger_hits:
+                console.print(_trigger_summary(trigger_hits))
+    finally:
+        # Drains the write-behind queue; runs however the loop ends.
+        db.close()
 
 
 @app.command()
@@ -1194,10 +1733,9 @@ def cancel_all(confirm: bool = typer.Option(False, "--confirm", help="Required c
         raise typer.Exit("Use --confirm to cancel all open orders.")
     cfg = _load_cfg()
     client = KalshiClient(cfg)
-    for o in client.list_orders(status="open"):
-        oid = o.get("order_id") or o.get("id")
-        if oid:
-            console.print(client.cancel_order(oid))
+    order_ids = [str(oid) for o in client.list_orders(status="open") if (oid := o.get("order_id") or o.get("id"))]
+    for oid, (resp, exc) in zip(order_ids, _cancel_orders(client, order_ids)):
+        console.print(resp if exc is None else f"[CANCEL ERROR] order_id={oid} error={exc}")
 
 
 if __name__ == "__main__":
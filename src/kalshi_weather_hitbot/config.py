@@ -58,6 +58,10 @@ class RiskConfig(BaseModel):
     amend_min_tick: int = 1
     cancel_unfilled_after_minutes: int | None = None
     post_only_cross_retry_once: bool = True
+    exit_orderbook_max_age_seconds: float = 5.0
+    retry_orderbook_max_age_seconds: float = 1.0
+    max_in_flight_orders: int = 4
+    ledger_reconcile_every_cycles: int = 5
     strategy_mode: Literal["HOLD_TO_SETTLEMENT", "MAX_CYCLES"] = "HOLD_TO_SETTLEMENT"
     take_profit_cents: int = 98
     min_profit_cents: int = 1
@@ -70,10 +74,22 @@ class RiskConfig(BaseModel):
 
 class DataConfig(BaseModel):
     cache_ttl_seconds: int = 60
+    cache_max_entries: int = 2048
+    nws_stale_while_revalidate_seconds: int = 120
+    honor_cache_headers: bool = True
+    http_cache_min_ttl_seconds: int = 10
+    http_cache_max_ttl_seconds: int = 3600
     metar_timeout_seconds: int = 15
     metar_station_cooldown_seconds: int = 600
     metar_max_fallbacks: int = 2
+    metar_bulk_fetch: bool = True
+    metar_bulk_chunk_size: int = 25
+    metar_incremental_fetch: bool = True
+    metar_incremental_hours: int = 2
+    observation_horizon_hours: float = 48.0
     nws_timeout_seconds: int = 15
+    nws_geo_cache_path: str = ".cache/nws/geo.sqlite3"
+    nws_geo_cache_ttl_seconds: int = 30 * 86400
     aviationweather_base_url: str = "https://aviationweather.gov"
     nws_base_url: str = "https://api.weather.gov"
     awc_station_cache_url: str = "https://aviationweather.gov/data/cache/stations.cache.json.gz"
@@ -84,6 +100,41 @@ class ScanConfig(BaseModel):
     tags: str = "Weather"
     limit_series: int = 30
     limit_markets: int = 100
+    max_markets_per_series: int | None = None
+    max_workers: int = 4
+    max_requests_per_host: int = 4
+
+
+class RateLimitConfig(BaseModel):
+    enabled: bool = True
+    use_account_limits: bool = True
+    kalshi_read_per_second: float = 20.0
+    kalshi_write_per_second: float = 10.0
+    aviationweather_per_second: float = 1.5
+    nws_per_second: float = 5.0
+    burst_seconds: float = 1.0
+
+
+class CycleBudgetConfig(BaseModel):
+    enabled: bool = True
+    budget_seconds: float | None = None
+    discovery_reserve_fraction: float = 0.5
+    read_reserve_fraction: float = 0.1
+    min_retry_seconds: float = 2.0
+
+
+class LockTriggerConfig(BaseModel):
+    enabled: bool = True
+    poll_seconds: float = 60.0
+
+
+class DatabaseConfig(BaseModel):
+    persistent_connection: bool = True
+    wal: bool = True
+    write_behind: bool = False
+    write_behind_queue_size: int = 10000
+    write_behind_batch_size: int = 500
+    write_behind_flush_interval_seconds: float = 0.25
 
 
 class RuntimeConfig(BaseModel):
@@ -107,6 +158,10 @@ class AppConfig(BaseModel):
     risk: RiskConfig = Field(default_factory=RiskConfig)
     data: DataConfig = Field(default_factory=DataConfig)
     scan: ScanConfig = Field(default_factory=ScanConfig)
+    rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    cycle_budget: CycleBudgetConfig = Field(default_factory=CycleBudgetConfig)
+    lock_triggers: LockTriggerConfig = Field(default_factory=LockTriggerConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
 
 
@@ -1,30 +1,175 @@
 from __future__ import annotations
 
+import logging
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass
 class CacheItem:
     value: Any
     expires_at: float
 
 
+@dataclass
+class CacheStats:
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+
+# Bounded LRU + TTL cache. Expired entries are dropped on access and by a periodic
+# sweep; with stale_seconds > 0, get_or_load serves an expired value for that long
+# while one background refresh replaces it.
 class TTLCache:
-    def __init__(self, ttl_seconds: int = 60) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        max_entries: int = 2048,
+        stale_seconds: float = 0.0,
+        sweep_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, CacheItem] = {}
+        self.max_entries = max(1, int(max_entries))
+        self.stale_seconds = max(0.0, float(stale_seconds))
+        self.sweep_interval_seconds = max(0.0, float(sweep_interval_seconds))
+        self.clock = clock
+        self._cache: OrderedDict[str, CacheItem] = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._stats = CacheStats()
+        self._next_sweep = clock() + self.sweep_interval_seconds
 
     def get(self, key: str) -> Any | None:
-        item = self._cache.get(key)
-        if not item:
-            return None
-        if item.expires_at < time.time():
+        with self._lock:
+            now = self.clock()
+            self._maybe_sweep(now)
+            item = self._cache.get(key)
+            if item is None:
+                self._stats.misses += 1
+                return None
+            if item.expires_at < now:
+                if item.expires_at + self.stale_seconds < now:
+                    self._cache.pop(key, None)
+                    self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._stats.hits += 1
+            return item.value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else max(0.0, float(ttl_seconds))
+        with self._lock:
+            now = self.clock()
+            self._maybe_sweep(now)
+            self._cache[key] = CacheItem(value=value, expires_at=now + ttl)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float | None = None,
+        loader_returns_ttl: bool = False,
+    ) -> Any:
+        # With loader_returns_ttl the loader yields (value, ttl_seconds | None).
+        with self._lock:
+            now = self.clock()
+            item = self._cache.get(key)
+            stale = item is not None and item.expires_at < now <= item.expires_at + self.stale_seconds
+            if stale:
+                self._cache.move_to_end(key)
+                self._stats.stale_hits += 1
+                start_refresh = key not in self._refreshing
+                if start_refresh:
+                    self._refreshing.add(key)
+        if stale:
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh,
+                    args=(key, loader, ttl_seconds, loader_returns_ttl),
+                    name=f"cache-refresh:{key}",
+                    daemon=True,
+                ).start()
+            return item.value
+        value = self.get(key)
+        if value is not None:
+            return value
+        value, ttl = self._load(loader, ttl_seconds, loader_returns_ttl)
+        self.set(key, value, ttl)
+        return value
+
+    @staticmethod
+    def _load(loader: Callable[[], Any], ttl_seconds: float | None, loader_returns_ttl: bool) -> tuple[Any, float | None]:
+        if not loader_returns_ttl:
+            return loader(), ttl_seconds
+        value, loaded_ttl = loader()
+        return value, ttl_seconds if loaded_ttl is None else loaded_ttl
+
+    def _refresh(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float | None,
+        loader_returns_ttl: bool,
+    ) -> None:
+        try:
+            value, ttl_seconds = self._load(loader, ttl_seconds, loader_returns_ttl)
+        except Exception as exc:
+            logger.warning("Background cache refresh failed for key=%s error=%s", key, exc)
+            with self._lock:
+                self._stats.refresh_errors += 1
+        else:
+            self.set(key, value, ttl_seconds)
+            with self._lock:
+                self._stats.refreshes += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def pop(self, key: str) -> None:
+        with self._lock:
             self._cache.pop(key, None)
-            return None
-        return item.value
 
-    def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
-        ttl = self.ttl_seconds if ttl_seconds is None else max(0, int(ttl_seconds))
-        self._cache[key] = CacheItem(value=value, expires_at=time.time() + ttl)
+    def sweep(self) -> int:
+        with self._lock:
+            return self._sweep(self.clock())
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            snapshot = CacheStats(**vars(self._stats))
+            snapshot.size = len(self._cache)
+        return snapshot
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def _maybe_sweep(self, now: float) -> None:
+        if now >= self._next_sweep:
+            self._sweep(now)
+
+    def _sweep(self, now: float) -> int:
+        expired = [k for k, item in self._cache.items() if item.expires_at + self.stale_seconds < now]
+        for k in expired:
+            del self._cache[k]
+        self._stats.expirations += len(expired)
+        self._next_sweep = now + self.sweep_interval_seconds
+        return len(expired)
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 import time
+from contextlib import suppress
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -13,6 +14,7 @@ from typing import Any
 import requests
 import yaml
 
+from kalshi_weather_hitbot.data.geo_store import GeoMetadataStore
 
 logger = logging.getLogger(__name__)
 
@@ -208,14 +210,32 @@ def _load_station_cache(
     return payload if isinstance(payload, list) else []
 
 
-def _resolve_timezone(session: requests.Session, nws_base_url: str, lat: float, lon: float) -> str | None:
+def _resolve_timezone(
+    session: requests.Session,
+    nws_base_url: str,
+    lat: float,
+    lon: float,
+    geo_store: GeoMetadataStore | None = None,
+) -> str | None:
+    if geo_store is not None:
+        point = geo_store.get(lat, lon)
+        if point is not None and point.time_zone:
+            return point.time_zone
     try:
         points_url = f"{nws_base_url.rstrip('/')}/points/{lat},{lon}"
         resp = session.get(points_url, timeout=20)
         resp.raise_for_status()
         data = resp.json()
-        return data.get("properties", {}).get("timeZone")
+        if not isinstance(data, dict):
+            return None
+        properties = data.get("properties")
+        if geo_store is not None:
+            geo_store.put(lat, lon, data)
+        return properties.get("timeZone") if isinstance(properties, dict) else None
     except Exception:
+        if geo_store is not None:
+            with suppress(Exception):
+                geo_store.invalidate(lat, lon)
         return None
 
 
@@ -262,6 +282,7 @@ def build_city_mapping(
     station_cache_path: str = ".cache/awc/stations.cache.json.gz",
     cache_ttl_seconds: int = 60,
     nws_base_url: str = "https://api.weather.gov",
+    geo_store: GeoMetadataStore | None = None,
 ) -> tuple[dict[str, Any], list[str]]:
     session = downloader or requests.Session()
     mapping: dict[str, Any] = {}
@@ -337,7 +358,9 @@ def build_city_mapping(
             current["icao_station"] = resolved.get("icaoId")
             current["lat"] = resolved.get("lat")
             current["lon"] = resolved.get("lon")
-            current["tz"] = _resolve_timezone(session, nws_base_url, float(current["lat"]), float(current["lon"]))
+            current["tz"] = _resolve_timezone(
+                session, nws_base_url, float(current["lat"]), float(current["lon"]), geo_store=geo_store
+            )
             current["needs_manual_override"] = not bool(current.get("tz"))
             if current["needs_manual_override"]:
                 if city_key not in needs_manual_override:
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nws_points (
+  point_key TEXT PRIMARY KEY,
+  forecast_hourly_url TEXT,
+  grid_id TEXT,
+  grid_x INTEGER,
+  grid_y INTEGER,
+  time_zone TEXT,
+  payload TEXT NOT NULL,
+  fetched_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class GeoPoint:
+    forecast_hourly_url: str | None
+    grid_id: str | None
+    grid_x: int | None
+    grid_y: int | None
+    time_zone: str | None
+
+
+def point_key(lat: float, lon: float) -> str:
+    # NWS canonicalizes /points coordinates to 4 decimals.
+    return f"{float(lat):.4f},{float(lon):.4f}"
+
+
+def geo_point_from_payload(payload: dict[str, Any]) -> GeoPoint:
+    props = payload.get("properties") or {}
+    return GeoPoint(
+        forecast_hourly_url=props.get("forecastHourly"),
+        grid_id=props.get("gridId"),
+        grid_x=props.get("gridX"),
+        grid_y=props.get("gridY"),
+        time_zone=props.get("timeZone"),
+    )
+
+
+# On-disk /points metadata (forecast URLs, grid ids, time zones) shared across
+# restarts and between the run loop and bootstrap-cities. Rows already read or
+# written are kept in memory, so repeat lookups each cycle skip sqlite.
+class GeoMetadataStore:
+    def __init__(self, path: str, ttl_seconds: int = 30 * 86400) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = max(0, int(ttl_seconds))
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._memory: dict[str, tuple[GeoPoint, float]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        # The file is created on first use so building a client never touches disk.
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        con = sqlite3.connect(self.path, timeout=5.0)
+        if not self._initialized:
+            con.executescript(SCHEMA)
+            self._initialized = True
+        return con
+
+    def get(self, lat: float, lon: float) -> GeoPoint | None:
+        key = point_key(lat, lon)
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is None:
+                con = self._connect()
+                try:
+                    row = con.execute(
+                        """SELECT forecast_hourly_url, grid_id, grid_x, grid_y, time_zone, fetched_at
+                        FROM nws_points WHERE point_key = ?""",
+                        (key,),
+                    ).fetchone()
+                finally:
+                    con.close()
+                if row is None:
+                    return None
+                cached = self._memory[key] = (GeoPoint(*row[:5]), float(row[5]))
+        point, fetched_at = cached
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        return point
+
+    def put(self, lat: float, lon: float, payload: dict[str, Any]) -> GeoPoint:
+        point = geo_point_from_payload(payload)
+        fetched_at = time.time()
+        with self._lock:
+            self._memory[point_key(lat, lon)] = (point, fetched_at)
+            con = self._connect()
+            try:
+                con.execute(
+                    """INSERT OR REPLACE INTO nws_points(
+                    point_key, forecast_hourly_url, grid_id, grid_x, grid_y, time_zone, payload, fetched_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (
+                        point_key(lat, lon),
+                        point.forecast_hourly_url,
+                        point.grid_id,
+                        point.grid_x,
+                        point.grid_y,
+                        point.time_zone,
+                        json.dumps(payload),
+                        fetched_at,
+                    ),
+                )
+                con.commit()
+            finally:
+                con.close()
+        return point
+
+    def invalidate(self, lat: float, lon: float) -> None:
+        with self._lock:
+            self._memory.pop(point_key(lat, lon), None)
+            con = self._connect()
+            try:
+                con.execute("DELETE FROM nws_points WHERE point_key = ?", (point_key(lat, lon),))
+                con.commit()
+            finally:
+                con.close()
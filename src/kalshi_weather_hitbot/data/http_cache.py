@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*(\d+)", re.IGNORECASE)
+_NO_STORE_RE = re.compile(r"no-store", re.IGNORECASE)
+_NO_CACHE_RE = re.compile(r"no-cache", re.IGNORECASE)
+
+
+def _header(headers: Any, name: str) -> str | None:
+    if not headers:
+        return None
+    value = headers.get(name)
+    if value is None and isinstance(headers, dict):
+        lowered = name.lower()
+        value = next((v for k, v in headers.items() if str(k).lower() == lowered), None)
+    return str(value) if value is not None else None
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def ttl_from_headers(headers: Any, now: float | None = None) -> float | None:
+    cache_control = _header(headers, "Cache-Control") or ""
+    if _NO_STORE_RE.search(cache_control) or _NO_CACHE_RE.search(cache_control):
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return float(match.group(1))
+    expires = _http_date(_header(headers, "Expires"))
+    if expires is None:
+        return None
+    # Expires is relative to the server clock; fall back to ours without a Date header.
+    base = _http_date(_header(headers, "Date"))
+    base = base if base is not None else (time.time() if now is None else now)
+    return max(0.0, expires - base)
+
+
+class CachedResponse:
+    def __init__(self, response: Any) -> None:
+        self._response = response
+        self._json: Any = None
+        self._parsed = False
+        self.status_code = 200 if response.status_code == 304 else response.status_code
+        self.headers = getattr(response, "headers", {}) or {}
+        self.revalidated = False
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def raise_for_status(self) -> None:
+        self._response.raise_for_status()
+
+    def json(self) -> Any:
+        # Parsed once per stored body; 304 refreshes reuse it.
+        if not self._parsed:
+            self._json = self._response.json()
+            self._parsed = True
+        return self._json
+
+
+@dataclass
+class _Entry:
+    response: CachedResponse
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+
+@dataclass
+class HTTPCacheStats:
+    size: int = 0
+    fresh_hits: int = 0
+    revalidated: int = 0
+    fetched: int = 0
+
+
+@dataclass
+class HTTPFetch:
+    response: Any
+    ttl_seconds: float | None
+
+
+# Shared conditional-GET layer for the weather data clients: remembers ETag /
+# Last-Modified per URL+params, revalidates with If-None-Match / If-Modified-Since,
+# and turns a 304 into a refresh of the stored body.
+class HTTPCache:
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        min_ttl_seconds: float = 10.0,
+        max_ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.min_ttl_seconds = max(0.0, float(min_ttl_seconds))
+        self.max_ttl_seconds = max(self.min_ttl_seconds, float(max_ttl_seconds))
+        self.clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = HTTPCacheStats()
+
+    @staticmethod
+    def key_for(url: str, params: dict[str, Any] | None = None) -> str:
+        if not params:
+            return url
+        return url + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+
+    def _clamp(self, ttl: float | None) -> float | None:
+        if ttl is None:
+            return None
+        return min(self.max_ttl_seconds, max(self.min_ttl_seconds, ttl))
+
+    def get(
+        self,
+        session: Any,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        before_request: Callable[[], Any] | None = None,
+    ) -> HTTPFetch:
+        key = self.key_for(url, params)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry.expires_at > now:
+                    self._stats.fresh_hits += 1
+                    return HTTPFetch(entry.response, entry.expires_at - now)
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        kwargs: dict[str, Any] = {"timeout": timeout}
+        if params is not None:
+            kwargs["params"] = params
+        if headers:
+            kwargs["headers"] = headers
+        if before_request is not None:
+            before_request()
+        resp = session.get(url, **kwargs)
+        resp_headers = getattr(resp, "headers", None)
+        cache_control = _header(resp_headers, "Cache-Control") or ""
+        # no-store: never kept. no-cache: kept only as a validator, stale on arrival so
+        # every use revalidates. Neither gets a header TTL for the callers' caches.
+        no_store = bool(_NO_STORE_RE.search(cache_control))
+        no_cache = bool(_NO_CACHE_RE.search(cache_control))
+        ttl = None if no_store or no_cache else self._clamp(ttl_from_headers(resp_headers, now))
+
+        if resp.status_code == 304 and entry is not None:
+            with self._lock:
+                self._stats.revalidated += 1
+                if no_store:
+                    self._entries.pop(key, None)
+                else:
+                    entry.expires_at = now + (ttl or 0.0)
+                    entry.etag = _header(resp_headers, "ETag") or entry.etag
+            entry.response.revalidated = True
+            return HTTPFetch(entry.response, ttl)
+
+        with self._lock:
+            self._stats.fetched += 1
+            if no_store:
+                self._entries.pop(key, None)
+        if resp.status_code != 200 or no_store:
+            return HTTPFetch(resp, None)
+        etag = _header(resp_headers, "ETag")
+        last_modified = _header(resp_headers, "Last-Modified")
+        if not (etag or last_modified or ttl):
+            return HTTPFetch(resp, None)
+        cached = CachedResponse(resp)
+        with self._lock:
+            self._entries[key] = _Entry(cached, etag, last_modified, now + (ttl or 0.0))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return HTTPFetch(cached, ttl)
+
+    def invalidate(self, url: str, params: dict[str, Any] | None = None) -> None:
+        with self._lock:
+            self._entries.pop(self.key_for(url, params), None)
+
+    def stats(self) -> HTTPCacheStats:
+        with self._lock:
+            snapshot = HTTPCacheStats(**vars(self._stats))
+            snapshot.size = len(self._entries)
+        return snapshot
@@ -1,17 +1,34 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
+import math
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import requests
 
-from kalshi_weather_hitbot.data.cache import TTLCache
+from kalshi_weather_hitbot.data.cache import CacheStats, TTLCache
+from kalshi_weather_hitbot.data.http_cache import HTTPCache
+from kalshi_weather_hitbot.utils.concurrency import HostConcurrencyLimiter
+from kalshi_weather_hitbot.utils.deadline import CycleDeadline
+from kalshi_weather_hitbot.utils.rate_governor import Priority, RateGovernor
 
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _StationHistory:
+    # Reports of one (station, hours) window keyed by observation time, newest first in
+    # `records` like AviationWeather returns them.
+    by_time: dict[datetime, dict[str, Any]] = field(default_factory=dict)
+    records: list[dict[str, Any]] = field(default_factory=list)
+    fetched_at: datetime | None = None
+
+
 class MetarClient:
     def __init__(
         self,
@@ -20,40 +37,126 @@ class MetarClient:
         ttl_seconds: int = 60,
         timeout_seconds: int = 15,
         cooldown_seconds: int = 600,
+        host_limiter: HostConcurrencyLimiter | None = None,
+        bulk_chunk_size: int = 25,
+        cache_max_entries: int = 2048,
+        http_cache: HTTPCache | None = None,
+        rate_governor: RateGovernor | None = None,
+        incremental_hours: int | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
-        self.cache = TTLCache(ttl_seconds)
-        self.station_cooldown = TTLCache(cooldown_seconds)
+        self.cache = TTLCache(ttl_seconds, max_entries=cache_max_entries)
+        self.station_cooldown = TTLCache(cooldown_seconds, max_entries=cache_max_entries)
         self._negative_ttl_seconds = min(30, max(5, int(ttl_seconds // 2) if ttl_seconds > 1 else 5))
         self.timeout_seconds = max(1, int(timeout_seconds))
-        self._last_station_status: dict[str, str] = {}
+        # Last fetch outcome per station; only consulted right after a fetch, so it
+        # expires with the cooldown window instead of growing for the process lifetime.
+        self._last_station_status = TTLCache(max(int(ttl_seconds), int(cooldown_seconds)), max_entries=cache_max_entries)
+        self.host_limiter = host_limiter
+        self.http_cache = http_cache
+        self.rate_governor = rate_governor
+        self.deadline: CycleDeadline | None = None
+        self.bulk_chunk_size = max(1, int(bulk_chunk_size))
+        # Incremental mode: after a full backfill, request only the last few hours and
+        # merge them into the kept window; a longer gap since the last good fetch widens
+        # the request to cover it. None always requests the full window.
+        self.incremental_hours = max(1, int(incremental_hours)) if incremental_hours else None
+        self._history: dict[tuple[str, int], _StationHistory] = {}
+        self._history_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
 
+    def _remember_status(self, station: str, status: str, overwrite: bool = True) -> None:
+        if overwrite or self._last_station_status.get(station) is None:
+            self._last_station_status.set(station, status)
+
+    def _timeout(self) -> float:
+        return self.timeout_seconds if self.deadline is None else self.deadline.timeout(self.timeout_seconds)
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        return {
+            "metar": self.cache.stats(),
+            "metar_cooldown": self.station_cooldown.stats(),
+            "metar_status": self._last_station_status.stats(),
+        }
+
+    def _get(self, url: str, params: dict[str, Any]) -> tuple[Any, float | None]:
+        # Returns the response and, when the server sent cache headers, the TTL they allow.
+        throttle = (lambda: self.rate_governor.acquire(url)) if self.rate_governor else None
+        with self.host_limiter.slot(url) if self.host_limiter else nullcontext():
+            if self.http_cache is None:
+                if throttle:
+                    throttle()
+                return self.session.get(url, params=params, timeout=self._timeout()), None
+            fetched = self.http_cache.get(
+                self.session, url, params=params, timeout=self._timeout(), before_request=throttle
+            )
+            return fetched.response, fetched.ttl_seconds
+
+    def _request_hours(self, station: str, hours: int) -> int:
+        if not self.incremental_hours:
+            return hours
+        with self._history_lock:
+            history = self._history.get((station.upper(), hours))
+            fetched_at = history.fetched_at if history else None
+        if fetched_at is None:
+            return hours
+        gap_hours = (datetime.now(timezone.utc) - fetched_at).total_seconds() / 3600
+        return min(hours, max(self.incremental_hours, math.ceil(gap_hours) + 1))
+
+    def _merge_history(self, station: str, hours: int, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Returns the station's window after merging; the same list object while nothing
+        # changed, so downstream consumers can skip re-parsing it.
+        if not self.incremental_hours:
+            return records
+        now = datetime.now(timezone.utc)
+        with self._history_lock:
+            history = self._history.setdefault((station.upper(), hours), _StationHistory())
+            changed = False
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                try:
+                    dt = _parse_obs_time_utc(record.get("obsTime") or record.get("observationTime"))
+                except ValueError:
+                    dt = None
+                if dt is not None and history.by_time.get(dt) != record:
+                    history.by_time[dt] = record
+                    changed = True
+            cutoff = now - timedelta(hours=hours)
+            for dt in [dt for dt in history.by_time if dt < cutoff]:
+                del history.by_time[dt]
+                changed = True
+            history.fetched_at = now
+            if changed:
+                history.records = [history.by_time[dt] for dt in sorted(history.by_time, reverse=True)]
+            return history.records
+
     def fetch_metar(self, station: str, hours: int = 24) -> list[dict[str, Any]]:
         key = f"metar:{station}:{hours}"
         cached = self.cache.get(key)
         if cached is not None:
-            self._last_station_status.setdefault(station, "ok" if cached else "empty")
+            self._remember_status(station, "ok" if cached else "empty", overwrite=False)
             return cached
+        url = f"{self.base_url}/api/data/metar"
         try:
-            resp = self.session.get(
-                f"{self.base_url}/api/data/metar",
-                params={"ids": station, "format": "json", "hours": hours},
-                timeout=self.timeout_seconds,
-            )
+            resp, ttl = self._get(url, {"ids": station, "format": "json", "hours": self._request_hours(station, hours)})
             if resp.status_code == 204:
-                data: list[dict[str, Any]] = []
-                self.cache.set(key, data, ttl_seconds=self._negative_ttl_seconds)
-                self._last_station_status[station] = "empty"
                 logger.debug("AviationWeather METAR returned 204 (no content) for station=%s", station)
+                data: list[dict[str, Any]] = self._merge_history(station, hours, [])
+                if data:
+                    self.cache.set(key, data, ttl_seconds=ttl)
+                    self._remember_status(station, "ok")
+                else:
+                    self.cache.set(key, data, ttl_seconds=self._negative_ttl_seconds)
+                    self._remember_status(station, "empty")
                 return data
             resp.raise_for_status()
         except requests.RequestException as exc:
             logger.warning("AviationWeather METAR request failed for station=%s error=%s", station, exc)
             data: list[dict[str, Any]] = []
             self.cache.set(key, data, ttl_seconds=self._negative_ttl_seconds)
-            self._last_station_status[station] = "error"
+            self._remember_status(station, "error")
             return data
         try:
             data = resp.json()
@@ -67,17 +170,112 @@ class MetarClient:
                 snippet,
             )
             data = []
-        if not isinstance(data, list):
-            logger.warning("AviationWeather METAR returned unexpected payload type for station=%s: %s", station, type(data).__name__)
-            data = []
+        else:
+            if not isinstance(data, list):
+                logger.warning("AviationWeather METAR returned unexpected payload type for station=%s: %s", station, type(data).__name__)
+                data = []
+            else:
+                data = self._merge_history(station, hours, data)
         if data:
-            self.cache.set(key, data)
-            self._last_station_status[station] = "ok"
+            self.cache.set(key, data, ttl_seconds=ttl)
+            self._remember_status(station, "ok")
         else:
             self.cache.set(key, data, ttl_seconds=self._negative_ttl_seconds)
-            self._last_station_status[station] = "empty"
+            self._remember_status(station, "empty")
         return data
 
+    def fetch_metar_bulk(self, stations: list[str], hours: int = 24) -> dict[str, list[dict[str, Any]]]:
+        unique_stations: list[str] = []
+        for station in stations:
+            s = str(station or "").strip()
+            if s and s not in unique_stations:
+                unique_stations.append(s)
+
+        out: dict[str, list[dict[str, Any]]] = {}
+        missing: list[str] = []
+        for station in unique_stations:
+            cached = self.cache.get(f"metar:{station}:{hours}")
+            if cached is not None:
+                self._remember_status(station, "ok" if cached else "empty", overwrite=False)
+                out[station] = cached
+            elif self.station_cooldown.get(station) is None:
+                missing.append(station)
+
+        for i in range(0, len(missing), self.bulk_chunk_size):
+            if self.deadline is not None and not self.deadline.allows(Priority.DISCOVERY):
+                # Warming is optional: stations left out are fetched one by one if still needed.
+                self.deadline.shed("metar_bulk", len(missing) - i)
+                break
+            chunk = missing[i : i + self.bulk_chunk_size]
+            out.update(self._fetch_metar_chunk(chunk, hours))
+        return out
+
+    def _fetch_metar_chunk(self, stations: list[str], hours: int) -> dict[str, list[dict[str, Any]]]:
+        ids = ",".join(stations)
+        url = f"{self.base_url}/api/data/metar"
+        try:
+            request_hours = max(self._request_hours(s, hours) for s in stations)
+            resp, ttl = self._get(url, {"ids": ids, "format": "json", "hours": request_hours})
+            if resp.status_code == 204:
+                logger.debug("AviationWeather METAR returned 204 (no content) for stations=%s", ids)
+                return self._store_chunk(stations, hours, [], status_if_empty="empty", merge=True)
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            logger.warning("AviationWeather METAR bulk request failed for stations=%s error=%s", ids, exc)
+            return self._store_chunk(stations, hours, [], status_if_empty="error")
+        try:
+            data = resp.json()
+        except requests.exceptions.JSONDecodeError:
+            snippet = (resp.text or "")[:200].strip()
+            logger.warning(
+                "AviationWeather METAR returned non-JSON for stations=%s status=%s content-type=%s snippet=%r",
+                ids,
+                resp.status_code,
+                resp.headers.get("Content-Type"),
+                snippet,
+            )
+            return self._store_chunk(stations, hours, [], status_if_empty="empty", ttl_seconds=ttl)
+        if not isinstance(data, list):
+            logger.warning("AviationWeather METAR returned unexpected payload type for stations=%s: %s", ids, type(data).__name__)
+            return self._store_chunk(stations, hours, [], status_if_empty="empty", ttl_seconds=ttl)
+        return self._store_chunk(stations, hours, data, status_if_empty="empty", ttl_seconds=ttl, merge=True)
+
+    def _store_chunk(
+        self,
+        stations: list[str],
+        hours: int,
+        records: list[dict[str, Any]],
+        *,
+        status_if_empty: str,
+        ttl_seconds: float | None = None,
+        merge: bool = False,
+    ) -> dict[str, list[dict[str, Any]]]:
+        by_station: dict[str, list[dict[str, Any]]] = {s.upper(): [] for s in stations}
+        for record in records:
+            if not isinstance(record, dict):
+                continue
+            station_id = str(record.get("icaoId") or "").upper()
+            if not station_id and len(stations) == 1:
+                # Single-station responses are unambiguous even without an icaoId field.
+                station_id = stations[0].upper()
+            if station_id in by_station:
+                by_station[station_id].append(record)
+
+        out: dict[str, list[dict[str, Any]]] = {}
+        for station in stations:
+            data = by_station[station.upper()]
+            if merge:
+                data = self._merge_history(station, hours, data)
+            key = f"metar:{station}:{hours}"
+            if data:
+                self.cache.set(key, data, ttl_seconds=ttl_seconds)
+                self._remember_status(station, "ok")
+            else:
+                self.cache.set(key, data, ttl_seconds=self._negative_ttl_seconds)
+                self._remember_status(station, status_if_empty)
+            out[station] = data
+        return out
+
     def fetch_metar_with_fallbacks(self, stations: list[str], hours: int = 24) -> tuple[list[dict[str, Any]], str | None, str]:
         unique_stations: list[str] = []
         for station in stations:
@@ -124,19 +322,41 @@ def _parse_obs_time_utc(value: object) -> datetime | None:
     return None
 
 
+def _parse_observation(record: Any) -> tuple[datetime, float] | None:
+    # Reports with a malformed time or temperature are skipped, not fatal.
+    if not isinstance(record, dict):
+        return None
+    obs_time = record.get("obsTime") or record.get("observationTime")
+    if not obs_time:
+        return None
+    try:
+        dt = _parse_obs_time_utc(obs_time)
+        tf = parse_temp_f(record)
+    except (ValueError, TypeError, OverflowError, OSError):
+        return None
+    if dt is None or tf is None:
+        return None
+    return dt, tf
+
+
+def parse_observations(records: list[dict[str, Any]]) -> list[tuple[datetime, float]]:
+    out: list[tuple[datetime, float]] = []
+    for r in records:
+        obs = _parse_observation(r)
+        if obs is not None:
+            out.append(obs)
+    out.sort(key=lambda item: item[0])
+    return out
+
+
 def max_observed_temp_f(records: list[dict[str, Any]], start_ts: datetime, end_ts: datetime) -> float | None:
     max_temp = None
     for r in records:
-        obs_time = r.get("obsTime") or r.get("observationTime")
-        if not obs_time:
-            continue
-        dt = _parse_obs_time_utc(obs_time)
-        if dt is None:
+        obs = _parse_observation(r)
+        if obs is None:
             continue
+        dt, tf = obs
         if dt < start_ts or dt > end_ts:
             continue
-        tf = parse_temp_f(r)
-        if tf is None:
-            continue
         max_temp = tf if max_temp is None else max(max_temp, tf)
     return max_temp
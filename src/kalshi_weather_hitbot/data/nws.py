@@ -1,30 +1,68 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from typing import Any
 
 import requests
 
-from kalshi_weather_hitbot.data.cache import TTLCache
+from kalshi_weather_hitbot.data.cache import CacheStats, TTLCache
+from kalshi_weather_hitbot.data.geo_store import GeoMetadataStore
+from kalshi_weather_hitbot.data.http_cache import HTTPCache
+from kalshi_weather_hitbot.utils.concurrency import HostConcurrencyLimiter
+from kalshi_weather_hitbot.utils.deadline import CycleDeadline
+from kalshi_weather_hitbot.utils.rate_governor import RateGovernor
 
 
 logger = logging.getLogger(__name__)
 
 
 class NWSClient:
-    def __init__(self, base_url: str, user_agent: str, ttl_seconds: int = 60, timeout_seconds: int = 15) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        user_agent: str,
+        ttl_seconds: int = 60,
+        timeout_seconds: int = 15,
+        host_limiter: HostConcurrencyLimiter | None = None,
+        cache_max_entries: int = 2048,
+        stale_while_revalidate_seconds: float = 0.0,
+        geo_store: GeoMetadataStore | None = None,
+        http_cache: HTTPCache | None = None,
+        rate_governor: RateGovernor | None = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
-        self.cache = TTLCache(ttl_seconds)
+        self.cache = TTLCache(ttl_seconds, max_entries=cache_max_entries, stale_seconds=stale_while_revalidate_seconds)
         self.timeout_seconds = max(1, int(timeout_seconds))
+        self.host_limiter = host_limiter
+        self.geo_store = geo_store
+        self.http_cache = http_cache
+        self.rate_governor = rate_governor
+        self.deadline: CycleDeadline | None = None
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent, "Accept": "application/geo+json"})
 
+    def _timeout(self) -> float:
+        return self.timeout_seconds if self.deadline is None else self.deadline.timeout(self.timeout_seconds)
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        return {"nws": self.cache.stats()}
+
     def _get_json(self, url: str) -> dict[str, Any]:
-        cached = self.cache.get(url)
-        if cached is not None:
-            return cached
-        resp = self.session.get(url, timeout=self.timeout_seconds)
+        return self.cache.get_or_load(url, lambda: self._fetch_json(url), loader_returns_ttl=True)
+
+    def _fetch_json(self, url: str) -> tuple[dict[str, Any], float | None]:
+        ttl: float | None = None
+        throttle = (lambda: self.rate_governor.acquire(url)) if self.rate_governor else None
+        with self.host_limiter.slot(url) if self.host_limiter else nullcontext():
+            if self.http_cache is None:
+                if throttle:
+                    throttle()
+                resp = self.session.get(url, timeout=self._timeout())
+            else:
+                fetched = self.http_cache.get(self.session, url, timeout=self._timeout(), before_request=throttle)
+                resp, ttl = fetched.response, fetched.ttl_seconds
         resp.raise_for_status()
         try:
             data = resp.json()
@@ -36,14 +74,31 @@ class NWSClient:
             ) from exc
         if not isinstance(data, dict):
             raise RuntimeError(f"NWS returned unexpected payload type for {url}: {type(data).__name__}")
-        self.cache.set(url, data)
-        return data
+        return data, ttl
 
-    def hourly_forecast(self, lat: float, lon: float) -> list[dict[str, Any]]:
-        points_url = f"{self.base_url}/points/{lat},{lon}"
-        points = self._get_json(points_url)
+    def _forecast_hourly_url(self, lat: float, lon: float) -> str:
+        if self.geo_store is not None:
+            point = self.geo_store.get(lat, lon)
+            if point is not None and point.forecast_hourly_url:
+                return point.forecast_hourly_url
+        points = self._get_json(f"{self.base_url}/points/{lat},{lon}")
         forecast_url = points["properties"]["forecastHourly"]
-        payload = self._get_json(forecast_url)
+        if self.geo_store is not None:
+            self.geo_store.put(lat, lon, points)
+        return forecast_url
+
+    def hourly_forecast(self, lat: float, lon: float) -> list[dict[str, Any]]:
+        forecast_url = self._forecast_hourly_url(lat, lon)
+        try:
+            payload = self._get_json(forecast_url)
+        except (requests.RequestException, RuntimeError):
+            # The grid behind a cached points lookup can move; re-resolve next time.
+            if self.geo_store is not None:
+                self.geo_store.invalidate(lat, lon)
+            self.cache.pop(f"{self.base_url}/points/{lat},{lon}")
+            if self.http_cache is not None:
+                self.http_cache.invalidate(forecast_url)
+            raise
         return payload.get("properties", {}).get("periods", [])
 
 
@@ -60,3 +115,17 @@ def max_forecast_temp_f(periods: list[dict[str, Any]], now_utc: datetime, close_
         tf = float(temp) if unit == "F" else (float(temp) * 9 / 5) + 32
         max_temp = tf if max_temp is None else max(max_temp, tf)
     return max_temp
+
+
+def parse_forecast_series(periods: list[dict[str, Any]]) -> list[tuple[datetime, float]]:
+    out: list[tuple[datetime, float]] = []
+    for p in periods:
+        start = datetime.fromisoformat(p["startTime"]).astimezone(timezone.utc)
+        temp = p.get("temperature")
+        unit = p.get("temperatureUnit", "F")
+        if temp is None:
+            continue
+        tf = float(temp) if unit == "F" else (float(temp) * 9 / 5) + 32
+        out.append((start, tf))
+    out.sort(key=lambda item: item[0])
+    return out
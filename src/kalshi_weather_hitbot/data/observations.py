@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any
+
+from kalshi_weather_hitbot.data.metar import _parse_observation
+from kalshi_weather_hitbot.strategy.screener import climate_window_start
+
+
+# Time-sorted observations for one station, deduplicated by observation time, with a
+# running max per local climate day (keyed by climate_window_start of each report).
+# max_between(start, end) for the current day's window is answered from the running
+# max after one bisect; anything else falls back to a scan of the sorted arrays.
+# Reports older than horizon_hours behind the newest one are dropped.
+class StationObservations:
+    def __init__(self, tz: str, horizon_hours: float = 48.0) -> None:
+        self.tz = tz
+        self.horizon = timedelta(hours=max(1.0, float(horizon_hours)))
+        self._times: list[datetime] = []
+        self._temps: list[float] = []
+        self._days: list[datetime] = []
+        self._day_max: dict[datetime, float] = {}
+        self._day_first: dict[datetime, datetime] = {}
+        # Day keys normally never decrease with time; around a DST fall-back they can,
+        # and then a day's reports are no longer one contiguous run.
+        self._days_monotone = True
+        self._last_batch: list[dict[str, Any]] | None = None
+        # Raw obsTime -> (raw temp, parsed time) of every report already ingested, so a
+        # refreshed window only parses reports that are new or corrected.
+        self._seen: dict[Any, tuple[Any, datetime | None]] = {}
+        # Cities sharing a station are scanned on different worker threads.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def ingest(self, records: list[dict[str, Any]]) -> int:
+        with self._lock:
+            # Cached METAR payloads come back as the same list object until refreshed.
+            if records is self._last_batch:
+                return 0
+            self._last_batch = records
+            fresh: list[tuple[datetime, float]] = []
+            for r in records:
+                if not isinstance(r, dict):
+                    continue
+                raw_time = r.get("obsTime") or r.get("observationTime")
+                try:
+                    seen = self._seen.get(raw_time)
+                except TypeError:
+                    continue
+                if seen is not None and seen[0] == r.get("temp"):
+                    continue
+                obs = _parse_observation(r)
+                self._seen[raw_time] = (r.get("temp"), obs[0] if obs else None)
+                if obs is not None:
+                    fresh.append(obs)
+            fresh.sort(key=lambda item: item[0])
+            added = 0
+            for ts, temp_f in fresh:
+                added += self._add(ts, temp_f)
+            self._trim()
+            return added
+
+    def extend(self, observations: list[tuple[datetime, float]]) -> int:
+        with self._lock:
+            added = 0
+            for ts, temp_f in observations:
+                added += self._add(ts, temp_f)
+            self._trim()
+            return added
+
+    def _add(self, ts: datetime, temp_f: float) -> int:
+        if not self._times or ts > self._times[-1]:
+            pos = len(self._times)
+        else:
+            pos = bisect_left(self._times, ts)
+            if pos < len(self._times) and self._times[pos] == ts:
+                if self._temps[pos] != temp_f:
+                    # Corrected report: the day's max may have to come down.
+                    self._temps[pos] = temp_f
+                    self._recompute_day(self._days[pos])
+                return 0
+        day = climate_window_start(ts, self.tz)
+        self._times.insert(pos, ts)
+        self._temps.insert(pos, temp_f)
+        self._days.insert(pos, day)
+        if (pos > 0 and self._days[pos - 1] > day) or (pos + 1 < len(self._days) and self._days[pos + 1] < day):
+            self._days_monotone = False
+        if day not in self._day_max or temp_f > self._day_max[day]:
+            self._day_max[day] = temp_f
+        if day not in self._day_first or ts < self._day_first[day]:
+            self._day_first[day] = ts
+        return 1
+
+    def _recompute_day(self, day: datetime) -> None:
+        temps = [tf for d, tf in zip(self._days, self._temps) if d == day]
+        times = [ts for d, ts in zip(self._days, self._times) if d == day]
+        if temps:
+            self._day_max[day] = max(temps)
+            self._day_first[day] = min(times)
+        else:
+            self._day_max.pop(day, None)
+            self._day_first.pop(day, None)
+
+    def _trim(self) -> None:
+        if not self._times:
+            return
+        cutoff = self._times[-1] - self.horizon
+        drop = bisect_left(self._times, cutoff)
+        if drop == 0:
+            return
+        self._seen = {k: v for k, v in self._seen.items() if v[1] is not None and v[1] >= cutoff}
+        partial = self._days[drop] if drop < len(self._days) else None
+        dropped_days = set(self._days[:drop])
+        del self._times[:drop], self._temps[:drop], self._days[:drop]
+        for day in dropped_days:
+            self._day_max.pop(day, None)
+            self._day_first.pop(day, None)
+        if partial in dropped_days:
+            self._recompute_day(partial)
+        self._days_monotone = all(a <= b for a, b in zip(self._days, self._days[1:]))
+
+    def max_between(self, start_ts: datetime, end_ts: datetime) -> float | None:
+        with self._lock:
+            return self._max_between(start_ts, end_ts)
+
+    def _max_between(self, start_ts: datetime, end_ts: datetime) -> float | None:
+        if not self._times:
+            return None
+        if self._days_monotone and self._days[-1] == start_ts and end_ts >= self._times[-1]:
+            # Latest report belongs to the window's own day; valid if nothing between
+            # start_ts and that day's first report belongs to another day.
+            lo = bisect_left(self._times, start_ts)
+            if self._times[lo] == self._day_first[start_ts]:
+                return self._day_max[start_ts]
+        lo = bisect_left(self._times, start_ts)
+        hi = bisect_right(self._times, end_ts)
+        return max(self._temps[lo:hi]) if hi > lo else None
+
+
+class ObservationStore:
+    def __init__(self, horizon_hours: float = 48.0) -> None:
+        self.horizon_hours = horizon_hours
+        self._stations: dict[str, StationObservations] = {}
+        self._lock = threading.Lock()
+
+    def station(self, station: str, tz: str) -> StationObservations:
+        # The first city to register a station fixes its climate-day time zone; queries
+        # in another zone still get exact answers through the scan path.
+        key = str(station).upper()
+        with self._lock:
+            if key not in self._stations:
+                self._stations[key] = StationObservations(tz, self.horizon_hours)
+            return self._stations[key]
+
+    def __len__(self) -> int:
+        return len(self._stations)
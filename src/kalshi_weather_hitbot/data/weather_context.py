@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from kalshi_weather_hitbot.data.metar import parse_observations
+from kalshi_weather_hitbot.data.nws import parse_forecast_series
+from kalshi_weather_hitbot.data.observations import ObservationStore, StationObservations
+
+
+class CityWeatherContext:
+    def __init__(
+        self,
+        *,
+        stations: list[str],
+        records: list[dict[str, Any]],
+        used_station: str | None,
+        metar_status: str,
+        now_utc: datetime,
+        forecast_loader: Callable[[], list[dict[str, Any]]],
+        history: StationObservations | None = None,
+    ) -> None:
+        self.stations = stations
+        self.used_station = used_station
+        self.metar_status = metar_status
+        self.now_utc = now_utc
+        # With a station history the records are already merged into it.
+        self._history = history
+        observations = parse_observations(records) if history is None else []
+        self._obs_times = [dt for dt, _ in observations]
+        self._obs_temps = [tf for _, tf in observations]
+        self._obs_max_by_start: dict[datetime, float | None] = {}
+        # Loaded on first use so cities without usable observations never hit NWS.
+        self._forecast_loader = forecast_loader
+        self._fc_times: list[datetime] | None = None
+        self._fc_temps: list[float] = []
+
+    def observed_max(self, start_ts: datetime) -> float | None:
+        if start_ts not in self._obs_max_by_start and self._history is not None:
+            self._obs_max_by_start[start_ts] = self._history.max_between(start_ts, self.now_utc)
+        elif start_ts not in self._obs_max_by_start:
+            lo = bisect_left(self._obs_times, start_ts)
+            hi = bisect_right(self._obs_times, self.now_utc)
+            self._obs_max_by_start[start_ts] = max(self._obs_temps[lo:hi]) if hi > lo else None
+        return self._obs_max_by_start[start_ts]
+
+    def forecast_max(self, now_utc: datetime, close_ts: datetime) -> float | None:
+        if self._fc_times is None:
+            series = parse_forecast_series(self._forecast_loader())
+            self._fc_times = [dt for dt, _ in series]
+            self._fc_temps = [tf for _, tf in series]
+        lo = bisect_left(self._fc_times, now_utc)
+        hi = bisect_right(self._fc_times, close_ts)
+        return max(self._fc_temps[lo:hi]) if hi > lo else None
+
+
+def build_city_weather_context(
+    metar,
+    nws,
+    city: dict[str, Any],
+    stations: list[str],
+    now_utc: datetime,
+    observations: ObservationStore | None = None,
+) -> CityWeatherContext:
+    records, used_station, metar_status = metar.fetch_metar_with_fallbacks(stations)
+    history = None
+    if observations is not None and used_station:
+        history = observations.station(used_station, city["tz"])
+        history.ingest(records)
+    lat, lon = float(city["lat"]), float(city["lon"])
+    return CityWeatherContext(
+        stations=stations,
+        records=records,
+        used_station=used_station,
+        metar_status=metar_status,
+        now_utc=now_utc,
+        forecast_loader=lambda: nws.hourly_forecast(lat, lon),
+        history=history,
+    )
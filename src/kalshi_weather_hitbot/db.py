@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import json
+import logging
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Callable
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from kalshi_weather_hitbot.kalshi.models import order_price_cents
+
+logger = logging.getLogger(__name__)
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS run_evaluations (
@@ -69,70 +78,495 @@ CREATE TABLE IF NOT EXISTS settlements (
 """
 
 
+PERSISTENT_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _lower_or_none(value: Any) -> str | None:
+    text = str(value or "").strip().lower()
+    return text or None
+
+
+def _float_or_none(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _order_count(request: dict[str, Any]) -> int | None:
+    for key in ("count", "count_fp"):
+        value = _float_or_none(request.get(key))
+        if value is not None:
+            return int(value)
+    return None
+
+
+def _order_columns(request: dict[str, Any]) -> tuple:
+    try:
+        price_cents = order_price_cents(request)
+    except (TypeError, ValueError):
+        price_cents = None
+    return (
+        _lower_or_none(request.get("side")),
+        _lower_or_none(request.get("action")),
+        price_cents,
+        _order_count(request),
+    )
+
+
+def _add_column(con: sqlite3.Connection, table: str, column: str, decl: str) -> None:
+    existing = {row[1] for row in con.execute(f"PRAGMA table_info({table})")}
+    if column not in existing:
+        con.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _backfill(con: sqlite3.Connection, select_sql: str, update_sql: str, to_params, batch_size: int = 1000) -> None:
+    cursor = con.execute(select_sql)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        params = []
+        for row_id, raw in rows:
+            try:
+                payload = json.loads(raw) if raw else {}
+            except json.JSONDecodeError:
+                payload = {}
+            if not isinstance(payload, dict):
+                payload = {}
+            params.append((*to_params(payload), row_id))
+        # Separate cursor so the SELECT above keeps streaming.
+        con.cursor().executemany(update_sql, params)
+
+
+def _migrate_v1_promoted_columns(con: sqlite3.Connection) -> None:
+    for column, decl in (("side", "TEXT"), ("action", "TEXT"), ("price_cents", "INTEGER"), ("count", "INTEGER")):
+        _add_column(con, "orders", column, decl)
+    _add_column(con, "run_evaluations", "hours_to_close", "REAL")
+    _backfill(
+        con,
+        "SELECT id, request_json FROM orders",
+        "UPDATE orders SET side = ?, action = ?, price_cents = ?, count = ? WHERE id = ?",
+        _order_columns,
+    )
+    _backfill(
+        con,
+        "SELECT id, raw_payload FROM run_evaluations",
+        "UPDATE run_evaluations SET hours_to_close = ? WHERE id = ?",
+        lambda payload: (_float_or_none(payload.get("hours_to_close")),),
+    )
+    con.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_orders_ticker_id ON orders(market_ticker, id);
+        CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+        CREATE INDEX IF NOT EXISTS idx_orders_ts ON orders(ts);
+        CREATE INDEX IF NOT EXISTS idx_run_evaluations_ticker_id ON run_evaluations(market_ticker, id);
+        CREATE INDEX IF NOT EXISTS idx_run_evaluations_ts ON run_evaluations(ts);
+        CREATE INDEX IF NOT EXISTS idx_market_snapshots_ticker_id ON market_snapshots(market_ticker, id);
+        CREATE INDEX IF NOT EXISTS idx_market_snapshots_ts ON market_snapshots(ts);
+        """
+    )
+
+
+def _migrate_v2_calibration_store(con: sqlite3.Connection) -> None:
+    # Seeded lazily by strategy.calibration; counts are keyed by the configured buckets.
+    con.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS calibration_outcomes (
+          ticker TEXT PRIMARY KEY,
+          city_key TEXT NOT NULL,
+          hours_to_close REAL NOT NULL,
+          won INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS calibration_counts (
+          city_key TEXT NOT NULL,
+          bucket REAL NOT NULL,
+          wins INTEGER NOT NULL DEFAULT 0,
+          losses INTEGER NOT NULL DEFAULT 0,
+          PRIMARY KEY (city_key, bucket)
+        );
+        CREATE TABLE IF NOT EXISTS calibration_meta (
+          key TEXT PRIMARY KEY,
+          value TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_settlements_ticker_id ON settlements(ticker, id);
+        """
+    )
+
+
+# SCHEMA is version 0; each migration runs once, tracked in PRAGMA user_version.
+MIGRATIONS: list[tuple[int, Callable[[sqlite3.Connection], None]]] = [
+    (1, _migrate_v1_promoted_columns),
+    (2, _migrate_v2_calibration_store),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def migrate(con: sqlite3.Connection) -> int:
+    version = int(con.execute("PRAGMA user_version").fetchone()[0])
+    for target, step in MIGRATIONS:
+        if target <= version:
+            continue
+        step(con)
+        con.execute(f"PRAGMA user_version = {int(target)}")
+        con.commit()
+        logger.info("Migrated database to schema version %s", target)
+        version = target
+    return version
+
+
+def _market_snapshot_row(ts: str, market: dict[str, Any]) -> tuple:
+    return (
+        ts,
+        market.get("ticker"),
+        market.get("title"),
+        market.get("subtitle"),
+        market.get("rules_primary") or market.get("rules"),
+        json.dumps(market),
+    )
+
+
+def _evaluation_row(ts: str, payload: dict[str, Any]) -> tuple:
+    return (
+        ts,
+        payload.get("market_ticker"),
+        payload.get("city_key"),
+        payload.get("observed_max"),
+        payload.get("forecast_max_remaining"),
+        payload.get("min_possible"),
+        payload.get("max_possible"),
+        payload.get("lock_status"),
+        payload.get("p_yes"),
+        payload.get("chosen_side"),
+        payload.get("chosen_price_cents"),
+        payload.get("reason"),
+        json.dumps(payload),
+        _float_or_none(payload.get("hours_to_close")),
+    )
+
+
+def _order_row(
+    ts: str,
+    market_ticker: str,
+    client_order_id: str,
+    request_json: dict[str, Any],
+    response_json: dict[str, Any],
+    status: str,
+) -> tuple:
+    return (
+        ts,
+        market_ticker,
+        client_order_id,
+        json.dumps(request_json),
+        json.dumps(response_json),
+        status,
+        *_order_columns(request_json),
+    )
+
+
+INSERT_MARKET_SNAPSHOT_SQL = (
+    "INSERT INTO market_snapshots(ts, market_ticker, title, subtitle, rules_primary, payload) VALUES (?, ?, ?, ?, ?, ?)"
+)
+INSERT_EVALUATION_SQL = """INSERT INTO run_evaluations(
+                ts, market_ticker, city_key, observed_max, forecast_max_remaining,
+                min_possible, max_possible, lock_status, p_yes, chosen_side,
+                chosen_price_cents, reason, raw_payload, hours_to_close
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+INSERT_ORDER_SQL = """INSERT INTO orders(
+                ts, market_ticker, client_order_id, request_json, response_json, status,
+                side, action, price_cents, count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+@dataclass
+class WriterStats:
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    rows_written: int = 0
+    flushes: int = 0
+    last_flush_ms: float = 0.0
+    max_flush_ms: float = 0.0
+    total_flush_ms: float = 0.0
+    backpressure_waits: int = 0
+    errors: int = 0
+
+    @property
+    def avg_flush_ms(self) -> float:
+        return self.total_flush_ms / self.flushes if self.flushes else 0.0
+
+
+_STOP = object()
+
+
+class WriteBehindWriter:
+    def __init__(
+        self,
+        db: "DB",
+        max_queue: int = 10000,
+        max_batch: int = 500,
+        flush_interval_seconds: float = 0.25,
+    ) -> None:
+        self.db = db
+        self.max_batch = max(1, int(max_batch))
+        self.flush_interval_seconds = max(0.01, float(flush_interval_seconds))
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._stats = WriterStats()
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, row: tuple, durable: bool = False) -> None:
+        with self._cond:
+            self._pending += 1
+        item = (sql, row, durable)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # Backpressure: the caller waits for the writer only when the queue is saturated.
+            with self._cond:
+                self._stats.backpressure_waits += 1
+            self._queue.put(item)
+        depth = self._queue.qsize()
+        with self._cond:
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, depth)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        if not self._thread.is_alive():
+            return
+        self.flush(timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> WriterStats:
+        with self._cond:
+            snapshot = WriterStats(**vars(self._stats))
+        snapshot.queue_depth = self._queue.qsize()
+        return snapshot
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval_seconds)
+            except queue.Empty:
+                continue
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _STOP:
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._write_batch(batch)
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[tuple[str, tuple, bool]]) -> None:
+        started = time.perf_counter()
+        ok = True
+        try:
+            # Consecutive rows for the same statement go through one executemany.
+            groups: list[tuple[str, list[tuple]]] = []
+            for sql, row, _durable in batch:
+                if groups and groups[-1][0] == sql:
+                    groups[-1][1].append(row)
+                else:
+                    groups.append((sql, [row]))
+            self.db._write_groups(groups, durable=any(durable for _sql, _row, durable in batch))
+        except Exception as exc:
+            ok = False
+            logger.exception("DB write-behind batch of %s rows failed: %s", len(batch), exc)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._cond:
+            if ok:
+                self._stats.rows_written += len(batch)
+            else:
+                self._stats.errors += 1
+            self._stats.flushes += 1
+            self._stats.last_flush_ms = elapsed_ms
+            self._stats.max_flush_ms = max(self._stats.max_flush_ms, elapsed_ms)
+            self._stats.total_flush_ms += elapsed_ms
+            self._pending -= len(batch)
+            self._cond.notify_all()
+
+
 class DB:
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, persistent: bool = False, wal: bool = True) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.persistent = persistent
+        self.wal = wal
+        self._lock = threading.RLock()
+        self._con: sqlite3.Connection | None = None
+        self._batch_depth = 0
+        self._writer: WriteBehindWriter | None = None
         with self.connect() as con:
             con.executescript(SCHEMA)
+            migrate(con)
+
+    def _shared_connection(self) -> sqlite3.Connection:
+        if self._con is None:
+            con = sqlite3.connect(self.db_path, check_same_thread=False)
+            if self.persistent:
+                if self.wal:
+                    con.execute("PRAGMA journal_mode=WAL")
+                for pragma in PERSISTENT_PRAGMAS:
+                    con.execute(pragma)
+            self._con = con
+        return self._con
 
     @contextmanager
     def connect(self):
-        con = sqlite3.connect(self.db_path)
-        try:
-            yield con
-            con.commit()
-        finally:
-            con.close()
+        if not self.persistent and self._con is None:
+            con = sqlite3.connect(self.db_path)
+            try:
+                yield con
+                con.commit()
+            finally:
+                con.close()
+            return
+        with self._lock:
+            con = self._shared_connection()
+            try:
+                yield con
+            except Exception:
+                if self._batch_depth == 0:
+                    con.rollback()
+                raise
+            if self._batch_depth == 0:
+                con.commit()
+
+    @contextmanager
+    def transaction(self):
+        # Groups every write made inside the block into a single commit. Without a
+        # persistent connection a temporary one is held open for the block.
+        with self._lock:
+            opened_here = self._con is None
+            con = self._shared_connection()
+            self._batch_depth += 1
+            try:
+                yield con
+            except Exception:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    con.rollback()
+                raise
+            else:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    con.commit()
+            finally:
+                if opened_here and not self.persistent and self._batch_depth == 0:
+                    con.close()
+                    self._con = None
+
+    def start_write_behind(
+        self,
+        max_queue: int = 10000,
+        max_batch: int = 500,
+        flush_interval_seconds: float = 0.25,
+    ) -> WriteBehindWriter:
+        if self._writer is None:
+            self._writer = WriteBehindWriter(
+                self,
+                max_queue=max_queue,
+                max_batch=max_batch,
+                flush_interval_seconds=flush_interval_seconds,
+            )
+        return self._writer
+
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def writer_stats(self) -> WriterStats | None:
+        return self._writer.stats() if self._writer is not None else None
+
+    def _write_groups(self, groups: list[tuple[str, list[tuple]]], durable: bool = False) -> None:
+        with self.connect() as con:
+            # Order records are fsynced on their own commit even when the shared
+            # connection runs with synchronous=NORMAL.
+            full_sync = durable and self.persistent and self._batch_depth == 0
+            if full_sync:
+                con.execute("PRAGMA synchronous=FULL")
+            for sql, rows in groups:
+                if len(rows) == 1:
+                    con.execute(sql, rows[0])
+                else:
+                    con.executemany(sql, rows)
+            if full_sync:
+                con.commit()
+                con.execute("PRAGMA synchronous=NORMAL")
+
+    def _write(self, sql: str, rows: list[tuple], durable: bool = False) -> None:
+        if not rows:
+            return
+        if self._writer is not None:
+            for row in rows:
+                self._writer.submit(sql, row, durable)
+            return
+        self._write_groups([(sql, rows)], durable=durable)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        with self._lock:
+            if self._con is not None:
+                self._con.commit()
+                self._con.close()
+                self._con = None
 
     def _ts(self) -> str:
         return datetime.now(timezone.utc).isoformat()
 
     def insert_market_snapshot(self, market: dict[str, Any]) -> None:
-        with self.connect() as con:
-            con.execute(
-                "INSERT INTO market_snapshots(ts, market_ticker, title, subtitle, rules_primary, payload) VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    self._ts(),
-                    market.get("ticker"),
-                    market.get("title"),
-                    market.get("subtitle"),
-                    market.get("rules_primary") or market.get("rules"),
-                    json.dumps(market),
-                ),
-            )
+        self._write(INSERT_MARKET_SNAPSHOT_SQL, [_market_snapshot_row(self._ts(), market)])
+
+    def insert_market_snapshots(self, markets: list[dict[str, Any]]) -> None:
+        ts = self._ts()
+        self._write(INSERT_MARKET_SNAPSHOT_SQL, [_market_snapshot_row(ts, m) for m in markets])
 
     def insert_evaluation(self, payload: dict[str, Any]) -> None:
-        with self.connect() as con:
-            con.execute(
-                """INSERT INTO run_evaluations(
-                ts, market_ticker, city_key, observed_max, forecast_max_remaining,
-                min_possible, max_possible, lock_status, p_yes, chosen_side,
-                chosen_price_cents, reason, raw_payload
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    self._ts(),
-                    payload.get("market_ticker"),
-                    payload.get("city_key"),
-                    payload.get("observed_max"),
-                    payload.get("forecast_max_remaining"),
-                    payload.get("min_possible"),
-                    payload.get("max_possible"),
-                    payload.get("lock_status"),
-                    payload.get("p_yes"),
-                    payload.get("chosen_side"),
-                    payload.get("chosen_price_cents"),
-                    payload.get("reason"),
-                    json.dumps(payload),
-                ),
-            )
+        self._write(INSERT_EVALUATION_SQL, [_evaluation_row(self._ts(), payload)])
 
-    def insert_order(self, market_ticker: str, client_order_id: str, request_json: dict[str, Any], response_json: dict[str, Any], status: str) -> None:
-        with self.connect() as con:
-            con.execute(
-                "INSERT INTO orders(ts, market_ticker, client_order_id, request_json, response_json, status) VALUES (?, ?, ?, ?, ?, ?)",
-                (self._ts(), market_ticker, client_order_id, json.dumps(request_json), json.dumps(response_json), status),
-            )
+    def insert_evaluations(self, payloads: list[dict[str, Any]]) -> None:
+        ts = self._ts()
+        self._write(INSERT_EVALUATION_SQL, [_evaluation_row(ts, p) for p in payloads])
+
+    def insert_order(
+        self,
+        market_ticker: str,
+        client_order_id: str,
+        request_json: dict[str, Any],
+        response_json: dict[str, Any],
+        status: str,
+        durable: bool = True,
+    ) -> None:
+        row = _order_row(self._ts(), market_ticker, client_order_id, request_json, response_json, status)
+        self._write(INSERT_ORDER_SQL, [row], durable=durable)
 
     def insert_settlement(self, payload: dict[str, Any]) -> None:
         with self.connect() as con:
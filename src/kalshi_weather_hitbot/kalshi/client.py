@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
+import threading
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from dataclasses import dataclass
 from typing import Any
 
-import requests
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, retry_if_exception_type, stop_after_attempt, stop_any, wait_exponential
 
 from kalshi_weather_hitbot.config import AppConfig
 from kalshi_weather_hitbot.kalshi.auth import KalshiSigner
+from kalshi_weather_hitbot.kalshi.transport import AsyncHTTPTransport, TransportError, run_sync
+from kalshi_weather_hitbot.utils.deadline import CycleDeadline
+from kalshi_weather_hitbot.utils.rate_governor import Priority, RateGovernor, request_priority
 from kalshi_weather_hitbot.utils.timeutil import now_ms
 
 
@@ -24,7 +30,9 @@ class TransientAPIError(APIError):
 
 
 class PermanentAPIError(APIError):
-    pass
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class UnauthorizedError(PermanentAPIError):
@@ -47,13 +55,252 @@ def _parse_retry_after_seconds(value: Any) -> float | None:
     return max(0.0, parsed)
 
 
-class KalshiClient:
-    def __init__(self, cfg: AppConfig) -> None:
+_BACKOFF = wait_exponential(multiplier=1, min=1, max=16)
+
+
+def _deadline_of(retry_state: RetryCallState) -> CycleDeadline | None:
+    return getattr(retry_state.args[0], "deadline", None) if retry_state.args else None
+
+
+def _wait_within_deadline(retry_state: RetryCallState) -> float:
+    wait = _BACKOFF(retry_state)
+    deadline = _deadline_of(retry_state)
+    return wait if deadline is None else deadline.retry_wait(wait)
+
+
+def _stop_at_deadline(retry_state: RetryCallState) -> bool:
+    # tenacity computes the upcoming sleep before asking whether to stop.
+    deadline = _deadline_of(retry_state)
+    return deadline is not None and not deadline.allows_retry(retry_state.upcoming_sleep)
+
+
+# Policy for AsyncKalshiClient._request, the one request path behind every Kalshi
+# call (KalshiClient included); network errors arrive as TransientAPIError. With a
+# cycle deadline attached, backoffs shrink to fit and retries stop once the remaining
+# budget cannot cover another attempt.
+RETRY_POLICY: dict[str, Any] = {
+    "reraise": True,
+    "retry": retry_if_exception_type(TransientAPIError),
+    "wait": _wait_within_deadline,
+    "stop": stop_any(stop_after_attempt(4), _stop_at_deadline),
+}
+REQUEST_TIMEOUT_SECONDS = 15
+
+
+def _response_payload(response: Any) -> dict[str, Any]:
+    if response.status_code == 401:
+        raise UnauthorizedError("Unauthorized (401). Check API key id, private key path, and environment base URL.")
+    if response.status_code == 429:
+        raise RateLimitError(
+            f"Rate limited (429): {getattr(response, 'text', '')}",
+            retry_after_seconds=_parse_retry_after_seconds(getattr(response, "headers", {}).get("Retry-After")),
+        )
+    if response.status_code >= 500:
+        raise TransientAPIError(f"Transient API error: {response.status_code} {response.text}")
+    if response.status_code >= 400:
+        raise PermanentAPIError(f"API error {response.status_code}: {response.text}", status_code=response.status_code)
+    return response.json() if response.text else {}
+
+
+def _validated_object(payload: Any, path: str) -> dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise APIError(f"Malformed {path} response: expected JSON object, got {type(payload).__name__}")
+    return payload
+
+
+def _validated_settlements(payload: Any) -> dict[str, Any]:
+    payload = _validated_object(payload, "/trade-api/v2/portfolio/settlements")
+    settlements = payload.get("settlements")
+    if settlements is None:
+        payload["settlements"] = []
+    elif not isinstance(settlements, list):
+        raise APIError(
+            "Malformed /trade-api/v2/portfolio/settlements response: expected 'settlements' list or null, "
+            f"got {type(settlements).__name__}"
+        )
+    return payload
+
+
+def _settlements_params(limit: int, cursor: str | None) -> dict[str, Any]:
+    params: dict[str, Any] = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
+    return params
+
+
+def _paged_params(params: dict[str, Any] | None, limit: int, cursor: str | None) -> dict[str, Any]:
+    out = dict(params or {})
+    out.update(_settlements_params(limit, cursor))
+    return out
+
+
+def _page_items(payload: Any, path: str, key: str) -> list[dict[str, Any]]:
+    payload = _validated_object(payload, path)
+    items = payload.get(key)
+    if items is None:
+        return []
+    if not isinstance(items, list):
+        raise APIError(f"Malformed {path} response: expected '{key}' list or null, got {type(items).__name__}")
+    return items
+
+
+async def iter_pages(
+    fetch_page: Callable[[str | None], Awaitable[dict[str, Any]]],
+    items_of: Callable[[dict[str, Any]], list[dict[str, Any]]],
+    max_items: int | None = None,
+    prefetch: bool = False,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    # Yields one page of items at a time, requesting each page once the previous one
+    # has been handed out. With prefetch the next page is already in flight (a task on
+    # the same loop) while the caller works through the current one; at most two pages
+    # are held either way.
+    if max_items is not None and max_items <= 0:
+        return
+    pending: asyncio.Future | None = None
+    seen_cursors: set[str] = set()
+    yielded = 0
+    try:
+        payload = await fetch_page(None)
+        while True:
+            items = items_of(payload)
+            if max_items is not None:
+                items = items[: max_items - yielded]
+            yielded += len(items)
+            cursor = str(payload.get("cursor") or "") or None
+            # A repeated cursor would loop forever; treat it as the last page.
+            more = cursor is not None and cursor not in seen_cursors and (max_items is None or yielded < max_items)
+            if more:
+                seen_cursors.add(cursor)
+                if prefetch:
+                    pending = asyncio.ensure_future(fetch_page(cursor))
+            if items:
+                yield items
+            if not more:
+                return
+            if pending is not None:
+                payload, pending = await pending, None
+            else:
+                payload = await fetch_page(cursor)
+    finally:
+        if pending is not None and not pending.cancel():
+            pending.exception()  # retrieved so an unused failed prefetch is not reported
+
+
+async def _flatten(pages: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[dict[str, Any]]:
+    try:
+        async for page in pages:
+            for item in page:
+                yield item
+    finally:
+        await pages.aclose()
+
+
+async def _next_page(pages: AsyncIterator[list[dict[str, Any]]]) -> list[dict[str, Any]] | None:
+    try:
+        return await pages.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+# Kalshi accepts at most this many orders per batched create/cancel call.
+BATCH_ORDER_LIMIT = 20
+# Status codes meaning the batch endpoint itself is unavailable (tier or environment).
+_BATCH_UNAVAILABLE_STATUSES = {403, 404, 405}
+
+
+@dataclass
+class BatchOrderResult:
+    # key is the client_order_id for creates and the order_id for cancels.
+    key: str
+    response: dict[str, Any] | None = None
+    error: APIError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _batch_entry_error(error: Any) -> APIError:
+    if isinstance(error, dict):
+        code = error.get("code") or ""
+        message = error.get("message") or error.get("details") or ""
+        return PermanentAPIError(f"API error {code}: {message}".strip())
+    return PermanentAPIError(f"API error: {error}")
+
+
+def _batch_results(payload: Any, path: str, keys: list[str], key_field: str) -> list[BatchOrderResult]:
+    entries = [e for e in _page_items(payload, path, "orders") if isinstance(e, dict)]
+    by_key: dict[str, dict[str, Any]] = {}
+    for entry in entries:
+        order = entry.get("order") if isinstance(entry.get("order"), dict) else {}
+        entry_key = str(entry.get(key_field) or order.get(key_field) or "")
+        if entry_key:
+            by_key[entry_key] = entry
+    positional = len(entries) == len(keys)
+    results: list[BatchOrderResult] = []
+    for index, key in enumerate(keys):
+        entry = by_key.get(key) or (entries[index] if positional else None)
+        if entry is None:
+            results.append(BatchOrderResult(key, error=TransientAPIError(f"{path}: no result returned for {key_field}={key}")))
+        elif entry.get("error"):
+            results.append(BatchOrderResult(key, error=_batch_entry_error(entry["error"])))
+        else:
+            results.append(BatchOrderResult(key, response={k: v for k, v in entry.items() if k != "error"}))
+    return results
+
+
+class AsyncKalshiClient:
+    # asyncio-native Kalshi client. Requests go out over a pooled AsyncHTTPTransport, so
+    # calls in flight share keep-alive connections instead of holding a thread each;
+    # max_concurrency caps them per event loop. Signing, error mapping, the retry
+    # policy, pagination and batching live here only; KalshiClient wraps this class.
+    def __init__(self, cfg: AppConfig, max_concurrency: int = 8, rate_governor: RateGovernor | None = None) -> None:
         self.cfg = cfg
         self.base_url = cfg.base_url
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": cfg.user_agent})
         self.signer = KalshiSigner(cfg.private_key_path) if cfg.api_key_id and cfg.private_key_path else None
+        self.rate_governor = rate_governor
+        # Set per run-loop cycle; None means no time budget.
+        self.deadline: CycleDeadline | None = None
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.transport = AsyncHTTPTransport({"User-Agent": cfg.user_agent}, max_idle_per_host=self.max_concurrency)
+        # Flipped off the first time the batch endpoint answers 403/404/405.
+        self.batch_supported = True
+        # One semaphore per event loop, created on first use inside that loop.
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    async def __aenter__(self) -> "AsyncKalshiClient":
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def rate_key(self, method: str) -> str:
+        # Kalshi budgets reads and writes separately.
+        host = RateGovernor.key_for(self.base_url)
+        return f"{host}#write" if request_priority(method, "") == Priority.ORDER else host
+
+    async def _throttle(self, method: str, path: str) -> None:
+        if self.rate_governor is not None:
+            await self.rate_governor.acquire_async(self.rate_key(method), request_priority(method, path))
+
+    def _back_off(self, method: str, exc: RateLimitError) -> bool:
+        # With a governor the Retry-After pause is applied to the bucket instead of
+        # sleeping here, so other lanes and hosts keep moving.
+        if self.rate_governor is None or exc.retry_after_seconds is None:
+            return False
+        self.rate_governor.penalize(self.rate_key(method), min(exc.retry_after_seconds, 30.0))
+        return True
+
+    def _timeout(self) -> float:
+        return REQUEST_TIMEOUT_SECONDS if self.deadline is None else self.deadline.timeout(REQUEST_TIMEOUT_SECONDS)
+
+    def _retry_after_sleep(self, exc: RateLimitError) -> float:
+        seconds = min(exc.retry_after_seconds or 0.0, 30.0)
+        return seconds if self.deadline is None else max(0.0, min(seconds, self.deadline.remaining()))
 
     def _headers(self, method: str, path: str, authenticated: bool) -> dict[str, str]:
         headers = {"Accept": "application/json"}
@@ -70,48 +317,43 @@ class KalshiClient:
             )
         return headers
 
-    @retry(
-        reraise=True,
-        retry=retry_if_exception_type((requests.RequestException, TransientAPIError)),
-        wait=wait_exponential(multiplier=1, min=1, max=16),
-        stop=stop_after_attempt(4),
-    )
-    def _request(self, method: str, path: str, *, params: dict[str, Any] | None = None, json_body: dict[str, Any] | None = None, authenticated: bool = False) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @retry(**RETRY_POLICY)
+    async def _request(self, method: str, path: str, *, params: dict[str, Any] | None = None, json_body: dict[str, Any] | None = None, authenticated: bool = False) -> dict[str, Any]:
+        await self._throttle(method, path)
+        async with self._semaphore():
+            try:
+                response = await self.transport.request(
+                    method,
+                    f"{self.base_url}{path}",
+                    params=params,
+                    json_body=json_body,
+                    headers=self._headers(method, path, authenticated),
+                    timeout=self._timeout(),
+                )
+            except TransportError as exc:
+                raise TransientAPIError(f"Network error while calling {path}: {exc}") from exc
         try:
-            response = self.session.request(
-                method,
-                url,
-                params=params,
-                json=json_body,
-                headers=self._headers(method, path, authenticated),
-                timeout=15,
-            )
-        except requests.RequestException as exc:
-            raise TransientAPIError(f"Network error while calling {path}: {exc}") from exc
-        if response.status_code == 401:
-            raise UnauthorizedError("Unauthorized (401). Check API key id, private key path, and environment base URL.")
-        if response.status_code == 429:
-            retry_after_seconds = _parse_retry_after_seconds(getattr(response, "headers", {}).get("Retry-After"))
-            if retry_after_seconds is not None:
-                time.sleep(min(retry_after_seconds, 30.0))
-            raise RateLimitError(
-                f"Rate limited (429): {getattr(response, 'text', '')}",
-                retry_after_seconds=retry_after_seconds,
-            )
-        if response.status_code >= 500:
-            raise TransientAPIError(f"Transient API error: {response.status_code} {response.text}")
-        if response.status_code >= 400:
-            raise PermanentAPIError(f"API error {response.status_code}: {response.text}")
-        return response.json() if response.text else {}
+            return _response_payload(response)
+        except RateLimitError as exc:
+            if not self._back_off(method, exc) and exc.retry_after_seconds is not None:
+                await asyncio.sleep(self._retry_after_sleep(exc))
+            raise
 
-    def list_series(self, tags: str | None = "Weather", category: str | None = None) -> list[dict[str, Any]]:
+    async def list_series(self, tags: str | None = "Weather", category: str | None = None) -> list[dict[str, Any]]:
         params: dict[str, Any] = {}
         if tags:
             params["tags"] = tags
         if category:
             params["category"] = category
-        payload = self._request("GET", "/trade-api/v2/series", params=params or None)
+        payload = await self._request("GET", "/trade-api/v2/series", params=params or None)
         if not isinstance(payload, dict):
             raise APIError(
                 "Malformed /trade-api/v2/series response: expected JSON object, "
@@ -127,61 +369,295 @@ class KalshiClient:
             )
         return series
 
+    async def list_markets(self, series_ticker: str, status: str = "open", limit: int = 100) -> list[dict[str, Any]]:
+        # Up to `limit` markets, following the cursor if one page holds fewer.
+        return [m async for m in self.iter_markets(series_ticker, status, page_size=min(limit, 1000), max_items=limit)]
+
+    async def get_market(self, ticker: str) -> dict[str, Any]:
+        return await self._request("GET", f"/trade-api/v2/markets/{ticker}")
+
+    async def get_orderbook(self, ticker: str) -> dict[str, Any]:
+        return await self._request("GET", f"/trade-api/v2/markets/{ticker}/orderbook")
+
+    async def get_orderbooks(self, tickers: list[str]) -> dict[str, dict[str, Any] | BaseException]:
+        # Failures are returned per ticker so one bad book does not sink the batch.
+        unique = list(dict.fromkeys(tickers))
+        books = await asyncio.gather(*(self.get_orderbook(t) for t in unique), return_exceptions=True)
+        return dict(zip(unique, books))
+
+    async def get_balance(self) -> dict[str, Any]:
+        return await self._request("GET", "/trade-api/v2/portfolio/balance", authenticated=True)
+
+    async def get_account_limits(self) -> dict[str, Any]:
+        payload = await self._request("GET", "/trade-api/v2/account/limits", authenticated=True)
+        return _validated_object(payload, "/trade-api/v2/account/limits")
+
+    async def place_order(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return await self._request("POST", "/trade-api/v2/portfolio/orders", json_body=payload, authenticated=True)
+
+    async def get_positions(self) -> list[dict[str, Any]]:
+        return [p async for p in self.iter_positions()]
+
+    async def get_settlements(self, limit: int = 200, cursor: str | None = None) -> dict[str, Any]:
+        params = _settlements_params(limit, cursor)
+        payload = await self._request("GET", "/trade-api/v2/portfolio/settlements", params=params, authenticated=True)
+        return _validated_settlements(payload)
+
+    async def list_orders(self, status: str = "open") -> list[dict[str, Any]]:
+        return [o async for o in self.iter_orders(status=status)]
+
+    async def get_fills(self, min_ts: int | None = None, limit: int = 1) -> list[dict[str, Any]]:
+        # One page only: callers use it as a cheap "anything filled since?" probe.
+        params: dict[str, Any] = {"limit": limit}
+        if min_ts is not None:
+            params["min_ts"] = int(min_ts)
+        path = "/trade-api/v2/portfolio/fills"
+        return _page_items(await self._request("GET", path, params=params, authenticated=True), path, "fills")
+
+    def _pages(
+        self,
+        path: str,
+        key: str,
+        params: dict[str, Any] | None,
+        page_size: int,
+        max_items: int | None,
+        authenticated: bool,
+        prefetch: bool,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        async def fetch(cursor: str | None) -> dict[str, Any]:
+            return await self._request("GET", path, params=_paged_params(params, page_size, cursor), authenticated=authenticated)
+
+        return iter_pages(fetch, lambda payload: _page_items(payload, path, key), max_items, prefetch)
+
+    def _market_pages(
+        self, series_ticker: str | None, status: str, page_size: int, max_items: int | None, prefetch: bool
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        params: dict[str, Any] = {"status": status}
+        if series_ticker:
+            params["series_ticker"] = series_ticker
+        return self._pages("/trade-api/v2/markets", "markets", params, page_size, max_items, False, prefetch)
+
+    def _order_pages(self, status: str, page_size: int, max_items: int | None, prefetch: bool) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._pages("/trade-api/v2/portfolio/orders", "orders", {"status": status}, page_size, max_items, True, prefetch)
+
+    def _position_pages(self, page_size: int, max_items: int | None, prefetch: bool) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._pages("/trade-api/v2/portfolio/positions", "positions", None, page_size, max_items, True, prefetch)
+
+    def _settlement_pages(self, page_size: int, max_items: int | None, prefetch: bool) -> AsyncIterator[list[dict[str, Any]]]:
+        async def fetch(cursor: str | None) -> dict[str, Any]:
+            return await self.get_settlements(limit=page_size, cursor=cursor)
+
+        return iter_pages(fetch, lambda payload: payload["settlements"], max_items, prefetch)
+
+    def iter_markets(
+        self,
+        series_ticker: str | None = None,
+        status: str = "open",
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _flatten(self._market_pages(series_ticker, status, page_size, max_items, prefetch))
+
+    def iter_orders(
+        self, status: str = "open", page_size: int = 200, max_items: int | None = None, prefetch: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _flatten(self._order_pages(status, page_size, max_items, prefetch))
+
+    def iter_positions(self, page_size: int = 200, max_items: int | None = None, prefetch: bool = False) -> AsyncIterator[dict[str, Any]]:
+        return _flatten(self._position_pages(page_size, max_items, prefetch))
+
+    def iter_settlements(self, page_size: int = 200, max_items: int | None = None, prefetch: bool = False) -> AsyncIterator[dict[str, Any]]:
+        return _flatten(self._settlement_pages(page_size, max_items, prefetch))
+
+    async def amend_order(self, order_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+        return await self._request("POST", f"/trade-api/v2/portfolio/orders/{order_id}/amend", json_body=payload, authenticated=True)
+
+    async def cancel_order(self, order_id: str) -> dict[str, Any]:
+        return await self._request("DELETE", f"/trade-api/v2/portfolio/orders/{order_id}", authenticated=True)
+
+    async def batch_place_orders(self, orders: list[dict[str, Any]]) -> list[BatchOrderResult]:
+        # Results line up with `orders`. Resending a chunk is safe: each order keeps
+        # its client_order_id, so a duplicate comes back as order_already_exists.
+        path = "/trade-api/v2/portfolio/orders/batched"
+
+        async def send_batch(chunk: list[dict[str, Any]], keys: list[str]) -> list[BatchOrderResult]:
+            payload = await self._request("POST", path, json_body={"orders": chunk}, authenticated=True)
+            return _batch_results(payload, path, keys, "client_order_id")
+
+        return await self._batched(orders, [str(o.get("client_order_id") or "") for o in orders], send_batch, self.place_order)
+
+    async def batch_cancel_orders(self, order_ids: list[str]) -> list[BatchOrderResult]:
+        path = "/trade-api/v2/portfolio/orders/batched"
+
+        async def send_batch(chunk: list[str], keys: list[str]) -> list[BatchOrderResult]:
+            payload = await self._request("DELETE", path, json_body={"ids": chunk}, authenticated=True)
+            return _batch_results(payload, path, keys, "order_id")
+
+        ids = [str(oid) for oid in order_ids]
+        return await self._batched(ids, ids, send_batch, self.cancel_order)
+
+    async def _batched(
+        self,
+        items: list[Any],
+        keys: list[str],
+        send_batch: Callable[[list[Any], list[str]], Awaitable[list[BatchOrderResult]]],
+        send_single: Callable[[Any], Awaitable[dict[str, Any]]],
+    ) -> list[BatchOrderResult]:
+        results: list[BatchOrderResult] = []
+        for start in range(0, len(items), BATCH_ORDER_LIMIT):
+            chunk, chunk_keys = items[start : start + BATCH_ORDER_LIMIT], keys[start : start + BATCH_ORDER_LIMIT]
+            if self.batch_supported and len(chunk) > 1:
+                try:
+                    results.extend(await send_batch(chunk, chunk_keys))
+                    continue
+                except UnauthorizedError:
+                    raise
+                except PermanentAPIError as exc:
+                    if exc.status_code in _BATCH_UNAVAILABLE_STATUSES:
+                        logger.warning("Kalshi batch order endpoint unavailable (%s); using single-order calls", exc)
+                        self.batch_supported = False
+                    else:
+                        results.extend(BatchOrderResult(k, error=exc) for k in chunk_keys)
+                        continue
+                except APIError as exc:
+                    results.extend(BatchOrderResult(k, error=exc) for k in chunk_keys)
+                    continue
+            for item, key in zip(chunk, chunk_keys):
+                try:
+                    results.append(BatchOrderResult(key, response=await send_single(item)))
+                except UnauthorizedError:
+                    raise
+                except APIError as exc:
+                    results.append(BatchOrderResult(key, error=exc))
+        return results
+
+
+class KalshiClient:
+    # Blocking front end over AsyncKalshiClient for the run loop, CLI and dashboard.
+    # Each call runs the async method on the shared I/O loop thread and waits for it,
+    # so callers on several threads still share one connection pool.
+    def __init__(self, cfg: AppConfig, rate_governor: RateGovernor | None = None, max_concurrency: int = 8) -> None:
+        self.aio = AsyncKalshiClient(cfg, max_concurrency, rate_governor)
+
+    @property
+    def cfg(self) -> AppConfig:
+        return self.aio.cfg
+
+    @property
+    def base_url(self) -> str:
+        return self.aio.base_url
+
+    @property
+    def signer(self) -> KalshiSigner | None:
+        return self.aio.signer
+
+    @property
+    def rate_governor(self) -> RateGovernor | None:
+        return self.aio.rate_governor
+
+    @rate_governor.setter
+    def rate_governor(self, value: RateGovernor | None) -> None:
+        self.aio.rate_governor = value
+
+    @property
+    def deadline(self) -> CycleDeadline | None:
+        return self.aio.deadline
+
+    @deadline.setter
+    def deadline(self, value: CycleDeadline | None) -> None:
+        self.aio.deadline = value
+
+    @property
+    def batch_supported(self) -> bool:
+        return self.aio.batch_supported
+
+    @batch_supported.setter
+    def batch_supported(self, value: bool) -> None:
+        self.aio.batch_supported = value
+
+    def rate_key(self, method: str) -> str:
+        return self.aio.rate_key(method)
+
+    def close(self) -> None:
+        run_sync(self.aio.aclose())
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> dict[str, Any]:
+        return run_sync(self.aio._request(method, path, **kwargs))
+
+    def _iter(self, pages: AsyncIterator[list[dict[str, Any]]]) -> Iterator[dict[str, Any]]:
+        # One loop round trip per page, not per item.
+        try:
+            while (page := run_sync(_next_page(pages))) is not None:
+                yield from page
+        finally:
+            run_sync(pages.aclose())
+
+    def list_series(self, tags: str | None = "Weather", category: str | None = None) -> list[dict[str, Any]]:
+        return run_sync(self.aio.list_series(tags, category))
+
     def list_markets(self, series_ticker: str, status: str = "open", limit: int = 100) -> list[dict[str, Any]]:
-        payload = self._request("GET", "/trade-api/v2/markets", params={"series_ticker": series_ticker, "status": status, "limit": limit})
-        return payload.get("markets", [])
+        return run_sync(self.aio.list_markets(series_ticker, status, limit))
 
     def get_market(self, ticker: str) -> dict[str, Any]:
-        return self._request("GET", f"/trade-api/v2/markets/{ticker}")
+        return run_sync(self.aio.get_market(ticker))
 
     def get_orderbook(self, ticker: str) -> dict[str, Any]:
-        return self._request("GET", f"/trade-api/v2/markets/{ticker}/orderbook")
+        return run_sync(self.aio.get_orderbook(ticker))
+
+    def get_orderbooks(self, tickers: list[str]) -> dict[str, dict[str, Any] | BaseException]:
+        return run_sync(self.aio.get_orderbooks(tickers))
 
     def get_balance(self) -> dict[str, Any]:
-        return self._request("GET", "/trade-api/v2/portfolio/balance", authenticated=True)
+        return run_sync(self.aio.get_balance())
 
     def get_account_limits(self) -> dict[str, Any]:
-        payload = self._request("GET", "/trade-api/v2/account/limits", authenticated=True)
-        if not isinstance(payload, dict):
-            raise APIError(
-                "Malformed /trade-api/v2/account/limits response: expected JSON object, "
-                f"got {type(payload).__name__}"
-            )
-        return payload
+        return run_sync(self.aio.get_account_limits())
 
     def place_order(self, payload: dict[str, Any]) -> dict[str, Any]:
-        return self._request("POST", "/trade-api/v2/portfolio/orders", json_body=payload, authenticated=True)
+        return run_sync(self.aio.place_order(payload))
 
     def get_positions(self) -> list[dict[str, Any]]:
-        payload = self._request("GET", "/trade-api/v2/portfolio/positions", authenticated=True)
-        return payload.get("positions", [])
+        return list(self.iter_positions())
 
     def get_settlements(self, limit: int = 200, cursor: str | None = None) -> dict[str, Any]:
-        params: dict[str, Any] = {"limit": limit}
-        if cursor:
-            params["cursor"] = cursor
-        payload = self._request("GET", "/trade-api/v2/portfolio/settlements", params=params, authenticated=True)
-        if not isinstance(payload, dict):
-            raise APIError(
-                "Malformed /trade-api/v2/portfolio/settlements response: expected JSON object, "
-                f"got {type(payload).__name__}"
-            )
-        settlements = payload.get("settlements")
-        if settlements is None:
-            payload["settlements"] = []
-        elif not isinstance(settlements, list):
-            raise APIError(
-                "Malformed /trade-api/v2/portfolio/settlements response: expected 'settlements' list or null, "
-                f"got {type(settlements).__name__}"
-            )
-        return payload
+        return run_sync(self.aio.get_settlements(limit, cursor))
 
     def list_orders(self, status: str = "open") -> list[dict[str, Any]]:
-        payload = self._request("GET", "/trade-api/v2/portfolio/orders", params={"status": status}, authenticated=True)
-        return payload.get("orders", [])
+        return list(self.iter_orders(status=status))
+
+    def get_fills(self, min_ts: int | None = None, limit: int = 1) -> list[dict[str, Any]]:
+        return run_sync(self.aio.get_fills(min_ts, limit))
+
+    def iter_markets(
+        self,
+        series_ticker: str | None = None,
+        status: str = "open",
+        page_size: int = 100,
+        max_items: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        return self._iter(self.aio._market_pages(series_ticker, status, page_size, max_items, prefetch))
+
+    def iter_orders(
+        self, status: str = "open", page_size: int = 200, max_items: int | None = None, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._iter(self.aio._order_pages(status, page_size, max_items, prefetch))
+
+    def iter_positions(self, page_size: int = 200, max_items: int | None = None, prefetch: bool = False) -> Iterator[dict[str, Any]]:
+        return self._iter(self.aio._position_pages(page_size, max_items, prefetch))
+
+    def iter_settlements(self, page_size: int = 200, max_items: int | None = None, prefetch: bool = False) -> Iterator[dict[str, Any]]:
+        return self._iter(self.aio._settlement_pages(page_size, max_items, prefetch))
 
     def amend_order(self, order_id: str, payload: dict[str, Any]) -> dict[str, Any]:
-        return self._request("POST", f"/trade-api/v2/portfolio/orders/{order_id}/amend", json_body=payload, authenticated=True)
+        return run_sync(self.aio.amend_order(order_id, payload))
 
     def cancel_order(self, order_id: str) -> dict[str, Any]:
-        return self._request("DELETE", f"/trade-api/v2/portfolio/orders/{order_id}", authenticated=True)
+        return run_sync(self.aio.cancel_order(order_id))
+
+    def batch_place_orders(self, orders: list[dict[str, Any]]) -> list[BatchOrderResult]:
+        return run_sync(self.aio.batch_place_orders(orders))
+
+    def batch_cancel_orders(self, order_ids: list[str]) -> list[BatchOrderResult]:
+        return run_sync(self.aio.batch_cancel_orders(order_ids))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from kalshi_weather_hitbot.kalshi.models import Order, Position, as_order, as_position
+
+
+# Order statuses that leave nothing resting on the book.
+_CLOSED_STATUSES = {"canceled", "cancelled", "executed", "filled", "expired"}
+
+
+def _response_order(response: Any) -> dict[str, Any]:
+    if isinstance(response, dict) and isinstance(response.get("order"), dict):
+        return response["order"]
+    return {}
+
+
+def _has_fill(order: dict[str, Any]) -> bool:
+    status = str(order.get("status") or "").lower()
+    if status in {"executed", "filled"}:
+        return True
+    for key in ("fill_count", "fill_count_fp", "taker_fill_count", "maker_fill_count"):
+        try:
+            if float(order.get(key) or 0) > 0:
+                return True
+        except (TypeError, ValueError):
+            continue
+    return False
+
+
+@dataclass
+class LedgerStats:
+    reconciles: int = 0
+    cycles_since_reconcile: int = 0
+    orders: int = 0
+    positions: int = 0
+    drift_reasons: list[str] = field(default_factory=list)
+
+
+# In-process view of the account (cash, positions, resting orders) kept across run
+# cycles. Place/amend/cancel responses are applied as they arrive; a full REST
+# snapshot replaces everything every `reconcile_every_cycles` cycles, or on the next
+# cycle after anything the ledger cannot model locally (fills, rejected cancels,
+# duplicate client_order_ids) marks it as drifted. Fills of resting orders never show
+# up in our own responses, so the run loop probes /portfolio/fills since the last
+# snapshot each cycle and marks drift when it returns anything.
+class ShadowLedger:
+    def __init__(self, reconcile_every_cycles: int = 5) -> None:
+        self.reconcile_every_cycles = max(1, int(reconcile_every_cycles))
+        self.available_dollars = 0.0
+        self._positions: list[Position] = []
+        self._positions_exposure = 0.0
+        self._orders: dict[str, Order] = {}
+        self._orders_exposure = 0.0
+        self._reconciled = False
+        # Wall-clock time of the last snapshot; fills after it are not in the ledger.
+        self.reconciled_at: float | None = None
+        self._cycles_since_reconcile = 0
+        self._reconciles = 0
+        self._drift_reasons: list[str] = []
+
+    def needs_reconcile(self) -> bool:
+        return (
+            not self._reconciled
+            or bool(self._drift_reasons)
+            or self._cycles_since_reconcile >= self.reconcile_every_cycles
+        )
+
+    def start_cycle(self) -> None:
+        self._cycles_since_reconcile += 1
+
+    def reconcile(
+        self,
+        available_dollars: float,
+        positions: list[Position | dict[str, Any]],
+        orders: list[Order | dict[str, Any]],
+        now: float | None = None,
+    ) -> None:
+        self.available_dollars = float(available_dollars)
+        self._positions = [as_position(p) for p in positions]
+        self._positions_exposure = sum(p.exposure_dollars for p in self._positions)
+        self._orders = {}
+        self._orders_exposure = 0.0
+        for order in map(as_order, orders):
+            self._put_order(self._key_for(order), order)
+        self._reconciled = True
+        self.reconciled_at = time.time() if now is None else float(now)
+        self._cycles_since_reconcile = 0
+        self._reconciles += 1
+        self._drift_reasons = []
+
+    def mark_drift(self, reason: str) -> None:
+        self._drift_reasons.append(reason)
+
+    def positions(self) -> list[Position]:
+        return list(self._positions)
+
+    def active_orders(self) -> list[Order]:
+        return list(self._orders.values())
+
+    def exposure_dollars(self) -> float:
+        return self._positions_exposure + self._orders_exposure
+
+    def apply_place(
+        self,
+        payload: dict[str, Any],
+        response: Any,
+        *,
+        exposure_dollars: float | None = None,
+        cost_dollars: float = 0.0,
+    ) -> None:
+        placed = _response_order(response)
+        if _has_fill(placed):
+            # Positions changed; only a REST snapshot can say how.
+            self.mark_drift(f"fill:{payload.get('ticker')}")
+        if str(placed.get("status") or "").lower() in _CLOSED_STATUSES:
+            return
+        raw = {**payload, **placed}
+        if exposure_dollars is not None:
+            raw["buy_max_cost_dollars"] = exposure_dollars
+        order = Order.from_api(raw)
+        self._put_order(self._key_for(order), order)
+        self.available_dollars = max(0.0, self.available_dollars - cost_dollars)
+
+    def apply_amend(self, order_id: str, payload: dict[str, Any], response: Any) -> None:
+        current = self._orders.get(order_id)
+        if current is None:
+            self.mark_drift(f"amend_unknown:{order_id}")
+            return
+        amended = _response_order(response)
+        if _has_fill(amended):
+            self.mark_drift(f"fill:{current.ticker}")
+        raw = {k: v for k, v in current.raw.items() if k not in {"buy_max_cost_dollars", "buy_max_cost", "buy_max_cost_fp"}}
+        raw.update({k: v for k, v in payload.items() if k != "order_id"})
+        raw.update(amended)
+        updated = Order.from_api(raw)
+        if updated.status in _CLOSED_STATUSES:
+            self._drop_order(order_id)
+            return
+        self._put_order(order_id, updated)
+
+    def apply_cancel(self, order_id: str, response: Any) -> None:
+        released = self._drop_order(order_id)
+        if released is None:
+            self.mark_drift(f"cancel_unknown:{order_id}")
+            return
+        self.available_dollars += released
+        if _has_fill(_response_order(response)):
+            self.mark_drift(f"fill:{order_id}")
+
+    def stats(self) -> LedgerStats:
+        return LedgerStats(
+            reconciles=self._reconciles,
+            cycles_since_reconcile=self._cycles_since_reconcile,
+            orders=len(self._orders),
+            positions=len(self._positions),
+            drift_reasons=list(self._drift_reasons),
+        )
+
+    def _key_for(self, order: Order) -> str:
+        # Fallback key if order id is absent
+        return order.order_id or order.client_order_id or f"noid-{len(self._orders)}"
+
+    def _put_order(self, key: str, order: Order) -> None:
+        self._drop_order(key)
+        self._orders[key] = order
+        self._orders_exposure += order.buy_exposure_dollars
+
+    def _drop_order(self, key: str) -> float | None:
+        order = self._orders.pop(key, None)
+        if order is None:
+            return None
+        self._orders_exposure -= order.buy_exposure_dollars
+        return order.buy_exposure_dollars
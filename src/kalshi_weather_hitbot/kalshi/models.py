@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
@@ -92,3 +93,191 @@ def normalize_orderbook(response: dict[str, Any]) -> OrderBookTop:
         no_bid_size=no_bid_size,
         no_ask_size=yes_bid_size,
     )
+
+
+# Normalized records for the portfolio and market payloads the run loop touches.
+# Field aliases, fixed-point strings and dollar/cent variants are resolved once in
+# from_api(); everything downstream reads canonical attributes. `raw` keeps the
+# original payload for DB rows and display.
+
+
+def _decimal(value: Any) -> Decimal | None:
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return None
+
+
+def _to_float(value: Any) -> float | None:
+    dec = _decimal(value)
+    return float(dec) if dec is not None else None
+
+
+def _dollars_to_cents(value: Any) -> int | None:
+    dec = _decimal(value)
+    if dec is None:
+        return None
+    return int((dec * 100).quantize(Decimal("1")))
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def _first_present(payload: dict[str, Any], *keys: str) -> Any:
+    for key in keys:
+        if payload.get(key) is not None:
+            return payload[key]
+    return None
+
+
+def order_price_cents(order: dict[str, Any]) -> int | None:
+    side = str(order.get("side") or "").lower()
+    if side == "yes":
+        cents_keys, dollar_keys = ("yes_price", "price"), ("yes_price_dollars", "price_dollars")
+    elif side == "no":
+        cents_keys, dollar_keys = ("no_price", "price"), ("no_price_dollars", "price_dollars")
+    else:
+        cents_keys = ("yes_price", "no_price", "price")
+        dollar_keys = ("yes_price_dollars", "no_price_dollars", "price_dollars")
+    cents = _first_present(order, *cents_keys)
+    if cents is not None:
+        return int(cents)
+    for key in dollar_keys:
+        parsed = _dollars_to_cents(order.get(key))
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def _order_buy_exposure_dollars(order: dict[str, Any], action: str, remaining: float, price_cents: int | None) -> float:
+    buy_max_cost_dollars = order.get("buy_max_cost_dollars") or order.get("buy_max_cost_fp")
+    if buy_max_cost_dollars is not None:
+        return _to_float(buy_max_cost_dollars) or 0.0
+    buy_max_cost = order.get("buy_max_cost")
+    if buy_max_cost is not None:
+        return (_to_float(buy_max_cost) or 0.0) / 100.0
+    if action != "buy":
+        return 0.0
+    return (remaining * (price_cents or 0)) / 100.0
+
+
+@dataclass(slots=True, eq=False)
+class Order:
+    order_id: str
+    client_order_id: str
+    ticker: str
+    side: str  # "yes" / "no" / ""
+    action: str  # "buy" / "sell" / ""
+    status: str
+    remaining_count: float
+    price_cents: int | None
+    buy_exposure_dollars: float
+    created_at: datetime | None
+    raw: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "Order":
+        action = str(payload.get("action") or "").lower()
+        remaining = _to_float(payload.get("remaining_count") or payload.get("count") or payload.get("count_fp")) or 0.0
+        price_cents = order_price_cents(payload)
+        return cls(
+            order_id=str(payload.get("order_id") or payload.get("id") or ""),
+            client_order_id=str(payload.get("client_order_id") or ""),
+            ticker=str(payload.get("ticker") or payload.get("market_ticker") or ""),
+            side=str(payload.get("side") or "").lower(),
+            action=action,
+            status=str(payload.get("status") or "").lower(),
+            remaining_count=remaining,
+            price_cents=price_cents,
+            buy_exposure_dollars=_order_buy_exposure_dollars(payload, action, remaining, price_cents),
+            created_at=_parse_timestamp(payload.get("created_time") or payload.get("last_update_time")),
+            raw=payload,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class Position:
+    ticker: str
+    side: str  # "YES" / "NO" / ""
+    contracts: float
+    avg_price_cents: float | None  # fractional, as reported; callers round as they need
+    exposure_dollars: float
+    raw: dict[str, Any]
+
+    @property
+    def is_open(self) -> bool:
+        return abs(self.contracts) > 0
+
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "Position":
+        contracts = _to_float(_first_present(payload, "contracts", "position", "count")) or 0.0
+        avg_price_cents = _to_float(payload.get("avg_price") or payload.get("average_price") or payload.get("cost_basis"))
+        exposure_fp = payload.get("market_exposure_dollars") or payload.get("market_exposure_fp")
+        if exposure_fp is not None:
+            exposure = _to_float(exposure_fp) or 0.0
+        elif payload.get("market_exposure") is not None:
+            exposure = (_to_float(payload["market_exposure"]) or 0.0) / 100.0
+        else:
+            exposure = 0.0
+        if exposure <= 0:
+            # Conservative fallback + buffer for fees/slippage.
+            exposure = ((abs(contracts) * (avg_price_cents or 0)) / 100.0) * 1.1
+        return cls(
+            ticker=str(payload.get("ticker") or payload.get("market_ticker") or ""),
+            side=str(payload.get("side") or payload.get("position_side") or "").upper(),
+            contracts=contracts,
+            avg_price_cents=avg_price_cents,
+            exposure_dollars=exposure,
+            raw=payload,
+        )
+
+
+@dataclass(slots=True, eq=False)
+class Market:
+    ticker: str
+    event_ticker: str
+    status: str
+    close_ts: datetime | None
+    floor_strike: float | None
+    cap_strike: float | None
+    text: str  # title/subtitle/rules joined, for strike parsing when strikes are absent
+    raw: dict[str, Any]
+
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> "Market":
+        return cls(
+            ticker=str(payload.get("ticker") or payload.get("market_ticker") or ""),
+            event_ticker=str(payload.get("event_ticker") or ""),
+            status=str(payload.get("status") or "").lower(),
+            close_ts=_parse_timestamp(payload.get("close_time") or payload.get("close_ts")),
+            floor_strike=_to_float(payload.get("floor_strike")),
+            cap_strike=_to_float(payload.get("cap_strike")),
+            text=" ".join(
+                str(payload.get(k, ""))
+                for k in ["title", "subtitle", "yes_sub_title", "no_sub_title", "rules_primary", "rules"]
+            ),
+            raw=payload,
+        )
+
+
+def as_order(order: Order | dict[str, Any]) -> Order:
+    return order if isinstance(order, Order) else Order.from_api(order)
+
+
+def as_position(position: Position | dict[str, Any]) -> Position:
+    return position if isinstance(position, Position) else Position.from_api(position)
+
+
+def as_market(market: Market | dict[str, Any]) -> Market:
+    return market if isinstance(market, Market) else Market.from_api(market)
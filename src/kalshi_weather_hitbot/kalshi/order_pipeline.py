@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from kalshi_weather_hitbot.kalshi.client import APIError
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class SubmitOutcome:
+    response: dict[str, Any] | None
+    error: APIError | None
+    latency_ms: float
+
+
+@dataclass
+class OrderSubmitStats:
+    submitted: int = 0
+    errors: int = 0
+    peak_in_flight: int = 0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    @classmethod
+    def from_outcomes(cls, outcomes: list[SubmitOutcome], peak_in_flight: int = 0) -> "OrderSubmitStats":
+        latencies = [o.latency_ms for o in outcomes]
+        return cls(
+            submitted=len(outcomes),
+            errors=sum(1 for o in outcomes if o.error is not None),
+            peak_in_flight=peak_in_flight,
+            avg_latency_ms=sum(latencies) / len(latencies) if latencies else 0.0,
+            max_latency_ms=max(latencies, default=0.0),
+        )
+
+
+# Runs order submissions on a bounded worker pool. Items start strictly in the
+# order given (callers pass them highest priority first) with at most
+# max_in_flight round-trips outstanding; results come back in input order.
+# Callers reserve exposure and cash before handing orders over, so completion
+# order never affects cap or cash-floor checks.
+class OrderSubmitPipeline(Generic[T]):
+    def __init__(self, max_in_flight: int = 4, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.peak_in_flight = 0
+
+    def submit_all(self, items: list[T], submit: Callable[[T], dict[str, Any] | None]) -> list[SubmitOutcome]:
+        if not items:
+            return []
+        if self.max_in_flight == 1 or len(items) == 1:
+            return [self._submit_one(submit, item) for item in items]
+        workers = min(self.max_in_flight, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="order-submit") as pool:
+            futures = [pool.submit(self._submit_one, submit, item) for item in items]
+            return [f.result() for f in futures]
+
+    def _submit_one(self, submit: Callable[[T], dict[str, Any] | None], item: T) -> SubmitOutcome:
+        with self._lock:
+            self._in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        started = self.clock()
+        try:
+            response, error = submit(item), None
+        except APIError as exc:
+            response, error = None, exc
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        return SubmitOutcome(response, error, (self.clock() - started) * 1000.0)
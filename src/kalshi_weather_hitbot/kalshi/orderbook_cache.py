@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from kalshi_weather_hitbot.kalshi.models import OrderBookTop, normalize_orderbook
+
+
+# Maximum book age (seconds) each consumer accepts; None = any book fetched this cycle.
+DEFAULT_MAX_AGE_BY_USE: dict[str, float | None] = {
+    "entry": None,
+    "maintenance": None,
+    "exit": 5.0,
+    "retry": 1.0,
+}
+
+
+@dataclass
+class OrderbookCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale_refreshes: int = 0
+    single_flight_waits: int = 0
+    errors: int = 0
+
+
+class _InFlight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.book: OrderBookTop | None = None
+        self.error: BaseException | None = None
+
+
+class OrderbookCache:
+    def __init__(
+        self,
+        fetch: Callable[[str], dict[str, Any]],
+        max_age_by_use: dict[str, float | None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.fetch = fetch
+        self.max_age_by_use = {**DEFAULT_MAX_AGE_BY_USE, **(max_age_by_use or {})}
+        self.clock = clock
+        self._books: dict[str, tuple[float, OrderBookTop]] = {}
+        self._inflight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+        self._stats = OrderbookCacheStats()
+
+    def get(self, ticker: str, use: str = "entry") -> OrderBookTop:
+        max_age = self.max_age_by_use.get(use)
+        with self._lock:
+            cached = self._books.get(ticker)
+            if cached is not None and (max_age is None or self.clock() - cached[0] <= max_age):
+                self._stats.hits += 1
+                return cached[1]
+            flight = self._inflight.get(ticker)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                self._inflight[ticker] = flight
+                self._stats.misses += 1
+                if cached is not None:
+                    self._stats.stale_refreshes += 1
+            else:
+                self._stats.single_flight_waits += 1
+        if not owner:
+            # Another caller is already fetching this ticker; share its result.
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            assert flight.book is not None
+            return flight.book
+        try:
+            book = normalize_orderbook(self.fetch(ticker))
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                self._stats.errors += 1
+                self._inflight.pop(ticker, None)
+            flight.done.set()
+            raise
+        flight.book = book
+        with self._lock:
+            self._books[ticker] = (self.clock(), book)
+            self._inflight.pop(ticker, None)
+        flight.done.set()
+        return book
+
+    def invalidate(self, ticker: str) -> None:
+        with self._lock:
+            self._books.pop(ticker, None)
+
+    def stats(self) -> OrderbookCacheStats:
+        with self._lock:
+            return OrderbookCacheStats(**vars(self._stats))
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import ssl
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+from urllib.parse import urlencode, urlsplit
+
+try:
+    import certifi
+except ImportError:  # pragma: no cover - installed alongside requests
+    certifi = None
+
+
+T = TypeVar("T")
+
+# Idle keep-alive connections older than this are closed instead of reused; load
+# balancers in front of the API drop idle connections after about a minute.
+IDLE_CONNECTION_SECONDS = 30.0
+
+
+class TransportError(OSError):
+    pass
+
+
+class Headers(dict[str, str]):
+    # Response headers; keys are stored lower-cased and looked up case-insensitively.
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return super().get(key.lower(), default)
+
+
+@dataclass
+class HTTPResponse:
+    status_code: int
+    headers: Headers = field(default_factory=Headers)
+    content: bytes = b""
+
+    @property
+    def text(self) -> str:
+        content_type = self.headers.get("content-type", "")
+        charset = "utf-8"
+        for part in content_type.split(";")[1:]:
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                charset = value.strip('"')
+        try:
+            return self.content.decode(charset, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+@dataclass
+class _Connection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    idle_since: float = 0.0
+    reused: bool = False
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _encode_params(params: dict[str, Any] | None) -> str:
+    if not params:
+        return ""
+    return urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)
+
+
+def _decode(content: bytes, encoding: str) -> bytes:
+    encoding = encoding.strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(content)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+    return content
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Headers:
+    headers = Headers()
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise asyncio.IncompleteReadError(line, None)
+        if line in (b"\r\n", b"\n"):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        key = name.strip().lower()
+        value = value.strip()
+        headers[key] = f"{headers[key]}, {value}" if key in headers else value
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(size_line, None)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            await _read_headers(reader)  # trailers
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+async def _read_response(reader: asyncio.StreamReader, method: str, status_line: bytes) -> tuple[HTTPResponse, bool]:
+    # Returns the response and whether the connection can carry another request.
+    while True:
+        version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+        status = int(rest.split(" ", 1)[0])
+        headers = await _read_headers(reader)
+        if not 100 <= status < 200:
+            break
+        status_line = await reader.readline()
+    connection = headers.get("connection", "").lower()
+    keep_alive = "close" not in connection and (version == "HTTP/1.1" or "keep-alive" in connection)
+    if method == "HEAD" or status in (204, 304):
+        content = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        content = await _read_chunked(reader)
+    elif "content-length" in headers:
+        content = await reader.readexactly(int(headers["content-length"]))
+    else:
+        content = await reader.read()
+        keep_alive = False
+    if headers.get("content-encoding"):
+        content = _decode(content, headers["content-encoding"])
+    return HTTPResponse(status, headers, content), keep_alive
+
+
+# Minimal asyncio HTTP/1.1 client: keep-alive connections pooled per host, gzip and
+# chunked bodies, one overall timeout per request. Connections belong to the event
+# loop that opened them, so each loop gets its own pool. The in-flight limit is the
+# caller's job; the pool keeps at most max_idle_per_host idle connections.
+class AsyncHTTPTransport:
+    def __init__(self, headers: dict[str, str] | None = None, max_idle_per_host: int = 8) -> None:
+        self.headers = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive", **(headers or {})}
+        self.max_idle_per_host = max(1, int(max_idle_per_host))
+        self._ssl: ssl.SSLContext | None = None
+        self._pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str, int], list[_Connection]]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _ssl_context(self) -> ssl.SSLContext:
+        if self._ssl is None:
+            self._ssl = ssl.create_default_context(cafile=certifi.where() if certifi is not None else None)
+        return self._ssl
+
+    def _idle(self, key: tuple[str, str, int]) -> list[_Connection]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            return self._pools.setdefault(loop, {}).setdefault(key, [])
+
+    async def _connect(self, key: tuple[str, str, int]) -> _Connection:
+        idle = self._idle(key)
+        now = time.monotonic()
+        while idle:
+            conn = idle.pop()
+            if now - conn.idle_since < IDLE_CONNECTION_SECONDS and not conn.reader.at_eof():
+                conn.reused = True
+                return conn
+            conn.close()
+        scheme, host, port = key
+        tls = self._ssl_context() if scheme == "https" else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=tls, server_hostname=host if tls else None)
+        return _Connection(reader, writer)
+
+    def _release(self, key: tuple[str, str, int], conn: _Connection) -> None:
+        idle = self._idle(key)
+        if len(idle) >= self.max_idle_per_host:
+            conn.close()
+            return
+        conn.idle_since = time.monotonic()
+        idle.append(conn)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HTTPResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise TransportError(f"Unsupported URL: {url}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, _encode_params(params)) if q)
+        if query:
+            target = f"{target}?{query}"
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+        lines = [f"{method.upper()} {target} HTTP/1.1", f"Host: {parts.netloc}"]
+        lines += [f"{k}: {v}" for k, v in {**self.headers, **(headers or {})}.items()]
+        if json_body is not None:
+            lines.append("Content-Type: application/json")
+        if body or method.upper() in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body)}")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+        async def exchange() -> HTTPResponse:
+            while True:
+                conn = await self._connect(key)
+                try:
+                    try:
+                        conn.writer.write(payload)
+                        await conn.writer.drain()
+                        status_line = await conn.reader.readline()
+                    except ConnectionError:
+                        status_line = b""
+                    if not status_line:
+                        conn.close()
+                        # A pooled connection the server had already closed: resend on a
+                        # fresh one. No status line came back, so nothing was processed.
+                        if conn.reused:
+                            continue
+                        raise TransportError(f"Connection closed by {parts.hostname} without a response")
+                    response, keep_alive = await _read_response(conn.reader, method.upper(), status_line)
+                except BaseException:
+                    conn.close()
+                    raise
+                if keep_alive:
+                    self._release(key, conn)
+                else:
+                    conn.close()
+                return response
+
+        try:
+            return await asyncio.wait_for(exchange(), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TransportError(f"Timed out after {timeout}s calling {parts.hostname}") from exc
+        except TransportError:
+            raise
+        except (OSError, EOFError, ValueError, zlib.error) as exc:
+            raise TransportError(f"{type(exc).__name__} calling {parts.hostname}: {exc}") from exc
+
+    async def aclose(self) -> None:
+        # Closes this loop's idle connections.
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pools = self._pools.pop(loop, {})
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _io_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="kalshi-io", daemon=True).start()
+        return _LOOP
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    # Runs a coroutine on the process-wide I/O loop thread and waits for it. Any number
+    # of threads can call this at once; their requests share that loop.
+    loop = _io_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("Blocking Kalshi call made from the client's own I/O loop; await the async client instead")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
@@ -8,7 +8,9 @@ from typing import Any
 import streamlit as st
 
 from kalshi_weather_hitbot.cli import _load_cfg
+from kalshi_weather_hitbot.db import DB
 from kalshi_weather_hitbot.kalshi.client import APIError, KalshiClient
+from kalshi_weather_hitbot.kalshi.models import Order, Position
 from kalshi_weather_hitbot.strategy.risk import compute_open_orders_exposure, compute_positions_exposure
 
 
@@ -100,40 +102,41 @@ def _live_account_snapshot() -> dict[str, Any]:
 
     # Some environments treat "open" and "resting" similarly; dedupe by order id.
     seen_order_ids: set[str] = set()
-    merged_open: list[dict[str, Any]] = []
-    for order in [*open_orders, *resting_orders]:
-        oid = str(order.get("order_id") or order.get("id") or "")
+    merged_open: list[Order] = []
+    for order in map(Order.from_api, [*open_orders, *resting_orders]):
+        oid = order.order_id
         if oid and oid in seen_order_ids:
             continue
         if oid:
             seen_order_ids.add(oid)
         merged_open.append(order)
+    position_records = [Position.from_api(p) for p in positions]
 
     out = {
         "cfg_env": cfg.env,
         "cfg_base_url": cfg.base_url,
         "balance_raw": balance,
-        "positions": positions,
+        "positions": position_records,
         "open_orders": merged_open,
-        "filled_orders": filled_orders,
-        "canceled_orders": canceled_orders,
+        "filled_orders": [Order.from_api(o) for o in filled_orders],
+        "canceled_orders": [Order.from_api(o) for o in canceled_orders],
         "available_balance_dollars": _cents_to_dollars(balance.get("balance")),
         "portfolio_value_dollars": _cents_to_dollars(balance.get("portfolio_value")),
-        "positions_exposure_dollars": compute_positions_exposure(positions),
+        "positions_exposure_dollars": compute_positions_exposure(position_records),
         "open_orders_exposure_dollars": compute_open_orders_exposure(merged_open),
     }
     return out
 
 
-def _strategy_hint(eval_row: dict[str, Any], positions_by_ticker: dict[str, dict[str, Any]], open_by_ticker: dict[str, list[dict[str, Any]]]) -> str:
+def _strategy_hint(eval_row: dict[str, Any], positions_by_ticker: dict[str, Position], open_by_ticker: dict[str, list[Order]]) -> str:
     ticker = str(eval_row.get("market_ticker") or "")
     lock_status = str(eval_row.get("lock_status") or "")
     pos = positions_by_ticker.get(ticker)
     open_orders = open_by_ticker.get(ticker, [])
 
     if pos:
-        side = str(pos.get("side") or pos.get("position_side") or "").upper()
-        qty = pos.get("contracts") or pos.get("position") or 0
+        side = pos.side
+        qty = f"{pos.contracts:g}"
         if lock_status == "LOCKED_NO" and side == "NO":
             return f"HOLD/WAIT EXIT (long NO x{qty})"
         if lock_status == "LOCKED_YES" and side == "YES":
@@ -150,48 +153,39 @@ def _strategy_hint(eval_row: dict[str, Any], positions_by_ticker: dict[str, dict
     return "HOLD (unlocked)"
 
 
-def _positions_table_rows(positions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _positions_table_rows(positions: list[Position]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for p in positions:
-        exposure = p.get("market_exposure_dollars")
+        raw = p.raw
+        exposure = raw.get("market_exposure_dollars")
         if exposure is None:
-            raw_exposure = p.get("market_exposure")
+            raw_exposure = raw.get("market_exposure")
             exposure = f"{_cents_to_dollars(raw_exposure):.2f}" if raw_exposure is not None else None
         rows.append(
             {
-                "ticker": p.get("ticker") or p.get("market_ticker"),
-                "side": p.get("side") or p.get("position_side"),
-                "contracts": p.get("contracts") or p.get("position") or p.get("count"),
-                "avg_price": p.get("avg_price") or p.get("average_price"),
+                "ticker": p.ticker,
+                "side": p.side,
+                "contracts": p.contracts,
+                "avg_price": p.avg_price_cents,
                 "market_exposure": exposure,
-                "realized_pnl": p.get("realized_pnl") or p.get("realized_pnl_dollars"),
-                "unrealized_pnl": p.get("unrealized_pnl") or p.get("unrealized_pnl_dollars"),
+                "realized_pnl": raw.get("realized_pnl") or raw.get("realized_pnl_dollars"),
+                "unrealized_pnl": raw.get("unrealized_pnl") or raw.get("unrealized_pnl_dollars"),
             }
         )
     return rows
 
 
-def _to_float(value: Any) -> float | None:
-    try:
-        if value is None:
-            return None
-        return float(value)
-    except Exception:
-        return None
-
-
-def _position_settlement_estimates(positions: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, float]]:
+def _position_settlement_estimates(positions: list[Position]) -> tuple[list[dict[str, Any]], dict[str, float]]:
     rows: list[dict[str, Any]] = []
     total_cost = 0.0
     total_max_profit = 0.0
     total_max_loss = 0.0
 
     for p in positions:
-        ticker = str(p.get("ticker") or p.get("market_ticker") or "")
-        side = str(p.get("side") or p.get("position_side") or "").upper()
-        contracts_val = _to_float(p.get("contracts") or p.get("position") or p.get("count")) or 0.0
-        contracts = abs(contracts_val)
-        avg_price_cents = _to_float(p.get("avg_price") or p.get("average_price") or p.get("cost_basis"))
+        ticker = p.ticker
+        side = p.side
+        contracts = abs(p.contracts)
+        avg_price_cents = p.avg_price_cents
 
         if contracts <= 0 or side not in {"YES", "NO"}:
             continue
@@ -231,21 +225,22 @@ def _position_settlement_estimates(positions: list[dict[str, Any]]) -> tuple[lis
     return rows, totals
 
 
-def _orders_table_rows(orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _orders_table_rows(orders: list[Order]) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
     for o in orders:
         rows.append(
             {
-                "ticker": o.get("ticker") or o.get("market_ticker"),
-                "status": o.get("status"),
-                "side": o.get("side"),
-                "action": o.get("action"),
-                "count": o.get("remaining_count") or o.get("count") or o.get("count_fp"),
-                "yes_price": o.get("yes_price_dollars") or o.get("yes_price"),
-                "no_price": o.get("no_price_dollars") or o.get("no_price"),
-                "client_order_id": o.get("client_order_id"),
-                "order_id": o.get("order_id") or o.get("id"),
-                "created_time": o.get("created_time"),
+                "ticker": o.ticker,
+                "status": o.status,
+                "side": o.side,
+                "action": o.action,
+                "count": o.remaining_count,
+                "yes_price": o.raw.get("yes_price_dollars") or o.raw.get("yes_price"),
+                "no_price": o.raw.get("no_price_dollars") or o.raw.get("no_price"),
+                "price_cents": o.price_cents,
+                "client_order_id": o.client_order_id,
+                "order_id": o.order_id,
+                "created_time": o.raw.get("created_time"),
             }
         )
     return rows
@@ -267,13 +262,16 @@ def main() -> None:
     if refresh > 0:
         st.markdown(f"<meta http-equiv='refresh' content='{int(refresh)}'>", unsafe_allow_html=True)
 
+    if db_path.exists():
+        # Brings older databases up to the current schema (promoted columns + indexes).
+        DB(str(db_path))
     total_cities, usable_cities, skipped_cities = _load_city_health(cities_path)
     total_orders = _scalar(db_path, "SELECT COUNT(*) FROM orders")
     submitted_orders = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status = 'SUBMITTED'")
     dry_run_orders = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status = 'DRY_RUN'")
     total_evals = _scalar(db_path, "SELECT COUNT(*) FROM run_evaluations")
-    total_submitted_buy = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status='SUBMITTED' AND lower(json_extract(request_json, '$.action'))='buy'")
-    total_submitted_sell = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status='SUBMITTED' AND lower(json_extract(request_json, '$.action'))='sell'")
+    total_submitted_buy = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status='SUBMITTED' AND action='buy'")
+    total_submitted_sell = _scalar(db_path, "SELECT COUNT(*) FROM orders WHERE status='SUBMITTED' AND action='sell'")
 
     live: dict[str, Any] | None = None
     live_error: str | None = None
@@ -373,19 +371,14 @@ def main() -> None:
     )
 
     st.subheader("Strategy View (Latest Evaluations + Live State)")
-    positions_by_ticker: dict[str, dict[str, Any]] = {}
-    open_by_ticker: dict[str, list[dict[str, Any]]] = {}
+    positions_by_ticker: dict[str, Position] = {}
+    open_by_ticker: dict[str, list[Order]] = {}
     if live:
-        positions_by_ticker = {
-            str(p.get("ticker") or p.get("market_ticker") or ""): p
-            for p in live["positions"]
-            if p.get("ticker") or p.get("market_ticker")
-        }
+        positions_by_ticker = {p.ticker: p for p in live["positions"] if p.ticker}
         for order in live["open_orders"]:
-            t = str(order.get("ticker") or order.get("market_ticker") or "")
-            if not t:
+            if not order.ticker:
                 continue
-            open_by_ticker.setdefault(t, []).append(order)
+            open_by_ticker.setdefault(order.ticker, []).append(order)
 
     strategy_rows: list[dict[str, Any]] = []
     for row in recent_evals[: min(len(recent_evals), int(row_limit))]:
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from kalshi_weather_hitbot.config import FeesConfig, RiskConfig
+from kalshi_weather_hitbot.kalshi.models import OrderBookTop
+from kalshi_weather_hitbot.kalshi.pricing import quantize_price
+from kalshi_weather_hitbot.strategy.execution import ExecutionDecision, select_order
+from kalshi_weather_hitbot.strategy.fees import MAKER_FEE_RATE, kalshi_fee_cents
+from kalshi_weather_hitbot.strategy.maker import maker_first_entry_price
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install kalshi-weather-hitbot[fast]
+    np = None
+
+
+# Batch counterpart of select_order + maker repricing + entry priority for a whole
+# cycle's candidates. With NumPy the gates, fees and EV are computed as array ops
+# (same float64 arithmetic, truncation and half-even rounding as the scalar code, so
+# decisions and reason strings are identical); without it every candidate goes
+# through the scalar functions.
+
+_TRADE = 0
+_REASONS = (
+    "",
+    "Not locked",
+    "Confidence below gate",
+    "Missing orderbook prices",
+    "Spread too wide",
+    "Insufficient liquidity",
+    "Price above edge-adjusted threshold",
+    "Net edge below threshold",
+)
+_NET_EDGE = _REASONS.index("Net edge below threshold")
+
+
+@dataclass
+class EntryBatch:
+    decisions: list[ExecutionDecision]
+    # Same key as the run loop's per-entry sort: (net EV per cost cent, ask size, -close time).
+    priority_keys: list[tuple[float, int, float]]
+
+
+def _maker_fee_enabled(fees_cfg: FeesConfig | None) -> bool:
+    return bool(fees_cfg and fees_cfg.enabled and fees_cfg.assume_maker_fee)
+
+
+def _side_confidence(p_yes: float, side_yes: bool) -> float:
+    return p_yes if side_yes else (1 - p_yes)
+
+
+def _apply_maker_price(
+    decision: ExecutionDecision,
+    p_yes: float,
+    book: OrderBookTop,
+    risk: RiskConfig,
+    fees_cfg: FeesConfig | None,
+) -> None:
+    confidence = _side_confidence(p_yes, decision.side == "YES")
+    max_allowed = int((confidence - risk.edge_buffer) * 100)
+    maker = maker_first_entry_price(str(decision.side), book, max_allowed, risk)
+    if maker.should_place and maker.price_cents is not None:
+        decision.price_cents = maker.price_cents
+        decision.expected_fee_cents = (
+            kalshi_fee_cents(int(decision.price_cents), 1, "maker") if _maker_fee_enabled(fees_cfg) else 0
+        )
+        decision.expected_net_ev_cents = int(round(confidence * 100)) - int(decision.price_cents) - int(decision.expected_fee_cents)
+
+
+def _priority_key(decision: ExecutionDecision, book: OrderBookTop, close_ts: datetime) -> tuple[float, int, float]:
+    net_ev_cents = int(decision.expected_net_ev_cents or 0)
+    total_cost_cents = max(1, int(decision.price_cents or 0) + int(decision.expected_fee_cents or 0))
+    liquidity_size = int(book.yes_ask_size if decision.side == "YES" else book.no_ask_size)
+    return (net_ev_cents / total_cost_cents, liquidity_size, -close_ts.timestamp())
+
+
+def _np_maker_fee_cents(price_cents):
+    # kalshi_fee_cents(price, 1, "maker") elementwise.
+    p = np.clip(price_cents / 100.0, 0.0, 1.0)
+    fee_dollars = np.ceil(MAKER_FEE_RATE * 1 * p * (1 - p) * 100) / 100.0
+    return np.rint(fee_dollars * 100).astype(np.int64)
+
+
+def _np_cents(values: list[int | None]):
+    missing = np.array([v is None for v in values], dtype=bool)
+    cents = np.array([0 if v is None else int(v) for v in values], dtype=np.int64)
+    return cents, missing
+
+
+def _np_book_side(books: Sequence[OrderBookTop], side_yes: list[bool]):
+    asks, ask_missing = _np_cents([b.best_yes_ask_cents if y else b.best_no_ask_cents for b, y in zip(books, side_yes)])
+    bids, bid_missing = _np_cents([b.best_yes_bid_cents if y else b.best_no_bid_cents for b, y in zip(books, side_yes)])
+    sizes = np.array([b.yes_ask_size if y else b.no_ask_size for b, y in zip(books, side_yes)], dtype=np.int64)
+    return asks, ask_missing, bids, bid_missing, sizes
+
+
+def _select_orders_numpy(
+    lock_statuses: Sequence[str],
+    p_yes: Sequence[float],
+    books: Sequence[OrderBookTop],
+    risk: RiskConfig,
+    model_probs: Sequence[float | None] | None,
+    fees_cfg: FeesConfig | None,
+) -> list[ExecutionDecision]:
+    side_yes = [s == "LOCKED_YES" for s in lock_statuses]
+    unlocked = np.array([s == "UNLOCKED" for s in lock_statuses], dtype=bool)
+    yes = np.array(side_yes, dtype=bool)
+    p = np.asarray(p_yes, dtype=np.float64)
+    confidence = np.where(yes, p, 1 - p)
+    if model_probs is not None:
+        has_model = np.array([m is not None for m in model_probs], dtype=bool)
+        model = np.array([0.0 if m is None else float(m) for m in model_probs], dtype=np.float64)
+        confidence = np.where(has_model, model, confidence)
+
+    asks, ask_missing, bids, bid_missing, sizes = _np_book_side(books, side_yes)
+    max_price_cents = np.trunc((confidence - risk.edge_buffer) * 100).astype(np.int64)
+    fees = _np_maker_fee_cents(asks) if _maker_fee_enabled(fees_cfg) else np.zeros(len(asks), dtype=np.int64)
+    net_ev = np.rint(confidence * 100).astype(np.int64) - asks - fees
+    net_edge_gate = bool(fees_cfg and fees_cfg.enabled)
+
+    codes = np.select(
+        [
+            unlocked,
+            confidence < risk.p_confidence_gate,
+            ask_missing | bid_missing,
+            (asks - bids) > risk.max_spread_cents,
+            sizes < risk.min_liquidity_contracts,
+            asks > max_price_cents,
+            (net_ev < risk.min_net_edge_cents) & net_edge_gate,
+        ],
+        list(range(1, len(_REASONS))),
+        default=_TRADE,
+    ).tolist()
+
+    asks_l, fees_l, net_ev_l = asks.tolist(), fees.tolist(), net_ev.tolist()
+    out: list[ExecutionDecision] = []
+    for i, code in enumerate(codes):
+        if code == _TRADE:
+            out.append(
+                ExecutionDecision(
+                    True,
+                    side="YES" if side_yes[i] else "NO",
+                    action="BUY",
+                    price_cents=quantize_price(asks_l[i], tick_size=1, side="buy"),
+                    reason=f"Locked and edge positive (net_ev_cents={net_ev_l[i]})",
+                    expected_net_ev_cents=net_ev_l[i],
+                    expected_fee_cents=fees_l[i],
+                )
+            )
+        elif code == _NET_EDGE:
+            out.append(
+                ExecutionDecision(
+                    False,
+                    reason=_REASONS[code],
+                    expected_net_ev_cents=net_ev_l[i],
+                    expected_fee_cents=fees_l[i],
+                )
+            )
+        else:
+            out.append(ExecutionDecision(False, reason=_REASONS[code]))
+    return out
+
+
+def _apply_maker_prices_numpy(
+    decisions: list[ExecutionDecision],
+    p_yes: Sequence[float],
+    books: Sequence[OrderBookTop],
+    risk: RiskConfig,
+    fees_cfg: FeesConfig | None,
+) -> None:
+    idx = [i for i, d in enumerate(decisions) if d.should_trade]
+    if not idx:
+        return
+    side_yes = [decisions[i].side == "YES" for i in idx]
+    p = np.array([p_yes[i] for i in idx], dtype=np.float64)
+    confidence = np.where(np.array(side_yes, dtype=bool), p, 1 - p)
+    asks, ask_missing, bids, bid_missing, _sizes = _np_book_side([books[i] for i in idx], side_yes)
+
+    max_allowed = np.trunc((confidence - risk.edge_buffer) * 100).astype(np.int64)
+    maker_price = np.minimum(asks - 1, max_allowed)
+    placed = ~ask_missing & (maker_price >= 1) & ~(~bid_missing & ((maker_price - bids) > risk.max_spread_cents))
+    fees = _np_maker_fee_cents(maker_price) if _maker_fee_enabled(fees_cfg) else np.zeros(len(idx), dtype=np.int64)
+    net_ev = np.rint(confidence * 100).astype(np.int64) - maker_price - fees
+
+    for i, ok, price, fee, ev in zip(idx, placed.tolist(), maker_price.tolist(), fees.tolist(), net_ev.tolist()):
+        if ok:
+            decision = decisions[i]
+            decision.price_cents = price
+            decision.expected_fee_cents = fee
+            decision.expected_net_ev_cents = ev
+
+
+def _priority_keys_numpy(
+    decisions: list[ExecutionDecision],
+    books: Sequence[OrderBookTop],
+    close_ts: Sequence[datetime],
+) -> list[tuple[float, int, float]]:
+    net_ev = np.array([int(d.expected_net_ev_cents or 0) for d in decisions], dtype=np.int64)
+    cost = np.maximum(
+        1,
+        np.array([int(d.price_cents or 0) + int(d.expected_fee_cents or 0) for d in decisions], dtype=np.int64),
+    )
+    ratios = (net_ev / cost).tolist()
+    return [
+        (ratio, int(book.yes_ask_size if d.side == "YES" else book.no_ask_size), -ts.timestamp())
+        for ratio, d, book, ts in zip(ratios, decisions, books, close_ts)
+    ]
+
+
+def select_orders(
+    lock_statuses: Sequence[str],
+    p_yes: Sequence[float],
+    books: Sequence[OrderBookTop],
+    risk: RiskConfig,
+    model_probs: Sequence[float | None] | None = None,
+    fees_cfg: FeesConfig | None = None,
+) -> list[ExecutionDecision]:
+    if not books:
+        return []
+    if np is not None:
+        return _select_orders_numpy(lock_statuses, p_yes, books, risk, model_probs, fees_cfg)
+    probs = model_probs if model_probs is not None else [None] * len(books)
+    return [
+        select_order(status, p, book, risk, model_prob=model_prob, fees_cfg=fees_cfg)
+        for status, p, book, model_prob in zip(lock_statuses, p_yes, books, probs)
+    ]
+
+
+def decide_entries(
+    lock_statuses: Sequence[str],
+    p_yes: Sequence[float],
+    books: Sequence[OrderBookTop],
+    close_ts: Sequence[datetime],
+    risk: RiskConfig,
+    fees_cfg: FeesConfig | None = None,
+) -> EntryBatch:
+    # select_order gates, then maker-first repricing of tradable entries, then priority keys.
+    decisions = select_orders(lock_statuses, p_yes, books, risk, fees_cfg=fees_cfg)
+    if np is not None and decisions:
+        _apply_maker_prices_numpy(decisions, p_yes, books, risk, fees_cfg)
+        return EntryBatch(decisions, _priority_keys_numpy(decisions, books, close_ts))
+    for decision, p, book in zip(decisions, p_yes, books):
+        if decision.should_trade:
+            _apply_maker_price(decision, p, book, risk, fees_cfg)
+    return EntryBatch(decisions, [_priority_key(d, b, ts) for d, b, ts in zip(decisions, books, close_ts)])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from collections.abc import Callable
 from pathlib import Path
 
@@ -24,6 +25,156 @@ def _bucket_label(hours_to_close: float, buckets_hours_to_close: list[float]) ->
     return float(max(buckets_hours_to_close))
 
 
+def _settlement_won(market_result: str | None, side: str) -> bool | None:
+    # Win = held side matched settlement market result.
+    result = str(market_result or "").upper()
+    if result in {"YES", "NO"}:
+        return result == side
+    if result in {"1", "TRUE"}:
+        return side == "YES"
+    if result in {"0", "FALSE"}:
+        return side == "NO"
+    return None
+
+
+def _resolve_outcome(con: sqlite3.Connection, ticker: str) -> tuple[str, float, bool] | None:
+    # Latest buy order and latest locked evaluation for the ticker; both lookups
+    # are served by the (market_ticker, id) indexes.
+    order = con.execute(
+        """SELECT side FROM orders
+        WHERE market_ticker = ? AND action = 'buy' AND side IN ('yes', 'no')
+        ORDER BY id DESC LIMIT 1""",
+        (ticker,),
+    ).fetchone()
+    if order is None:
+        return None
+    evaluation = con.execute(
+        """SELECT hours_to_close, city_key FROM run_evaluations
+        WHERE market_ticker = ? AND lock_status IN ('LOCKED_YES', 'LOCKED_NO') AND hours_to_close IS NOT NULL
+        ORDER BY id DESC LIMIT 1""",
+        (ticker,),
+    ).fetchone()
+    if evaluation is None:
+        return None
+    side = str(order[0]).upper()
+    for (market_result,) in con.execute(
+        "SELECT market_result FROM settlements WHERE ticker = ? AND market_result IS NOT NULL ORDER BY id DESC",
+        (ticker,),
+    ):
+        won = _settlement_won(market_result, side)
+        if won is not None:
+            return (str(evaluation[1] or ""), float(evaluation[0]), won)
+    return None
+
+
+def _buckets_key(buckets_hours_to_close: list[float]) -> str:
+    return json.dumps(sorted(float(b) for b in buckets_hours_to_close))
+
+
+def _bump_count(con: sqlite3.Connection, city_key: str, bucket: float, won: bool, delta: int = 1) -> None:
+    con.execute(
+        """INSERT INTO calibration_counts(city_key, bucket, wins, losses) VALUES (?, ?, ?, ?)
+        ON CONFLICT(city_key, bucket) DO UPDATE SET
+          wins = wins + excluded.wins,
+          losses = losses + excluded.losses""",
+        (city_key, bucket, delta * int(won), delta * int(not won)),
+    )
+
+
+def _record_outcome(con: sqlite3.Connection, ticker: str, buckets_hours_to_close: list[float]) -> bool:
+    # Upserts the ticker's outcome; a corrected settlement moves its count over.
+    outcome = _resolve_outcome(con, ticker)
+    if outcome is None:
+        return False
+    city_key, hours_to_close, won = outcome
+    previous = con.execute(
+        "SELECT city_key, hours_to_close, won FROM calibration_outcomes WHERE ticker = ?", (ticker,)
+    ).fetchone()
+    if previous is not None:
+        if (previous[0], float(previous[1]), bool(previous[2])) == outcome:
+            return False
+        _bump_count(con, previous[0], _bucket_label(previous[1], buckets_hours_to_close), bool(previous[2]), delta=-1)
+    con.execute(
+        """INSERT INTO calibration_outcomes(ticker, city_key, hours_to_close, won) VALUES (?, ?, ?, ?)
+        ON CONFLICT(ticker) DO UPDATE SET
+          city_key = excluded.city_key,
+          hours_to_close = excluded.hours_to_close,
+          won = excluded.won""",
+        (ticker, city_key, hours_to_close, int(won)),
+    )
+    _bump_count(con, city_key, _bucket_label(hours_to_close, buckets_hours_to_close), won)
+    return True
+
+
+def _settled_tickers(con: sqlite3.Connection) -> list[str]:
+    return [t for (t,) in con.execute("SELECT DISTINCT ticker FROM settlements WHERE ticker IS NOT NULL").fetchall()]
+
+
+def _ensure_calibration_store(con: sqlite3.Connection, buckets_hours_to_close: list[float]) -> int:
+    row = con.execute("SELECT value FROM calibration_meta WHERE key = 'buckets'").fetchone()
+    wanted = _buckets_key(buckets_hours_to_close)
+    seeded = 0
+    if row is None:
+        # First use on this database: seed from every settled ticker once.
+        con.execute("DELETE FROM calibration_outcomes")
+        con.execute("DELETE FROM calibration_counts")
+        for ticker in _settled_tickers(con):
+            seeded += int(_record_outcome(con, ticker, buckets_hours_to_close))
+    elif row[0] != wanted:
+        # Bucket edges changed: re-bucket the stored per-ticker outcomes.
+        con.execute("DELETE FROM calibration_counts")
+        for city_key, hours_to_close, won in con.execute(
+            "SELECT city_key, hours_to_close, won FROM calibration_outcomes"
+        ).fetchall():
+            _bump_count(con, city_key, _bucket_label(hours_to_close, buckets_hours_to_close), bool(won))
+    else:
+        return 0
+    con.execute(
+        "INSERT INTO calibration_meta(key, value) VALUES ('buckets', ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (wanted,),
+    )
+    return seeded
+
+
+def record_settlement_outcomes(db: DB, tickers: list[str], buckets_hours_to_close: list[float]) -> int:
+    # Returns how many per-ticker outcomes were stored or corrected.
+    with db.transaction() as con:
+        recorded = _ensure_calibration_store(con, buckets_hours_to_close)
+        for ticker in dict.fromkeys(t for t in tickers if t):
+            recorded += int(_record_outcome(con, ticker, buckets_hours_to_close))
+    return recorded
+
+
+def _load_counts(con: sqlite3.Connection, buckets_hours_to_close: list[float]) -> list[tuple[str, float, int, int]]:
+    # Read-only: materialized counts when they match the configured buckets, otherwise
+    # aggregated here from stored outcomes (or, before the first settlement sync, from
+    # the settlements themselves).
+    row = con.execute("SELECT value FROM calibration_meta WHERE key = 'buckets'").fetchone()
+    if row is not None and row[0] == _buckets_key(buckets_hours_to_close):
+        return [
+            (city_key, float(bucket), int(wins), int(losses))
+            for city_key, bucket, wins, losses in con.execute(
+                "SELECT city_key, bucket, wins, losses FROM calibration_counts"
+            ).fetchall()
+        ]
+    if row is not None:
+        outcomes = [
+            (city_key, float(hours_to_close), bool(won))
+            for city_key, hours_to_close, won in con.execute(
+                "SELECT city_key, hours_to_close, won FROM calibration_outcomes"
+            ).fetchall()
+        ]
+    else:
+        outcomes = [o for o in (_resolve_outcome(con, t) for t in _settled_tickers(con)) if o is not None]
+    counts: dict[tuple[str, float], tuple[int, int]] = {}
+    for city_key, hours_to_close, won in outcomes:
+        key = (city_key, _bucket_label(hours_to_close, buckets_hours_to_close))
+        wins, losses = counts.get(key, (0, 0))
+        counts[key] = (wins + int(won), losses + int(not won))
+    return [(city_key, bucket, wins, losses) for (city_key, bucket), (wins, losses) in counts.items()]
+
+
 def build_lock_calibration(
     db_path: str,
     by_city: bool,
@@ -34,65 +185,13 @@ def build_lock_calibration(
     min_samples_per_bucket: int = 5,
 ) -> Callable[[str | None, float, str, float], float]:
     db = DB(db_path)
-    rows: list[tuple[str, str | None, str | None, str | None]] = []
-    with db.connect() as con:
-        query = """
-            SELECT s.ticker, s.market_result, o.request_json, e.raw_payload
-            FROM settlements s
-            LEFT JOIN orders o ON o.market_ticker = s.ticker
-            LEFT JOIN run_evaluations e ON e.market_ticker = s.ticker
-            ORDER BY s.id DESC, o.id DESC, e.id DESC
-        """
-        rows = list(con.execute(query).fetchall())
-
-    # Collapse to most recent order/eval per ticker with a buy side and lock context.
-    per_ticker: dict[str, tuple[str, str | None, float]] = {}
-    for ticker, market_result, request_json, eval_raw in rows:
-        if not ticker or ticker in per_ticker:
-            continue
-        if not request_json or not eval_raw or not market_result:
-            continue
-        try:
-            req = json.loads(request_json)
-            ev = json.loads(eval_raw)
-        except json.JSONDecodeError:
-            continue
-        if str(req.get("action") or "").lower() != "buy":
-            continue
-        side = str(req.get("side") or "").upper()
-        if side not in {"YES", "NO"}:
-            continue
-        lock_status = str(ev.get("lock_status") or "")
-        if lock_status not in {"LOCKED_YES", "LOCKED_NO"}:
-            continue
-        try:
-            hours_to_close = float(ev.get("hours_to_close"))
-        except (TypeError, ValueError):
-            continue
-        # Win = held side matched settlement market result.
-        result = str(market_result).upper()
-        if result in {"YES", "NO"}:
-            won = result == side
-        elif result in {"1", "TRUE"}:
-            won = side == "YES"
-        elif result in {"0", "FALSE"}:
-            won = side == "NO"
-        else:
-            continue
-        city_key = str(ev.get("city_key") or "") or None
-        key_city = city_key if by_city else None
-        bucket = _bucket_label(hours_to_close, buckets_hours_to_close)
-        per_ticker[ticker] = ("1" if won else "0", key_city, bucket)
-
     counts: dict[tuple[str | None, float], tuple[int, int]] = {}
-    for won_str, city_key, bucket in per_ticker.values():
-        key = (city_key, float(bucket))
-        wins, losses = counts.get(key, (0, 0))
-        if won_str == "1":
-            wins += 1
-        else:
-            losses += 1
-        counts[key] = (wins, losses)
+    with db.connect() as con:
+        rows = _load_counts(con, buckets_hours_to_close)
+    for city_key, bucket, wins, losses in rows:
+        key = ((city_key or None) if by_city else None, bucket)
+        prev_wins, prev_losses = counts.get(key, (0, 0))
+        counts[key] = (prev_wins + wins, prev_losses + losses)
 
     prior_mean = beta_posterior_mean(prior_alpha, prior_beta, 0, 0)
 
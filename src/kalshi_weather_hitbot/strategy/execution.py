@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from kalshi_weather_hitbot.config import FeesConfig, RiskConfig
-from kalshi_weather_hitbot.kalshi.models import OrderBookTop
+from kalshi_weather_hitbot.kalshi.models import OrderBookTop, Position, as_position
 from kalshi_weather_hitbot.kalshi.pricing import quantize_price
 from kalshi_weather_hitbot.strategy.fees import fee_per_contract_cents, kalshi_fee_cents
 
@@ -84,7 +84,7 @@ def select_order(
 
 
 def select_exit_order(
-    position: dict[str, Any],
+    position: Position | dict[str, Any],
     book: OrderBookTop,
     risk: RiskConfig,
     fees_cfg: FeesConfig | None = None,
@@ -92,8 +92,9 @@ def select_exit_order(
     if not risk.enable_exit_sells:
         return ExecutionDecision(False, reason="Exit sells disabled")
 
-    side = str(position.get("side") or position.get("position_side") or "").upper()
-    contracts = int(position.get("contracts") or position.get("position") or 0)
+    record = as_position(position)
+    side = record.side
+    contracts = int(record.contracts)
     if contracts <= 0 or side not in {"YES", "NO"}:
         return ExecutionDecision(False, reason="No long position to exit")
 
@@ -108,7 +109,7 @@ def select_exit_order(
     if (best_ask - exit_bid) > risk.max_spread_cents:
         return ExecutionDecision(False, reason="Spread too wide for safe exit")
 
-    entry_price = int(position.get("avg_price") or position.get("average_price") or 0)
+    entry_price = int(record.avg_price_cents or 0)
     if exit_bid < risk.take_profit_cents:
         return ExecutionDecision(False, reason="Take-profit not reached")
     if entry_price:
@@ -3,12 +3,16 @@ from __future__ import annotations
 import math
 from typing import Literal
 
+# Kalshi fee = ceil(rate * contracts * P * (1 - P)) dollars, P the price in dollars.
+TAKER_FEE_RATE = 0.07
+MAKER_FEE_RATE = 0.0175
+
 
 def kalshi_fee_cents(price_cents: int, contracts: int, fee_kind: Literal["taker", "maker"]) -> int:
     if contracts <= 0:
         return 0
     p = max(0.0, min(1.0, price_cents / 100.0))
-    coeff = 0.0175 if fee_kind == "maker" else 0.07
+    coeff = MAKER_FEE_RATE if fee_kind == "maker" else TAKER_FEE_RATE
     fee_dollars = math.ceil(coeff * contracts * p * (1 - p) * 100) / 100.0
     return int(round(fee_dollars * 100))
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
+from typing import Generic, TypeVar
 
 
 @dataclass
@@ -52,3 +56,88 @@ def evaluate_lock(
     if conservative_min > bracket_high or conservative_max < bracket_low:
         return LockEval("LOCKED_NO", p_no_locked, min_possible, max_possible)
     return LockEval("UNLOCKED", 0.5, min_possible, max_possible)
+
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass
+class LadderSplit(Generic[K]):
+    locked_yes: list[K]
+    locked_no: list[K]
+    unlocked: list[K]
+
+
+# The brackets of one city/day event, sorted by (low, high) with open ends at -inf/+inf.
+# All brackets share one observation window, so a single conservative [min, max]
+# interval classifies the whole event: on a non-nested ladder (highs rise with lows)
+# LOCKED_NO is a prefix plus a suffix and LOCKED_YES a contiguous run, found by
+# binary search. Nested/overlapping ladders fall back to evaluate_lock's per-bracket
+# rules; both paths agree with evaluate_lock bracket for bracket.
+class BracketLadder(Generic[K]):
+    def __init__(self, brackets: Iterable[tuple[K, float | None, float | None]]) -> None:
+        self._unbounded: list[K] = []
+        entries: list[tuple[float, float, K]] = []
+        for key, low, high in brackets:
+            if low is None and high is None:
+                self._unbounded.append(key)
+                continue
+            entries.append((-math.inf if low is None else float(low), math.inf if high is None else float(high), key))
+        entries.sort(key=lambda e: (e[0], e[1]))
+        self._lows = [e[0] for e in entries]
+        self._highs = [e[1] for e in entries]
+        self._keys = [e[2] for e in entries]
+        self._monotone = all(low <= high for low, high in zip(self._lows, self._highs)) and all(
+            a <= b for a, b in zip(self._highs, self._highs[1:])
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._unbounded)
+
+    def split(self, conservative_min: float, conservative_max: float) -> LadderSplit[K]:
+        if not self._monotone or not conservative_min <= conservative_max:
+            return self._split_linear(conservative_min, conservative_max)
+        keys = self._keys
+        no_below = bisect_left(self._highs, conservative_min)  # high < min
+        no_above = bisect_right(self._lows, conservative_max)  # low > max from here on
+        yes_start = max(no_below, bisect_left(self._highs, conservative_max))  # high >= max
+        yes_end = max(yes_start, min(no_above, bisect_right(self._lows, conservative_min)))  # low <= min
+        return LadderSplit(
+            locked_yes=keys[yes_start:yes_end],
+            locked_no=keys[:no_below] + keys[no_above:],
+            unlocked=keys[no_below:yes_start] + keys[yes_end:no_above] + self._unbounded,
+        )
+
+    def _split_linear(self, conservative_min: float, conservative_max: float) -> LadderSplit[K]:
+        out: LadderSplit[K] = LadderSplit([], [], list(self._unbounded))
+        for low, high, key in zip(self._lows, self._highs, self._keys):
+            if conservative_min >= low and conservative_max <= high:
+                out.locked_yes.append(key)
+            elif conservative_min > high or conservative_max < low:
+                out.locked_no.append(key)
+            else:
+                out.unlocked.append(key)
+        return out
+
+    def evaluate(
+        self,
+        observed_max: float,
+        forecast_max_remaining: float,
+        safety_bias_f: float = 3.0,
+        p_yes_locked: float = 0.99,
+        p_no_locked: float = 0.01,
+        station_uncertainty_f: float = 0.5,
+    ) -> dict[K, LockEval]:
+        # Same inputs and interval as evaluate_lock, for every bracket of the event.
+        min_possible = observed_max
+        max_possible = max(observed_max, forecast_max_remaining + safety_bias_f)
+        split = self.split(min_possible - station_uncertainty_f, max_possible + station_uncertainty_f)
+        out: dict[K, LockEval] = {}
+        for keys, status, p_yes in (
+            (split.locked_yes, "LOCKED_YES", p_yes_locked),
+            (split.locked_no, "LOCKED_NO", p_no_locked),
+            (split.unlocked, "UNLOCKED", 0.5),
+        ):
+            for key in keys:
+                out[key] = LockEval(status, p_yes, min_possible, max_possible)
+        return out
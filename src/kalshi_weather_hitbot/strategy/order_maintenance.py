@@ -1,61 +1,22 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from decimal import Decimal, InvalidOperation
+from datetime import datetime
 from typing import Any
 
+from kalshi_weather_hitbot.kalshi.models import Order, as_order, order_price_cents
 
-def _parse_cents_from_dollar_like(value: Any) -> int | None:
-    if value is None:
-        return None
-    try:
-        dec = Decimal(str(value))
-    except (InvalidOperation, ValueError, TypeError):
-        return None
-    return int((dec * 100).quantize(Decimal("1")))
 
+def parse_order_price_cents(order: Order | dict[str, Any]) -> int | None:
+    if isinstance(order, Order):
+        return order.price_cents
+    return order_price_cents(order)
 
-def parse_order_price_cents(order: dict[str, Any]) -> int | None:
-    side = str(order.get("side") or "").lower()
-    if side == "yes":
-        for key in ("yes_price", "price"):
-            if order.get(key) is not None:
-                return int(order[key])
-        for key in ("yes_price_dollars", "price_dollars"):
-            cents = _parse_cents_from_dollar_like(order.get(key))
-            if cents is not None:
-                return cents
-        return None
-    if side == "no":
-        for key in ("no_price", "price"):
-            if order.get(key) is not None:
-                return int(order[key])
-        for key in ("no_price_dollars", "price_dollars"):
-            cents = _parse_cents_from_dollar_like(order.get(key))
-            if cents is not None:
-                return cents
-        return None
-    for key in ("yes_price", "no_price", "price"):
-        if order.get(key) is not None:
-            return int(order[key])
-    for key in ("yes_price_dollars", "no_price_dollars", "price_dollars"):
-        cents = _parse_cents_from_dollar_like(order.get(key))
-        if cents is not None:
-            return cents
-    return None
 
-
-def order_age_seconds(order: dict[str, Any], now_utc: datetime) -> float:
-    ts_raw = order.get("created_time") or order.get("last_update_time")
-    if not ts_raw:
-        return 0.0
-    try:
-        ts = datetime.fromisoformat(str(ts_raw).replace("Z", "+00:00"))
-    except ValueError:
+def order_age_seconds(order: Order | dict[str, Any], now_utc: datetime) -> float:
+    ts = as_order(order).created_at
+    if ts is None:
         return 0.0
-    if ts.tzinfo is None:
-        ts = ts.replace(tzinfo=timezone.utc)
-    return max(0.0, (now_utc - ts.astimezone(timezone.utc)).total_seconds())
+    return max(0.0, (now_utc - ts).total_seconds())
 
 
 def should_amend(existing_price: int, desired_price: int, age_seconds: float, cfg: Any) -> bool:
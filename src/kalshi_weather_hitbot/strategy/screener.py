@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from datetime import datetime, time, timedelta, timezone
 from zoneinfo import ZoneInfo
 
+from kalshi_weather_hitbot.kalshi.models import Market, as_market
+
 
 @dataclass
 class ParsedMarket:
@@ -29,23 +31,11 @@ HIGH_ONLY_PATTERNS = [
 ]
 
 
-def _parse_strike(value: object) -> float | None:
-    if value is None:
-        return None
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
-
-
-def parse_temperature_market(market: dict) -> ParsedMarket | None:
-    text = " ".join(
-        str(market.get(k, ""))
-        for k in ["title", "subtitle", "yes_sub_title", "no_sub_title", "rules_primary", "rules"]
-    )
-
-    low = _parse_strike(market.get("floor_strike"))
-    high = _parse_strike(market.get("cap_strike"))
+def parse_temperature_market(market: Market | dict) -> ParsedMarket | None:
+    market = as_market(market)
+    text = market.text
+    low = market.floor_strike
+    high = market.cap_strike
 
     if low is None or high is None:
         for pat in BRACKET_PATTERNS:
@@ -68,13 +58,11 @@ def parse_temperature_market(market: dict) -> ParsedMarket | None:
                 low = float(m.group("threshold"))
                 break
 
-    close_time = market.get("close_time") or market.get("close_ts")
-    if not close_time:
+    if market.close_ts is None:
         return None
-    close_dt = datetime.fromisoformat(str(close_time).replace("Z", "+00:00")).astimezone(timezone.utc)
     if low is None and high is None:
         return None
-    return ParsedMarket(bracket_low=low, bracket_high=high, close_ts=close_dt)
+    return ParsedMarket(bracket_low=low, bracket_high=high, close_ts=market.close_ts)
 
 
 def _is_dst(ts_local: datetime) -> bool:
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from kalshi_weather_hitbot.config import RiskConfig
+from kalshi_weather_hitbot.strategy.model import evaluate_lock
+
+
+@dataclass
+class TriggerHit:
+    station: str
+    market_ticker: str
+    observed_max: float
+    previous_status: str
+    lock_status: str
+
+
+@dataclass
+class _Watched:
+    market_ticker: str
+    bracket_low: float | None
+    bracket_high: float | None
+    forecast_max_remaining: float
+    lock_status: str
+
+
+class _WindowTriggers:
+    # Markets sharing a station and observation window, with the observed-max values
+    # at which evaluate_lock can change its answer, kept sorted.
+    def __init__(self, observed_max: float) -> None:
+        self.observed_max = observed_max
+        self.markets: list[_Watched] = []
+        self.thresholds: list[float] = []
+        self.market_at: list[int] = []
+
+    def add(self, market: _Watched, uncertainty_f: float) -> None:
+        idx = len(self.markets)
+        self.markets.append(market)
+        bounds = [b for b in (market.bracket_low, market.bracket_high) if b is not None]
+        for threshold in sorted({b + d for b in bounds for d in (-uncertainty_f, uncertainty_f)}):
+            if math.isfinite(threshold):
+                pos = bisect_right(self.thresholds, threshold)
+                self.thresholds.insert(pos, threshold)
+                self.market_at.insert(pos, idx)
+
+
+# Per-station index of the observed temperatures where a scanned market's lock status
+# flips (bracket edges shifted by the station uncertainty). Observed maxima only rise
+# within a climate day, so a new METAR reading v against the last seen maximum m can
+# only change markets with a threshold in [m, v]; those few are re-checked with
+# evaluate_lock and reported when their status actually changed. Forecast inputs stay
+# at their scan-time values until the next full cycle rebuilds the index.
+class LockTriggerIndex:
+    def __init__(self, risk: RiskConfig) -> None:
+        self.risk = risk
+        self._windows: dict[str, dict[datetime, _WindowTriggers]] = {}
+
+    @classmethod
+    def from_candidates(cls, candidates: list[dict[str, Any]], risk: RiskConfig) -> "LockTriggerIndex":
+        index = cls(risk)
+        for c in candidates:
+            station = c.get("metar_station_used")
+            window_start = c.get("window_start")
+            if not station or window_start is None or c.get("observed_max") is None:
+                continue
+            index.add(
+                str(station),
+                datetime.fromisoformat(str(window_start)),
+                _Watched(
+                    market_ticker=str(c.get("market_ticker") or ""),
+                    bracket_low=c.get("bracket_low"),
+                    bracket_high=c.get("bracket_high"),
+                    forecast_max_remaining=float(c["forecast_max_remaining"]),
+                    lock_status=str(c.get("lock_status") or "UNLOCKED"),
+                ),
+                float(c["observed_max"]),
+            )
+        return index
+
+    def add(self, station: str, window_start: datetime, market: _Watched, observed_max: float) -> None:
+        windows = self._windows.setdefault(station, {})
+        window = windows.get(window_start)
+        if window is None:
+            window = windows[window_start] = _WindowTriggers(observed_max)
+        window.add(market, self.risk.station_uncertainty_f)
+
+    def stations(self) -> list[str]:
+        return list(self._windows)
+
+    def __len__(self) -> int:
+        return sum(len(w.markets) for windows in self._windows.values() for w in windows.values())
+
+    def observe(self, station: str, observations: list[tuple[datetime, float]], now_utc: datetime) -> list[TriggerHit]:
+        # observations: (obs time, temp F) for the station, any order.
+        hits: list[TriggerHit] = []
+        for window_start, window in self._windows.get(station, {}).items():
+            temps = [tf for ts, tf in observations if window_start <= ts <= now_utc]
+            if not temps or max(temps) <= window.observed_max:
+                continue
+            previous, observed = window.observed_max, max(temps)
+            window.observed_max = observed
+            lo = bisect_left(window.thresholds, previous)
+            hi = bisect_right(window.thresholds, observed)
+            for idx in sorted(set(window.market_at[lo:hi])):
+                market = window.markets[idx]
+                lock = evaluate_lock(
+                    market.bracket_low,
+                    market.bracket_high,
+                    observed,
+                    market.forecast_max_remaining,
+                    self.risk.safety_bias_f,
+                    self.risk.lock_yes_probability,
+                    self.risk.lock_no_probability,
+                    self.risk.station_uncertainty_f,
+                )
+                if lock.lock_status != market.lock_status:
+                    hits.append(TriggerHit(station, market.market_ticker, observed, market.lock_status, lock.lock_status))
+                    market.lock_status = lock.lock_status
+        return hits
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class HostConcurrencyLimiter:
+    def __init__(self, max_per_host: int = 4) -> None:
+        self.max_per_host = max(1, int(max_per_host))
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    @staticmethod
+    def host_for(url: str) -> str:
+        return urlsplit(url).netloc.lower() or url
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, url: str):
+        sem = self._semaphore(self.host_for(url))
+        sem.acquire()
+        try:
+            yield
+        finally:
+            sem.release()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from kalshi_weather_hitbot.utils.rate_governor import Priority
+
+
+@dataclass
+class DeadlineStats:
+    budget_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    overrun_seconds: float = 0.0
+    retries_skipped: int = 0
+    waits_shortened: int = 0
+    shed: dict[str, int] = field(default_factory=dict)
+
+
+# Time budget for one run-loop cycle, shared by the Kalshi, METAR and NWS clients.
+# Lower-priority work stops being started once the remaining budget falls below its
+# reserve (discovery first, then reads); order writes are never shed, but retries of
+# any call are dropped when the backoff would eat the rest of the budget.
+class CycleDeadline:
+    def __init__(
+        self,
+        budget_seconds: float,
+        discovery_reserve_fraction: float = 0.5,
+        read_reserve_fraction: float = 0.1,
+        min_retry_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.budget_seconds = max(0.0, float(budget_seconds))
+        self.min_retry_seconds = max(0.0, float(min_retry_seconds))
+        self.clock = clock
+        self._started = clock()
+        self._reserve = {
+            Priority.ORDER: None,
+            Priority.READ: self.budget_seconds * max(0.0, float(read_reserve_fraction)),
+            Priority.DISCOVERY: self.budget_seconds * max(0.0, float(discovery_reserve_fraction)),
+        }
+        self._lock = threading.Lock()
+        self._stats = DeadlineStats(budget_seconds=self.budget_seconds)
+        self._shed_keys: dict[str, set[str]] = {}
+
+    def elapsed(self) -> float:
+        return max(0.0, self.clock() - self._started)
+
+    def remaining(self) -> float:
+        return self.budget_seconds - self.elapsed()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def allows(self, priority: Priority) -> bool:
+        reserve = self._reserve[priority]
+        return reserve is None or self.remaining() > reserve
+
+    def shed(self, kind: str, count: int = 1, key: str | None = None) -> None:
+        # key names what was skipped (e.g. a series ticker) for callers that must
+        # not mistake skipped work for an empty result.
+        if count <= 0:
+            return
+        with self._lock:
+            self._stats.shed[kind] = self._stats.shed.get(kind, 0) + count
+            if key is not None:
+                self._shed_keys.setdefault(kind, set()).add(key)
+
+    def shed_keys(self, kind: str) -> set[str]:
+        with self._lock:
+            return set(self._shed_keys.get(kind, ()))
+
+    def timeout(self, default_seconds: float, floor_seconds: float = 1.0) -> float:
+        # A single request may still run past the deadline by floor_seconds.
+        return max(floor_seconds, min(float(default_seconds), self.remaining()))
+
+    def retry_wait(self, wait_seconds: float) -> float:
+        # Shrink a backoff so the retry still has min_retry_seconds to run.
+        room = max(0.0, self.remaining() - self.min_retry_seconds)
+        if wait_seconds > room:
+            with self._lock:
+                self._stats.waits_shortened += 1
+            return room
+        return wait_seconds
+
+    def allows_retry(self, wait_seconds: float = 0.0) -> bool:
+        if self.remaining() - wait_seconds >= self.min_retry_seconds:
+            return True
+        with self._lock:
+            self._stats.retries_skipped += 1
+        return False
+
+    def stats(self) -> DeadlineStats:
+        elapsed = self.elapsed()
+        with self._lock:
+            return DeadlineStats(
+                budget_seconds=self.budget_seconds,
+                elapsed_seconds=elapsed,
+                overrun_seconds=max(0.0, elapsed - self.budget_seconds),
+                retries_skipped=self._stats.retries_skipped,
+                waits_shortened=self._stats.waits_shortened,
+                shed=dict(self._stats.shed),
+            )
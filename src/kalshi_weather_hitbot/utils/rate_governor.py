@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class Priority(IntEnum):
+    # Lower value is served first when a host's bucket is empty.
+    ORDER = 0
+    READ = 1
+    DISCOVERY = 2
+
+
+def request_priority(method: str, path: str) -> Priority:
+    if method.upper() in {"POST", "DELETE", "PUT", "PATCH"}:
+        return Priority.ORDER
+    if path.endswith("/orderbook") or "/portfolio/" in path:
+        return Priority.READ
+    return Priority.DISCOVERY
+
+
+@dataclass
+class HostRateStats:
+    rate_per_second: float = 0.0
+    acquired: int = 0
+    waited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    wait_seconds_by_priority: dict[str, float] = field(default_factory=dict)
+    penalties: int = 0
+
+
+class _Bucket:
+    def __init__(self, rate_per_second: float, burst: float) -> None:
+        self.rate = max(0.01, float(rate_per_second))
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = 0.0
+        self.blocked_until = 0.0
+        self.waiters: list[tuple[int, int]] = []
+        self.stats = HostRateStats(rate_per_second=self.rate)
+
+    def refill(self, now: float) -> None:
+        if self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def seconds_until_token(self, now: float) -> float:
+        wait = 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+        return max(wait, self.blocked_until - now)
+
+
+# Per-host token buckets with priority lanes: when a host is saturated, queued
+# order writes are granted before reads, and reads before discovery calls.
+class RateGovernor:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._buckets: dict[str, _Bucket] = {}
+        self._seq = itertools.count()
+
+    @staticmethod
+    def key_for(url_or_host: str) -> str:
+        if "://" in url_or_host:
+            return urlsplit(url_or_host).netloc.lower()
+        return url_or_host.lower()
+
+    def configure(self, host: str, rate_per_second: float, burst: float | None = None) -> None:
+        key = self.key_for(host)
+        with self._cond:
+            previous = self._buckets.get(key)
+            bucket = _Bucket(rate_per_second, rate_per_second if burst is None else burst)
+            if previous is not None:
+                bucket.stats = previous.stats
+                bucket.stats.rate_per_second = bucket.rate
+                bucket.waiters = previous.waiters
+            self._buckets[key] = bucket
+            self._cond.notify_all()
+
+    def acquire(self, url_or_host: str, priority: Priority = Priority.DISCOVERY) -> float:
+        key = self.key_for(url_or_host)
+        with self._cond:
+            ticket = self._enqueue(key, priority)
+            if ticket is None:
+                return 0.0
+            started = self.clock()
+            blocked = False
+            while True:
+                wait = self._try_grant(key, ticket)
+                if wait is None:
+                    return self._granted(key, priority, started, blocked)
+                blocked = True
+                self._cond.wait(timeout=wait if wait > 0 else 0.05)
+
+    async def acquire_async(self, url_or_host: str, priority: Priority = Priority.DISCOVERY) -> float:
+        # Same queue and grant order as acquire(), but waits on the event loop so other
+        # requests in flight on it keep moving.
+        key = self.key_for(url_or_host)
+        with self._cond:
+            ticket = self._enqueue(key, priority)
+            if ticket is None:
+                return 0.0
+            started = self.clock()
+        blocked = False
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(key, ticket)
+                    if wait is None:
+                        return self._granted(key, priority, started, blocked)
+                blocked = True
+                await asyncio.sleep(min(wait, 0.05) if wait > 0 else 0.005)
+        except BaseException:
+            with self._cond:
+                waiters = self._buckets[key].waiters
+                if ticket in waiters:
+                    waiters.remove(ticket)
+                    heapq.heapify(waiters)
+                self._cond.notify_all()
+            raise
+
+    def _enqueue(self, key: str, priority: Priority) -> tuple[int, int] | None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+        ticket = (int(priority), next(self._seq))
+        heapq.heappush(bucket.waiters, ticket)
+        return ticket
+
+    def _try_grant(self, key: str, ticket: tuple[int, int]) -> float | None:
+        # None once the token is taken; otherwise how long until one may be.
+        bucket = self._buckets[key]
+        now = self.clock()
+        bucket.refill(now)
+        wait = bucket.seconds_until_token(now)
+        if bucket.waiters[0] == ticket and wait <= 0:
+            heapq.heappop(bucket.waiters)
+            bucket.tokens -= 1.0
+            self._cond.notify_all()
+            return None
+        return wait
+
+    def _granted(self, key: str, priority: Priority, started: float, blocked: bool) -> float:
+        waited = max(0.0, self.clock() - started) if blocked else 0.0
+        stats = self._buckets[key].stats
+        stats.acquired += 1
+        if waited > 0:
+            stats.waited += 1
+            stats.total_wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+            lane = priority.name.lower()
+            stats.wait_seconds_by_priority[lane] = stats.wait_seconds_by_priority.get(lane, 0.0) + waited
+        return waited
+
+    def penalize(self, url_or_host: str, seconds: float) -> None:
+        # Server asked us to back off (429 Retry-After): hold the whole host.
+        key = self.key_for(url_or_host)
+        with self._cond:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return
+            bucket.blocked_until = max(bucket.blocked_until, self.clock() + max(0.0, float(seconds)))
+            bucket.tokens = min(bucket.tokens, 0.0)
+            bucket.stats.penalties += 1
+
+    def stats(self) -> dict[str, HostRateStats]:
+        with self._cond:
+            return {
+                key: HostRateStats(
+                    rate_per_second=b.stats.rate_per_second,
+                    acquired=b.stats.acquired,
+                    waited=b.stats.waited,
+                    total_wait_seconds=b.stats.total_wait_seconds,
+                    max_wait_seconds=b.stats.max_wait_seconds,
+                    wait_seconds_by_priority=dict(b.stats.wait_seconds_by_priority),
+                    penalties=b.stats.penalties,
+                )
+                for key, b in self._buckets.items()
+            }
+
+
+def kalshi_rates_from_account_limits(payload: dict[str, Any]) -> tuple[float | None, float | None]:
+    # /account/limits reports per-second read and write budgets for the key's tier.
+    source = payload.get("limits") if isinstance(payload.get("limits"), dict) else payload
+
+    def _rate(*names: str) -> float | None:
+        for name in names:
+            value = source.get(name)
+            if isinstance(value, dict):
+                value = value.get("per_second") or value.get("limit")
+            try:
+                if value is not None and float(value) > 0:
+                    return float(value)
+            except (TypeError, ValueError):
+                continue
+        return None
+
+    return (
+        _rate("read_limit", "read_per_second", "reads_per_second"),
+        _rate("write_limit", "write_per_second", "writes_per_second"),
+    )
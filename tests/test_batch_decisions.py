@@ -0,0 +1,101 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kalshi_weather_hitbot.config import FeesConfig, RiskConfig
+from kalshi_weather_hitbot.kalshi.models import OrderBookTop
+from kalshi_weather_hitbot.strategy import batch_decisions
+from kalshi_weather_hitbot.strategy.batch_decisions import decide_entries, select_orders
+from kalshi_weather_hitbot.strategy.execution import select_order
+from kalshi_weather_hitbot.strategy.fees import kalshi_fee_cents
+from kalshi_weather_hitbot.strategy.maker import maker_first_entry_price
+
+
+def _random_case(rng: random.Random):
+    def price():
+        return None if rng.random() < 0.05 else rng.randint(1, 99)
+
+    book = OrderBookTop(
+        best_yes_bid_cents=price(),
+        best_yes_ask_cents=price(),
+        best_no_bid_cents=price(),
+        best_no_ask_cents=price(),
+        yes_bid_size=rng.randint(0, 30),
+        yes_ask_size=rng.randint(0, 30),
+        no_bid_size=rng.randint(0, 30),
+        no_ask_size=rng.randint(0, 30),
+    )
+    status = rng.choice(["LOCKED_YES", "LOCKED_NO", "UNLOCKED"])
+    p_yes = rng.choice([0.0, 0.005, 0.5, 0.955, 0.97, 0.995, 1.0, rng.random()])
+    close_ts = datetime(2026, 7, 1, tzinfo=timezone.utc) + timedelta(minutes=rng.randint(0, 5000))
+    return status, p_yes, book, close_ts
+
+
+def _scalar_entry(status, p_yes, book, close_ts, risk, fees):
+    # The run loop's per-candidate logic before the batch kernel.
+    decision = select_order(status, p_yes, book, risk, fees_cfg=fees)
+    if decision.should_trade:
+        side = decision.side
+        confidence = p_yes if side == "YES" else 1 - p_yes
+        maker = maker_first_entry_price(side, book, int((confidence - risk.edge_buffer) * 100), risk)
+        if maker.should_place and maker.price_cents is not None:
+            decision.price_cents = maker.price_cents
+            decision.expected_fee_cents = (
+                kalshi_fee_cents(maker.price_cents, 1, "maker") if fees.enabled and fees.assume_maker_fee else 0
+            )
+            decision.expected_net_ev_cents = int(round(confidence * 100)) - maker.price_cents - decision.expected_fee_cents
+    cost = max(1, int(decision.price_cents or 0) + int(decision.expected_fee_cents or 0))
+    size = book.yes_ask_size if decision.side == "YES" else book.no_ask_size
+    return decision, (int(decision.expected_net_ev_cents or 0) / cost, size, -close_ts.timestamp())
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize(
+    "fees",
+    [FeesConfig(enabled=False), FeesConfig(enabled=True, assume_maker_fee=True), FeesConfig(enabled=True, assume_maker_fee=False)],
+)
+def test_batch_kernel_matches_scalar_decisions_and_priority(monkeypatch, use_numpy, fees):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch_decisions, "np", None)
+    rng = random.Random(21)
+    risk = RiskConfig(p_confidence_gate=0.9, max_spread_cents=6, min_liquidity_contracts=3, edge_buffer=0.02, min_net_edge_cents=1)
+    cases = [_random_case(rng) for _ in range(3000)]
+    statuses, probs, books, closes = (list(col) for col in zip(*cases))
+
+    batch = decide_entries(statuses, probs, books, closes, risk, fees_cfg=fees)
+
+    expected = [_scalar_entry(*case, risk, fees) for case in cases]
+    assert batch.decisions == [decision for decision, _key in expected]
+    assert batch.priority_keys == [key for _decision, key in expected]
+    assert {d.reason for d in batch.decisions if not d.should_trade} >= {
+        "Not locked",
+        "Confidence below gate",
+        "Missing orderbook prices",
+        "Spread too wide",
+        "Insufficient liquidity",
+        "Price above edge-adjusted threshold",
+    }
+
+
+def test_select_orders_honours_model_probabilities():
+    pytest.importorskip("numpy")
+    risk = RiskConfig(p_confidence_gate=0.9, max_spread_cents=10, min_liquidity_contracts=1, edge_buffer=0.02)
+    book = OrderBookTop(80, 82, 18, 20, yes_ask_size=5, no_ask_size=5)
+    statuses, probs, models = ["LOCKED_YES"] * 3, [0.99, 0.99, 0.5], [0.5, None, 0.99]
+
+    got = select_orders(statuses, probs, [book] * 3, risk, model_probs=models)
+
+    assert got == [select_order(s, p, book, risk, model_prob=m) for s, p, m in zip(statuses, probs, models)]
+    assert [d.should_trade for d in got] == [False, True, True]
+
+
+def test_numpy_maker_fee_follows_the_shared_fee_rate(monkeypatch):
+    np = pytest.importorskip("numpy")
+    prices = np.arange(0, 101, dtype=np.int64)
+    assert batch_decisions._np_maker_fee_cents(prices).tolist() == [kalshi_fee_cents(p, 1, "maker") for p in range(101)]
+
+    monkeypatch.setattr(batch_decisions, "MAKER_FEE_RATE", 0.07)
+    assert batch_decisions._np_maker_fee_cents(np.array([50])).tolist() == [kalshi_fee_cents(50, 1, "taker")] == [2]
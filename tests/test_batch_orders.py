@@ -0,0 +1,105 @@
+from kalshi_weather_hitbot.cli import _submit_entry_orders
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import (
+    BATCH_ORDER_LIMIT,
+    BatchOrderResult,
+    KalshiClient,
+    PermanentAPIError,
+)
+
+
+def _order(coid: str) -> dict:
+    return {"ticker": "T", "side": "yes", "action": "buy", "count": 1, "yes_price": 60, "client_order_id": coid}
+
+
+def test_batch_place_orders_maps_results_by_client_order_id():
+    client = KalshiClient(AppConfig())
+    calls = []
+
+    async def fake_request(method, path, *, params=None, json_body=None, authenticated=False):
+        calls.append((method, path, json_body))
+        # Results deliberately out of order.
+        return {
+            "orders": [
+                {"client_order_id": "b", "order": None, "error": {"code": "order_already_exists", "message": "dup"}},
+                {"client_order_id": "a", "order": {"order_id": "o-a", "client_order_id": "a"}, "error": None},
+            ]
+        }
+
+    client.aio._request = fake_request  # type: ignore[method-assign]
+    results = client.batch_place_orders([_order("a"), _order("b")])
+
+    assert [r.key for r in results] == ["a", "b"]
+    assert results[0].ok and results[0].response == {"client_order_id": "a", "order": {"order_id": "o-a", "client_order_id": "a"}}
+    assert not results[1].ok and "order_already_exists" in str(results[1].error)
+    assert calls == [("POST", "/trade-api/v2/portfolio/orders/batched", {"orders": [_order("a"), _order("b")]})]
+
+
+def test_batch_place_orders_chunks_to_the_batch_limit():
+    client = KalshiClient(AppConfig())
+    sizes = []
+
+    async def fake_request(method, path, *, params=None, json_body=None, authenticated=False):
+        sizes.append(len(json_body["orders"]))
+        return {"orders": [{"client_order_id": o["client_order_id"], "order": {}} for o in json_body["orders"]]}
+
+    client.aio._request = fake_request  # type: ignore[method-assign]
+    results = client.batch_place_orders([_order(str(i)) for i in range(BATCH_ORDER_LIMIT + 5)])
+
+    assert sizes == [BATCH_ORDER_LIMIT, 5]
+    assert all(r.ok for r in results)
+
+
+def test_batch_cancel_falls_back_to_single_calls_when_endpoint_missing():
+    client = KalshiClient(AppConfig())
+    calls = []
+
+    async def fake_request(method, path, *, params=None, json_body=None, authenticated=False):
+        calls.append((method, path))
+        if path.endswith("/batched"):
+            raise PermanentAPIError("API error 404: not found", status_code=404)
+        return {"order": {"order_id": path.rsplit("/", 1)[-1], "status": "canceled"}}
+
+    client.aio._request = fake_request  # type: ignore[method-assign]
+    results = client.batch_cancel_orders(["x", "y"])
+
+    assert [r.response["order"]["order_id"] for r in results] == ["x", "y"]
+    assert client.batch_supported is False
+    assert calls == [
+        ("DELETE", "/trade-api/v2/portfolio/orders/batched"),
+        ("DELETE", "/trade-api/v2/portfolio/orders/x"),
+        ("DELETE", "/trade-api/v2/portfolio/orders/y"),
+    ]
+
+
+def test_submit_entry_orders_reprices_post_only_cross_from_batch():
+    class _Client:
+        def __init__(self):
+            self.single_orders = []
+
+        def batch_place_orders(self, orders):
+            return [
+                BatchOrderResult("a", response={"order": {"status": "resting"}}),
+                BatchOrderResult("b", error=PermanentAPIError("API error post_only_cross: would cross")),
+                BatchOrderResult("c", error=PermanentAPIError("API error order_already_exists: dup")),
+            ]
+
+        def place_order(self, payload):
+            self.single_orders.append(payload)
+            return {"order": {"status": "resting", "retried": True}}
+
+        def get_orderbook(self, ticker):
+            return {"orderbook": {"yes": [[10, 1]], "no": [[40, 2]]}}
+
+    cfg = AppConfig()
+    cfg.risk.send_price_in_dollars = False
+    client = _Client()
+    planned = [{"ticker": "T", "side": "YES", "order": _order(coid)} for coid in "abc"]
+
+    out = _submit_entry_orders(client, planned, cfg=cfg)
+
+    assert (out[0].response, out[0].error) == ({"order": {"status": "resting"}}, None)
+    assert out[1].response["order"]["retried"] is True
+    assert out[1].latency_ms >= out[0].latency_ms
+    assert client.single_orders[0]["yes_price"] == 59
+    assert out[2].response is None and "order_already_exists" in str(out[2].error)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from kalshi_weather_hitbot import cli
+from kalshi_weather_hitbot.cli import _scan_once
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import BatchOrderResult, KalshiClient, TransientAPIError
+from kalshi_weather_hitbot.utils.deadline import CycleDeadline
+from kalshi_weather_hitbot.utils.rate_governor import Priority
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_deadline_sheds_discovery_before_reads_and_never_orders():
+    clock = FakeClock()
+    deadline = CycleDeadline(100.0, discovery_reserve_fraction=0.5, read_reserve_fraction=0.1, clock=clock)
+    assert deadline.allows(Priority.DISCOVERY)
+
+    clock.now = 60.0
+    assert not deadline.allows(Priority.DISCOVERY)
+    assert deadline.allows(Priority.READ)
+
+    clock.now = 95.0
+    assert not deadline.allows(Priority.READ)
+    assert deadline.allows(Priority.ORDER)
+
+    clock.now = 130.0
+    assert deadline.allows(Priority.ORDER)
+    assert deadline.stats().overrun_seconds == pytest.approx(30.0)
+
+
+def test_deadline_shrinks_backoff_and_clamps_timeouts():
+    clock = FakeClock()
+    deadline = CycleDeadline(10.0, min_retry_seconds=2.0, clock=clock)
+    clock.now = 5.0
+    assert deadline.retry_wait(8.0) == pytest.approx(3.0)
+    assert deadline.retry_wait(1.0) == 1.0
+    assert deadline.timeout(15.0) == pytest.approx(5.0)
+    clock.now = 9.5
+    assert deadline.timeout(15.0) == 1.0
+    assert not deadline.allows_retry(0.0)
+    stats = deadline.stats()
+    assert stats.waits_shortened == 1
+    assert stats.retries_skipped == 1
+
+
+def test_kalshi_request_stops_retrying_when_budget_is_spent(monkeypatch):
+    client = KalshiClient(AppConfig())
+    clock = FakeClock()
+    deadline = CycleDeadline(10.0, min_retry_seconds=2.0, clock=clock)
+    clock.now = 9.0
+    client.deadline = deadline
+    calls: list[float] = []
+
+    async def fake_request(*_args, **kwargs):
+        calls.append(kwargs["timeout"])
+        return SimpleNamespace(status_code=500, text="server error", headers={}, json=lambda: {})
+
+    monkeypatch.setattr(client.aio.transport, "request", fake_request)
+
+    with pytest.raises(TransientAPIError):
+        client._request("GET", "/trade-api/v2/test")
+
+    assert calls == [1.0]
+    assert deadline.stats().retries_skipped == 1
+
+
+def test_scan_sheds_discovery_and_snapshots_past_reserve(monkeypatch, tmp_path: Path):
+    calls: list[str] = []
+
+    class FakeClient:
+        def __init__(self, cfg):
+            _ = cfg
+
+        def iter_markets(self, series_ticker=None, status: str = "open", page_size: int = 100, max_items=None):
+            calls.append(series_ticker)
+            return []
+
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.KalshiClient", FakeClient)
+    monkeypatch.setattr(
+        "kalshi_weather_hitbot.cli.load_city_mapping",
+        lambda _p: {
+            "chicago": {
+                "kalshi_series_tickers": ["KXHIGHTEMP-CHI"],
+                "icao_station": "KMDW",
+                "lat": 41.7868,
+                "lon": -87.7522,
+                "tz": "America/Chicago",
+            }
+        },
+    )
+    clock = FakeClock()
+    deadline = CycleDeadline(100.0, clock=clock)
+    clock.now = 80.0
+
+    cfg = AppConfig(db_path=str(tmp_path / "x.db"))
+    cfg.data.metar_bulk_fetch = False
+    assert _scan_once(cfg, deadline=deadline) == []
+
+    assert calls == []
+    assert deadline.stats().shed == {"discovery": 1}
+    assert deadline.shed_keys("discovery") == {"KXHIGHTEMP-CHI"}
+
+
+def test_run_keeps_orders_on_series_shed_for_time(monkeypatch, tmp_path: Path):
+    class FakeClient:
+        def __init__(self, cfg):
+            _ = cfg
+            self.cancelled: list[str] = []
+
+        def get_balance(self):
+            return {"balance": 100000}
+
+        def get_positions(self):
+            return []
+
+        def list_orders(self, status: str = "open"):
+            if status != "open":
+                return []
+            return [
+                {"order_id": oid, "ticker": ticker, "side": "yes", "action": "buy", "yes_price": 50, "count": 1}
+                for oid, ticker in (("o-shed", "KXHIGHDEN-26JUL01-B80"), ("o-gone", "KXHIGHCHI-26JUL01-B80"))
+            ]
+
+        def get_orderbook(self, ticker: str):
+            return {"orderbook": {"yes": [], "no": []}}
+
+        def batch_cancel_orders(self, order_ids):
+            self.cancelled += order_ids
+            return [BatchOrderResult(oid, response={"order": {"status": "canceled"}}) for oid in order_ids]
+
+    clients: list[FakeClient] = []
+
+    def _client(cfg):
+        clients.append(FakeClient(cfg))
+        return clients[-1]
+
+    def _scan(*_args, deadline=None, **_kwargs):
+        # Chicago was scanned and has no locked market any more; Denver was skipped.
+        deadline.shed("discovery", key="KXHIGHDEN")
+        return []
+
+    def _stop(_seconds):
+        monkeypatch.setattr(cli, "RUNNING", False)
+
+    cfg = AppConfig(db_path=str(tmp_path / "run.db"), api_key_id="k")
+    monkeypatch.setattr(cli, "_load_cfg", lambda: cfg)
+    monkeypatch.setattr(cli, "KalshiClient", _client)
+    monkeypatch.setattr(cli, "_scan_once", _scan)
+    monkeypatch.setattr(cli, "load_city_mapping", lambda _p: {})
+    monkeypatch.setattr(cli, "_sleep_while_running", _stop)
+    monkeypatch.setattr(cli.typer, "prompt", lambda *_a, **_k: "x")
+    monkeypatch.setattr(cli, "RUNNING", True)
+
+    cli.run(enable_trading=True, interval_seconds=1, cap=None)
+
+    assert clients[0].cancelled == ["o-gone"]
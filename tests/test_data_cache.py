@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+
+from kalshi_weather_hitbot.data.cache import TTLCache
+from kalshi_weather_hitbot.data.metar import MetarClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_respects_max_entries():
+    cache = TTLCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.size, stats.evictions, stats.hits, stats.misses) == (2, 1, 3, 1)
+
+
+def test_periodic_sweep_drops_expired_entries_without_reads():
+    clock = _Clock()
+    cache = TTLCache(ttl_seconds=10, sweep_interval_seconds=30, clock=clock)
+    for i in range(5):
+        cache.set(f"k{i}", i)
+    clock.now += 31
+    cache.set("fresh", True)
+
+    assert len(cache) == 1
+    assert cache.stats().expirations == 5
+
+
+def test_stale_while_revalidate_serves_old_value_and_refreshes_once():
+    clock = _Clock()
+    cache = TTLCache(ttl_seconds=10, stale_seconds=60, clock=clock)
+    cache.set("k", "old")
+    clock.now += 20
+
+    release = threading.Event()
+    loads: list[int] = []
+
+    def loader() -> str:
+        loads.append(1)
+        release.wait(5.0)
+        return "new"
+
+    assert cache.get_or_load("k", loader) == "old"
+    assert cache.get_or_load("k", loader) == "old"
+    release.set()
+    for t in threading.enumerate():
+        if t.name == "cache-refresh:k":
+            t.join(5.0)
+
+    assert loads == [1]
+    assert cache.get("k") == "new"
+    stats = cache.stats()
+    assert (stats.stale_hits, stats.refreshes) == (2, 1)
+
+
+def test_get_or_load_loads_synchronously_past_stale_window():
+    clock = _Clock()
+    cache = TTLCache(ttl_seconds=10, stale_seconds=5, clock=clock)
+    cache.set("k", "old")
+    clock.now += 30
+    assert cache.get_or_load("k", lambda: "new") == "new"
+
+
+def test_metar_station_status_is_bounded():
+    client = MetarClient("https://aviationweather.gov", "test-agent", cache_max_entries=3)
+    for i in range(10):
+        client._remember_status(f"K{i:03d}", "ok")
+    stats = client.cache_stats()["metar_status"]
+    assert stats.size == 3
+    assert stats.evictions == 7
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from kalshi_weather_hitbot.db import DB
+
+
+def _count(db_path: Path, table: str) -> int:
+    con = sqlite3.connect(db_path)
+    try:
+        return int(con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+    finally:
+        con.close()
+
+
+def test_persistent_connection_uses_wal_and_is_reused(tmp_path: Path):
+    db = DB(str(tmp_path / "p.db"), persistent=True)
+    with db.connect() as first:
+        mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+    with db.connect() as second:
+        assert second is first
+    assert mode == "wal"
+    db.close()
+
+
+def test_batch_inserts_land_in_single_transaction(tmp_path: Path):
+    db_path = tmp_path / "b.db"
+    db = DB(str(db_path), persistent=True)
+    statements: list[str] = []
+    with db.connect() as con:
+        con.set_trace_callback(statements.append)
+
+    with db.transaction():
+        db.insert_market_snapshots([{"ticker": f"T{i}", "title": "x"} for i in range(50)])
+        db.insert_evaluations([{"market_ticker": f"T{i}", "lock_status": "UNLOCKED"} for i in range(50)])
+        assert _count(db_path, "run_evaluations") == 0
+
+    assert _count(db_path, "market_snapshots") == 50
+    assert _count(db_path, "run_evaluations") == 50
+    assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 1
+    db.close()
+
+
+def test_transaction_rolls_back_on_error(tmp_path: Path):
+    db_path = tmp_path / "r.db"
+    db = DB(str(db_path), persistent=True)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_evaluations([{"market_ticker": "T1"}])
+            raise RuntimeError("boom")
+    assert _count(db_path, "run_evaluations") == 0
+    db.close()
+
+
+def test_order_inserts_commit_immediately(tmp_path: Path):
+    db_path = tmp_path / "o.db"
+    db = DB(str(db_path), persistent=True)
+    db.insert_order("T1", "cid-1", {"action": "buy"}, {"ok": True}, "SUBMITTED")
+    assert _count(db_path, "orders") == 1
+    with db.connect() as con:
+        assert con.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL restored
+    db.close()
+
+
+def test_transaction_without_persistent_connection(tmp_path: Path):
+    db_path = tmp_path / "np.db"
+    db = DB(str(db_path))
+    with db.transaction():
+        db.insert_market_snapshot({"ticker": "T1"})
+        db.insert_evaluation({"market_ticker": "T1"})
+    assert _count(db_path, "market_snapshots") == 1
+    assert _count(db_path, "run_evaluations") == 1
+    db.insert_evaluation({"market_ticker": "T2"})
+    assert _count(db_path, "run_evaluations") == 2
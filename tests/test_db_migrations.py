@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+from kalshi_weather_hitbot.db import DB, SCHEMA, SCHEMA_VERSION
+from kalshi_weather_hitbot.strategy.calibration import build_lock_calibration
+
+
+def _legacy_db(db_path: Path) -> None:
+    con = sqlite3.connect(db_path)
+    con.executescript(SCHEMA)
+    orders = [
+        ("T1", {"side": "yes", "action": "buy", "count": 3, "yes_price_dollars": "0.9100"}, "SUBMITTED"),
+        ("T1", {"side": "yes", "action": "sell", "count": 3, "yes_price": 97}, "SUBMITTED"),
+        ("T2", {"side": "no", "action": "buy", "count_fp": "2.00", "no_price": 88}, "DRY_RUN"),
+        ("T3", {"order_id": "abc", "ticker": "T3", "reason": "stale"}, "CANCEL_SUBMITTED"),
+    ]
+    for ticker, req, status in orders:
+        con.execute(
+            "INSERT INTO orders(ts, market_ticker, client_order_id, request_json, response_json, status) VALUES (?, ?, ?, ?, ?, ?)",
+            ("2026-02-25T00:00:00+00:00", ticker, f"cid-{ticker}", json.dumps(req), "{}", status),
+        )
+    evals = [
+        ("T1", {"city_key": "chicago", "lock_status": "LOCKED_YES", "hours_to_close": 2.5}),
+        ("T2", {"city_key": "chicago", "lock_status": "LOCKED_NO", "hours_to_close": "0.5"}),
+        ("T3", {"city_key": "chicago", "lock_status": "UNLOCKED"}),
+    ]
+    for ticker, payload in evals:
+        con.execute(
+            "INSERT INTO run_evaluations(ts, market_ticker, city_key, lock_status, raw_payload) VALUES (?, ?, ?, ?, ?)",
+            ("2026-02-25T00:00:00+00:00", ticker, payload["city_key"], payload["lock_status"], json.dumps(payload)),
+        )
+    for ticker, result in (("T1", "yes"), ("T2", "yes")):
+        con.execute(
+            "INSERT INTO settlements(ts_ingested, ticker, market_result, raw_json) VALUES (?, ?, ?, ?)",
+            ("2026-02-26T00:00:00+00:00", ticker, result, "{}"),
+        )
+    con.commit()
+    con.close()
+
+
+def test_migration_backfills_promoted_columns_and_indexes(tmp_path: Path):
+    db_path = tmp_path / "legacy.db"
+    _legacy_db(db_path)
+
+    db = DB(str(db_path))
+    with db.connect() as con:
+        assert con.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        orders = con.execute("SELECT market_ticker, side, action, price_cents, count FROM orders ORDER BY id").fetchall()
+        hours = con.execute("SELECT market_ticker, hours_to_close FROM run_evaluations ORDER BY id").fetchall()
+        indexes = {row[1] for row in con.execute("SELECT type, name FROM sqlite_master WHERE type = 'index'")}
+        plan = " ".join(
+            str(r[-1]) for r in con.execute("EXPLAIN QUERY PLAN SELECT COUNT(*) FROM orders WHERE status='SUBMITTED' AND action='buy'")
+        )
+
+    assert orders == [
+        ("T1", "yes", "buy", 91, 3),
+        ("T1", "yes", "sell", 97, 3),
+        ("T2", "no", "buy", 88, 2),
+        ("T3", None, None, None, None),
+    ]
+    assert hours == [("T1", 2.5), ("T2", 0.5), ("T3", None)]
+    assert {"idx_orders_ticker_id", "idx_orders_status", "idx_orders_ts", "idx_run_evaluations_ticker_id"} <= indexes
+    assert "idx_orders_status" in plan
+
+
+def test_migration_is_idempotent_and_new_rows_fill_columns(tmp_path: Path):
+    db_path = tmp_path / "fresh.db"
+    DB(str(db_path))
+    db = DB(str(db_path))
+    db.insert_order("T9", "cid-9", {"side": "no", "action": "buy", "count": 4, "no_price_dollars": "0.0700"}, {}, "SUBMITTED")
+    db.insert_evaluation({"market_ticker": "T9", "hours_to_close": 1.25})
+    with db.connect() as con:
+        assert con.execute("SELECT side, action, price_cents, count FROM orders").fetchone() == ("no", "buy", 7, 4)
+        assert con.execute("SELECT hours_to_close FROM run_evaluations").fetchone() == (1.25,)
+
+
+def test_calibration_reads_promoted_columns_from_migrated_db(tmp_path: Path):
+    db_path = tmp_path / "legacy.db"
+    _legacy_db(db_path)
+
+    lookup = build_lock_calibration(str(db_path), by_city=True, buckets_hours_to_close=[1.0, 3.0], min_samples_per_bucket=1)
+
+    # T1: latest buy was YES and settled YES -> win in the 3h bucket.
+    assert lookup("chicago", 2.0, "LOCKED_YES", 0.5) == 2 / 3
+    # T2: NO buy settled YES -> loss in the 1h bucket.
+    assert lookup("chicago", 0.5, "LOCKED_YES", 0.5) == 1 / 3
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+from kalshi_weather_hitbot import cli
+from kalshi_weather_hitbot.db import DB
+
+
+def _count(db_path: Path, table: str) -> int:
+    con = sqlite3.connect(db_path)
+    try:
+        return int(con.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+    finally:
+        con.close()
+
+
+def test_write_behind_flushes_rows_in_order(tmp_path: Path):
+    db_path = tmp_path / "wb.db"
+    db = DB(str(db_path), persistent=True)
+    db.start_write_behind(max_queue=100, max_batch=10, flush_interval_seconds=0.01)
+
+    for i in range(25):
+        db.insert_order(f"T{i}", f"cid-{i}", {"action": "buy"}, {"ok": True}, "SUBMITTED")
+    db.insert_evaluations([{"market_ticker": f"T{i}"} for i in range(5)])
+
+    assert db.flush(timeout=5.0) is True
+    stats = db.writer_stats()
+    assert stats is not None
+    assert stats.rows_written == 30
+    assert stats.queue_depth == 0
+    assert stats.errors == 0
+    db.close()
+
+    con = sqlite3.connect(db_path)
+    tickers = [r[0] for r in con.execute("SELECT market_ticker FROM orders ORDER BY id")]
+    con.close()
+    assert tickers == [f"T{i}" for i in range(25)]
+    assert _count(db_path, "run_evaluations") == 5
+
+
+def test_write_behind_submit_does_not_wait_for_sqlite(tmp_path: Path):
+    db = DB(str(tmp_path / "slow.db"), persistent=True)
+    writer = db.start_write_behind(max_queue=100, flush_interval_seconds=0.01)
+    release = threading.Event()
+    original = db._write_groups
+
+    def _slow_write(groups, durable=False):
+        release.wait(5.0)
+        original(groups, durable=durable)
+
+    db._write_groups = _slow_write  # type: ignore[method-assign]
+    db.insert_order("T1", "cid-1", {}, {}, "SUBMITTED")
+    db.insert_order("T2", "cid-2", {}, {}, "SUBMITTED")
+    assert db.flush(timeout=0.05) is False
+    release.set()
+    assert writer.flush(timeout=5.0) is True
+    db.close()
+
+
+def test_write_behind_counts_backpressure_when_queue_full(tmp_path: Path):
+    db = DB(str(tmp_path / "bp.db"), persistent=True)
+    writer = db.start_write_behind(max_queue=1, max_batch=1, flush_interval_seconds=0.01)
+    for i in range(20):
+        db.insert_evaluation({"market_ticker": f"T{i}"})
+    assert writer.flush(timeout=5.0) is True
+    stats = writer.stats()
+    assert stats.rows_written == 20
+    assert stats.max_queue_depth <= 1
+    db.close()
+
+
+def test_sigint_handler_only_stops_the_loop(monkeypatch):
+    monkeypatch.setattr(cli, "RUNNING", True)
+    cli._signal_handler(None, None)
+    assert cli.RUNNING is False
+
+
+def test_run_closes_db_when_the_loop_raises(monkeypatch, tmp_path: Path):
+    db = DB(str(tmp_path / "run.db"), persistent=True)
+    db.start_write_behind(flush_interval_seconds=60.0)
+    db.insert_evaluation({"market_ticker": "T1"})
+
+    def _boom(_cfg):
+        raise RuntimeError("client setup failed")
+
+    monkeypatch.setattr(cli, "_load_cfg", lambda: cli.AppConfig(db_path=str(tmp_path / "run.db")))
+    monkeypatch.setattr(cli, "_open_db", lambda _cfg: db)
+    monkeypatch.setattr(cli, "KalshiClient", _boom)
+
+    try:
+        cli.run(enable_trading=False, interval_seconds=1, cap=None)
+    except RuntimeError:
+        pass
+    assert db.writer_stats() is None
+    assert _count(tmp_path / "run.db", "run_evaluations") == 1
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from kalshi_weather_hitbot.data.http_cache import HTTPCache, ttl_from_headers
+from kalshi_weather_hitbot.data.nws import NWSClient
+
+
+class _Resp:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = ""
+        self.json_calls = 0
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        self.json_calls += 1
+        return self._payload
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests: list[dict] = []
+        self.headers: dict = {}
+
+    def get(self, url, **kwargs):
+        self.requests.append({"url": url, **kwargs})
+        return self.responses.pop(0)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_from_headers():
+    assert ttl_from_headers({"Cache-Control": "public, max-age=120"}) == 120
+    assert ttl_from_headers({"cache-control": "no-store"}) == 0
+    assert ttl_from_headers(
+        {"Date": "Wed, 25 Feb 2026 12:00:00 GMT", "Expires": "Wed, 25 Feb 2026 12:05:00 GMT"}
+    ) == 300
+    assert ttl_from_headers({"ETag": '"abc"'}) is None
+
+
+def test_304_refreshes_stored_body_without_reparsing():
+    clock = _Clock()
+    first = _Resp(payload={"v": 1}, headers={"ETag": '"v1"', "Cache-Control": "max-age=60"})
+    session = _Session([first, _Resp(status_code=304, headers={"Cache-Control": "max-age=90"})])
+    cache = HTTPCache(min_ttl_seconds=0, clock=clock)
+
+    a = cache.get(session, "https://api.weather.gov/x", timeout=5)
+    assert a.ttl_seconds == 60
+    assert a.response.json() == {"v": 1}
+
+    clock.now += 30
+    assert cache.get(session, "https://api.weather.gov/x", timeout=5).response is a.response
+    assert len(session.requests) == 1
+
+    clock.now += 31
+    b = cache.get(session, "https://api.weather.gov/x", timeout=5)
+    assert session.requests[1]["headers"] == {"If-None-Match": '"v1"'}
+    assert b.ttl_seconds == 90
+    assert b.response.json() == {"v": 1}
+    assert first.json_calls == 1
+    stats = cache.stats()
+    assert (stats.fresh_hits, stats.revalidated, stats.fetched) == (1, 1, 1)
+
+
+def test_responses_without_validators_are_not_stored():
+    session = _Session([_Resp(payload=[1]), _Resp(payload=[2])])
+    cache = HTTPCache()
+    cache.get(session, "https://aviationweather.gov/api/data/metar", params={"ids": "KMDW"})
+    cache.get(session, "https://aviationweather.gov/api/data/metar", params={"ids": "KMDW"})
+    assert all("headers" not in r for r in session.requests)
+    assert cache.stats().size == 0
+
+
+def test_no_store_responses_are_never_stored():
+    clock = _Clock()
+    headers = {"ETag": '"v1"', "Cache-Control": "no-store"}
+    session = _Session([_Resp(payload=[1], headers=headers), _Resp(payload=[2], headers=headers)])
+    cache = HTTPCache(min_ttl_seconds=10, clock=clock)
+
+    first = cache.get(session, "https://api.weather.gov/x")
+    second = cache.get(session, "https://api.weather.gov/x")
+
+    assert (first.ttl_seconds, second.response.json()) == (None, [2])
+    assert all("headers" not in r for r in session.requests)
+    assert cache.stats().size == 0
+
+
+def test_no_cache_responses_revalidate_on_every_use():
+    clock = _Clock()
+    headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+    session = _Session([_Resp(payload=[1], headers=headers), _Resp(status_code=304, headers=headers)])
+    cache = HTTPCache(min_ttl_seconds=10, clock=clock)
+
+    first = cache.get(session, "https://api.weather.gov/x")
+    second = cache.get(session, "https://api.weather.gov/x")
+
+    assert first.ttl_seconds is None and second.response is first.response
+    assert session.requests[1]["headers"] == {"If-None-Match": '"v1"'}
+    stats = cache.stats()
+    assert (stats.fresh_hits, stats.revalidated, stats.fetched) == (0, 1, 1)
+
+
+def test_nws_client_uses_header_ttl_and_revalidates():
+    clock = _Clock()
+    body = {"properties": {"periods": []}}
+    session = _Session(
+        [
+            _Resp(payload=body, headers={"Last-Modified": "Wed, 25 Feb 2026 12:00:00 GMT", "Cache-Control": "max-age=0"}),
+            _Resp(status_code=304),
+        ]
+    )
+    client = NWSClient("https://api.weather.gov", "test-agent", http_cache=HTTPCache(min_ttl_seconds=0, clock=clock))
+    client.session = session
+    assert client._get_json("https://api.weather.gov/gridpoints/LOT/1,2/forecast/hourly") == body
+    assert client._get_json("https://api.weather.gov/gridpoints/LOT/1,2/forecast/hourly") == body
+    assert session.requests[1]["headers"] == {"If-Modified-Since": "Wed, 25 Feb 2026 12:00:00 GMT"}
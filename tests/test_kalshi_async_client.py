@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from tenacity import wait_none
+
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import (
+    APIError,
+    AsyncKalshiClient,
+    KalshiClient,
+    PermanentAPIError,
+    RateLimitError,
+    TransientAPIError,
+)
+from kalshi_weather_hitbot.kalshi.transport import run_sync
+
+
+def _response(status_code: int, text: str = "{}", payload=None, headers=None):
+    return SimpleNamespace(status_code=status_code, text=text, headers=headers or {}, json=lambda: payload or {})
+
+
+def test_async_orderbooks_respect_concurrency_limit(monkeypatch):
+    client = AsyncKalshiClient(AppConfig(), max_concurrency=3)
+    state = {"in_flight": 0, "peak": 0}
+    threads: set[str] = set()
+
+    async def fake_request(method, url, **_kwargs):
+        threads.add(threading.current_thread().name)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return _response(200, payload={"orderbook": {"yes": [], "no": []}, "url": url})
+
+    monkeypatch.setattr(client.transport, "request", fake_request)
+
+    async def _run():
+        async with client:
+            return await client.get_orderbooks([f"T{i}" for i in range(12)] + ["T0"])
+
+    books = asyncio.run(_run())
+    assert list(books) == [f"T{i}" for i in range(12)]
+    assert books["T5"]["url"].endswith("/markets/T5/orderbook")
+    assert state["peak"] == 3
+    # Every request ran on the event loop itself, not on worker threads.
+    assert threads == {threading.current_thread().name}
+
+
+def test_async_client_works_across_event_loops(monkeypatch):
+    client = AsyncKalshiClient(AppConfig(), max_concurrency=2)
+
+    async def fake_request(method, url, **_kwargs):
+        await asyncio.sleep(0.005)
+        return _response(200, payload={"orderbook": {}, "url": url})
+
+    monkeypatch.setattr(client.transport, "request", fake_request)
+    tickers = [f"T{i}" for i in range(6)]
+    # The concurrency limit is contended in both runs, each on its own loop.
+    assert list(asyncio.run(client.get_orderbooks(tickers))) == tickers
+    assert list(asyncio.run(client.get_orderbooks(tickers))) == tickers
+
+
+def test_async_client_pagination_and_batching(monkeypatch):
+    client = AsyncKalshiClient(AppConfig())
+    pages = {
+        None: {"orders": [{"order_id": "o1"}], "cursor": "c2"},
+        "c2": {"orders": [{"order_id": "o2"}], "cursor": ""},
+    }
+
+    async def fake_request(method, path, params=None, **_kw):
+        return pages[(params or {}).get("cursor")]
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    async def _run():
+        listed = await client.list_orders()
+        streamed = [o["order_id"] async for o in client.iter_orders(page_size=1)]
+        return listed, streamed
+
+    listed, streamed = asyncio.run(_run())
+    assert [o["order_id"] for o in listed] == streamed == ["o1", "o2"]
+
+    async def fake_cancel(order_id):
+        return {"order": {"order_id": order_id}}
+
+    monkeypatch.setattr(client, "cancel_order", fake_cancel)
+    client.batch_supported = False
+    results = asyncio.run(client.batch_cancel_orders(["o1", "o2"]))
+    assert [r.key for r in results] == ["o1", "o2"] and all(r.ok for r in results)
+
+
+def test_async_request_uses_retry_policy(monkeypatch):
+    client = AsyncKalshiClient(AppConfig())
+    calls = {"count": 0}
+
+    async def server_error(*_args, **_kwargs):
+        calls["count"] += 1
+        return _response(500, "server error")
+
+    monkeypatch.setattr(client.transport, "request", server_error)
+    monkeypatch.setattr(AsyncKalshiClient._request.retry, "wait", wait_none())
+
+    with pytest.raises(TransientAPIError):
+        asyncio.run(client.list_markets("KXHIGHCHI"))
+    assert calls["count"] == 4
+
+    calls["count"] = 0
+
+    async def bad_request(*_args, **_kwargs):
+        calls["count"] += 1
+        return _response(400, "bad")
+
+    monkeypatch.setattr(client.transport, "request", bad_request)
+    with pytest.raises(PermanentAPIError):
+        asyncio.run(client.get_orderbook("T1"))
+    assert calls["count"] == 1
+
+
+def test_async_rate_limit_waits_without_blocking_the_loop(monkeypatch):
+    client = AsyncKalshiClient(AppConfig())
+
+    async def slow_down(*_args, **_kwargs):
+        return _response(429, "slow down", headers={"Retry-After": "2"})
+
+    monkeypatch.setattr(client.transport, "request", slow_down)
+    monkeypatch.setattr(AsyncKalshiClient._request.retry, "wait", wait_none())
+    slept: list[float] = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr("kalshi_weather_hitbot.kalshi.client.asyncio.sleep", fake_sleep)
+
+    with pytest.raises(RateLimitError) as excinfo:
+        asyncio.run(client.get_orderbook("T1"))
+    assert excinfo.value.retry_after_seconds == 2.0
+    # Retry-After on every attempt (tenacity's own zero waits aside), awaited on the loop.
+    assert [seconds for seconds in slept if seconds] == [2.0] * 4
+
+
+def test_async_authenticated_calls_require_credentials_and_validate_payloads(monkeypatch):
+    client = AsyncKalshiClient(AppConfig(api_key_id="", private_key_path=""))
+    with pytest.raises(APIError, match="Missing API credentials"):
+        asyncio.run(client.get_balance())
+
+    async def fake_request(*_args, **_kwargs):
+        return {"settlements": None, "cursor": "c2"}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    assert asyncio.run(client.get_settlements(limit=5)) == {"settlements": [], "cursor": "c2"}
+
+
+def test_sync_client_runs_on_the_shared_io_loop(monkeypatch):
+    client = KalshiClient(AppConfig())
+    threads: list[str] = []
+
+    async def fake_request(method, url, **_kwargs):
+        threads.append(threading.current_thread().name)
+        return _response(200, payload={"orderbook": {}, "url": url})
+
+    monkeypatch.setattr(client.aio.transport, "request", fake_request)
+    client.deadline = None
+    client.batch_supported = False
+    assert client.aio.batch_supported is False
+
+    results: list[dict] = []
+    workers = [threading.Thread(target=lambda t=t: results.append(client.get_orderbook(t))) for t in ("T1", "T2", "T3")]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=2.0)
+
+    assert sorted(r["url"].rsplit("/", 2)[-2] for r in results) == ["T1", "T2", "T3"]
+    assert set(threads) == {"kalshi-io"}
+
+    async def blocking_call_inside_the_loop():
+        return client.get_balance()
+
+    with pytest.raises(RuntimeError, match="own I/O loop"):
+        run_sync(blocking_call_inside_the_loop())
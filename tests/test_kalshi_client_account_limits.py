@@ -4,15 +4,22 @@ from kalshi_weather_hitbot.config import AppConfig
 from kalshi_weather_hitbot.kalshi.client import APIError, KalshiClient
 
 
+def _returning(payload):
+    async def fake_request(*_args, **_kwargs):
+        return payload
+
+    return fake_request
+
+
 def test_get_account_limits_returns_payload_dict():
     client = KalshiClient(AppConfig())
-    client._request = lambda *_args, **_kwargs: {"max_open_orders": 100}  # type: ignore[method-assign]
+    client.aio._request = _returning({"max_open_orders": 100})  # type: ignore[method-assign]
     out = client.get_account_limits()
     assert out["max_open_orders"] == 100
 
 
 def test_get_account_limits_raises_on_non_dict_payload():
     client = KalshiClient(AppConfig())
-    client._request = lambda *_args, **_kwargs: []  # type: ignore[method-assign]
+    client.aio._request = _returning([])  # type: ignore[method-assign]
     with pytest.raises(APIError, match="Malformed /trade-api/v2/account/limits response"):
         client.get_account_limits()
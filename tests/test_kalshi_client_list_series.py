@@ -4,9 +4,16 @@ from kalshi_weather_hitbot.config import AppConfig
 from kalshi_weather_hitbot.kalshi.client import APIError, KalshiClient
 
 
+def _returning(payload):
+    async def fake_request(*_args, **_kwargs):
+        return payload
+
+    return fake_request
+
+
 def _client_with_payload(payload):
     client = KalshiClient(AppConfig())
-    client._request = lambda *_args, **_kwargs: payload  # type: ignore[method-assign]
+    client.aio._request = _returning(payload)  # type: ignore[method-assign]
     return client
 
 
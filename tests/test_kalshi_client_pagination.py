@@ -0,0 +1,148 @@
+import asyncio
+import time
+
+import pytest
+
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import APIError, AsyncKalshiClient, KalshiClient
+
+
+def _paged_request(pages: dict, key: str, calls: list):
+    async def fake_request(method, path, *, params=None, json_body=None, authenticated=False):
+        _ = method, json_body, authenticated
+        calls.append((path, dict(params or {})))
+        items, next_cursor = pages[(params or {}).get("cursor")]
+        return {key: items, "cursor": next_cursor}
+
+    return fake_request
+
+
+def test_iter_markets_follows_cursor_across_pages():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {
+        None: ([{"ticker": "A"}, {"ticker": "B"}], "c1"),
+        "c1": ([{"ticker": "C"}], "c2"),
+        "c2": ([{"ticker": "D"}], ""),
+    }
+    client.aio._request = _paged_request(pages, "markets", calls)  # type: ignore[method-assign]
+
+    tickers = [m["ticker"] for m in client.iter_markets(series_ticker="KXHIGHCHI", page_size=2)]
+
+    assert tickers == ["A", "B", "C", "D"]
+    assert [c[1].get("cursor") for c in calls] == [None, "c1", "c2"]
+    assert all(c[1]["series_ticker"] == "KXHIGHCHI" and c[1]["limit"] == 2 for c in calls)
+
+
+def test_iter_orders_max_items_stops_fetching_once_satisfied():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {
+        None: ([{"order_id": "1"}, {"order_id": "2"}], "c1"),
+        "c1": ([{"order_id": "3"}, {"order_id": "4"}], "c2"),
+        "c2": ([{"order_id": "5"}], None),
+    }
+    client.aio._request = _paged_request(pages, "orders", calls)  # type: ignore[method-assign]
+
+    out = list(client.iter_orders(status="resting", max_items=3))
+
+    assert [o["order_id"] for o in out] == ["1", "2", "3"]
+    assert [c[1].get("cursor") for c in calls] == [None, "c1"]
+    assert calls[0][1]["status"] == "resting"
+
+
+def test_repeated_cursor_ends_iteration():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {None: ([{"ticker": "A"}], "same"), "same": ([{"ticker": "B"}], "same")}
+    client.aio._request = _paged_request(pages, "positions", calls)  # type: ignore[method-assign]
+
+    assert [p["ticker"] for p in client.iter_positions()] == ["A", "B"]
+    assert len(calls) == 2
+
+
+def test_list_helpers_drain_every_page():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {None: ([{"ticker": "A"}], "c1"), "c1": ([{"ticker": "B"}], None)}
+    client.aio._request = _paged_request(pages, "positions", calls)  # type: ignore[method-assign]
+
+    assert [p["ticker"] for p in client.get_positions()] == ["A", "B"]
+
+
+def test_list_markets_follows_cursor_up_to_limit():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {None: ([{"ticker": "A"}, {"ticker": "B"}], "c1"), "c1": ([{"ticker": "C"}, {"ticker": "D"}], None)}
+    client.aio._request = _paged_request(pages, "markets", calls)  # type: ignore[method-assign]
+
+    assert [m["ticker"] for m in client.list_markets("KXHIGHCHI", limit=3)] == ["A", "B", "C"]
+    assert [c[1].get("cursor") for c in calls] == [None, "c1"]
+
+
+def test_iter_settlements_validates_each_page():
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    pages = {None: ([{"ticker": "A"}], "c1"), "c1": ("oops", None)}
+    client.aio._request = _paged_request(pages, "settlements", calls)  # type: ignore[method-assign]
+
+    it = client.iter_settlements(page_size=1)
+    assert next(it)["ticker"] == "A"
+    with pytest.raises(APIError, match="Malformed /trade-api/v2/portfolio/settlements response"):
+        next(it)
+
+
+def _wait_for(predicate, timeout=1.0):
+    end = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < end:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_prefetch_requests_the_next_page_while_the_current_one_is_consumed():
+    pages = {None: ([{"order_id": "1"}], "c1"), "c1": ([{"order_id": "2"}], None)}
+
+    client = KalshiClient(AppConfig())
+    calls: list = []
+    client.aio._request = _paged_request(pages, "orders", calls)  # type: ignore[method-assign]
+    it = client.iter_orders()
+    assert next(it)["order_id"] == "1"
+    time.sleep(0.05)
+    assert len(calls) == 1
+    assert [o["order_id"] for o in it] == ["2"]
+
+    calls.clear()
+    it = client.iter_orders(prefetch=True)
+    assert next(it)["order_id"] == "1"
+    assert _wait_for(lambda: len(calls) == 2)
+    assert [o["order_id"] for o in it] == ["2"]
+    assert len(calls) == 2
+
+
+def test_async_pages_prefetch_on_the_same_loop():
+    client = AsyncKalshiClient(AppConfig())
+    calls: list = []
+    pages = {None: ([{"ticker": "A"}], "c1"), "c1": ([{"ticker": "B"}], None)}
+    client._request = _paged_request(pages, "markets", calls)  # type: ignore[method-assign]
+
+    async def scan():
+        seen = []
+        async for market in client.iter_markets(prefetch=True):
+            await asyncio.sleep(0)
+            seen.append((market["ticker"], len(calls)))
+        return seen
+
+    assert asyncio.run(scan()) == [("A", 2), ("B", 2)]
+
+
+def test_get_fills_sends_min_ts_and_returns_one_page():
+    client = KalshiClient(AppConfig())
+    seen: list[tuple[str, dict]] = []
+
+    async def fake_request(_method, path, params=None, **_kwargs):
+        seen.append((path, params))
+        return {"fills": [{"ticker": "T1"}], "cursor": "next"}
+
+    client.aio._request = fake_request  # type: ignore[method-assign]
+    assert client.get_fills(min_ts=1_700_000_000) == [{"ticker": "T1"}]
+    assert seen == [("/trade-api/v2/portfolio/fills", {"limit": 1, "min_ts": 1_700_000_000})]
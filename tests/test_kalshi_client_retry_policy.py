@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
 
 import pytest
 from tenacity import wait_none
 
 from kalshi_weather_hitbot.config import AppConfig
-from kalshi_weather_hitbot.kalshi.client import KalshiClient, PermanentAPIError, RateLimitError, TransientAPIError
+from kalshi_weather_hitbot.kalshi.client import AsyncKalshiClient, KalshiClient, PermanentAPIError, RateLimitError, TransientAPIError
+from kalshi_weather_hitbot.kalshi.transport import TransportError
 
 
 def _response(status_code: int, text: str = "err", headers: dict[str, str] | None = None):
@@ -17,11 +19,11 @@ def test_request_does_not_retry_permanent_400(monkeypatch):
     client = KalshiClient(AppConfig())
     calls = {"count": 0}
 
-    def fake_request(*_args, **_kwargs):
+    async def fake_request(*_args, **_kwargs):
         calls["count"] += 1
         return _response(400, "bad request")
 
-    monkeypatch.setattr(client.session, "request", fake_request)
+    monkeypatch.setattr(client.aio.transport, "request", fake_request)
 
     with pytest.raises(PermanentAPIError):
         client._request("GET", "/trade-api/v2/test")
@@ -33,12 +35,12 @@ def test_request_retries_transient_500(monkeypatch):
     client = KalshiClient(AppConfig())
     calls = {"count": 0}
 
-    def fake_request(*_args, **_kwargs):
+    async def fake_request(*_args, **_kwargs):
         calls["count"] += 1
         return _response(500, "server error")
 
-    monkeypatch.setattr(client.session, "request", fake_request)
-    monkeypatch.setattr(client._request.retry, "wait", wait_none())
+    monkeypatch.setattr(client.aio.transport, "request", fake_request)
+    monkeypatch.setattr(AsyncKalshiClient._request.retry, "wait", wait_none())
 
     with pytest.raises(TransientAPIError):
         client._request("GET", "/trade-api/v2/test")
@@ -47,17 +49,38 @@ def test_request_retries_transient_500(monkeypatch):
 
 
 def test_request_raises_rate_limit_error_and_honors_retry_after(monkeypatch):
-    client = KalshiClient(AppConfig())
-    monkeypatch.setattr(
-        client.session,
-        "request",
-        lambda *_args, **_kwargs: _response(429, "too many requests", headers={"Retry-After": "2"}),
-    )
+    client = AsyncKalshiClient(AppConfig())
+
+    async def fake_request(*_args, **_kwargs):
+        return _response(429, "too many requests", headers={"Retry-After": "2"})
+
+    monkeypatch.setattr(client.transport, "request", fake_request)
     slept: list[float] = []
-    monkeypatch.setattr("kalshi_weather_hitbot.kalshi.client.time.sleep", lambda seconds: slept.append(seconds))
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr("kalshi_weather_hitbot.kalshi.client.asyncio.sleep", fake_sleep)
 
     with pytest.raises(RateLimitError) as excinfo:
-        KalshiClient._request.__wrapped__(client, "GET", "/trade-api/v2/test")
+        asyncio.run(AsyncKalshiClient._request.__wrapped__(client, "GET", "/trade-api/v2/test"))
 
     assert excinfo.value.retry_after_seconds == 2.0
     assert slept == [2.0]
+
+
+def test_network_errors_are_retried_as_transient(monkeypatch):
+    client = KalshiClient(AppConfig())
+    calls = {"count": 0}
+
+    async def fake_request(*_args, **_kwargs):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise TransportError("Connection reset")
+        return _response(200, '{"ok": true}')
+
+    monkeypatch.setattr(client.aio.transport, "request", fake_request)
+    monkeypatch.setattr(AsyncKalshiClient._request.retry, "wait", wait_none())
+
+    assert client._request("GET", "/trade-api/v2/test") == {}
+    assert calls["count"] == 2
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from kalshi_weather_hitbot.kalshi.transport import AsyncHTTPTransport, TransportError
+
+
+class _Server:
+    # Tiny HTTP/1.1 server: answers each request with the next canned reply and
+    # records (connection number, request line, headers, body).
+    def __init__(self, replies: list[bytes | None]) -> None:
+        self.replies = list(replies)
+        self.requests: list[tuple[int, str, dict[str, str], bytes]] = []
+        self.connections = 0
+        self.server: asyncio.AbstractServer | None = None
+
+    async def __aenter__(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aexit__(self, *_exc: object) -> None:
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        conn = self.connections
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                headers: dict[str, str] = {}
+                while (header := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = header.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                self.requests.append((conn, line.decode().strip(), headers, body))
+                reply = self.replies.pop(0)
+                if reply is None:  # drop the connection without answering
+                    return
+                writer.write(reply)
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+def _reply(body: bytes, *headers: str, status: str = "200 OK") -> bytes:
+    head = [f"HTTP/1.1 {status}", *headers]
+    if not any(h.lower().startswith("transfer-encoding") for h in headers):
+        head.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+def test_keep_alive_connection_is_reused_and_bodies_are_decoded():
+    chunked = b"7\r\n{\"a\": 1\r\n1\r\n}\r\n0\r\n\r\n"
+    server = _Server(
+        [
+            _reply(b'{"ok": true}', "Content-Type: application/json"),
+            _reply(chunked, "Transfer-Encoding: chunked"),
+            _reply(gzip.compress(b'{"zipped": 1}'), "Content-Encoding: gzip"),
+        ]
+    )
+
+    async def main():
+        transport = AsyncHTTPTransport({"User-Agent": "hitbot-test"})
+        async with server as base:
+            first = await transport.request("GET", f"{base}/x", params={"a": 1, "skip": None}, headers={"Accept": "application/json"})
+            second = await transport.request("POST", f"{base}/y", json_body={"k": "v"})
+            third = await transport.request("GET", f"{base}/z")
+            await transport.aclose()
+        return first, second, third
+
+    first, second, third = asyncio.run(main())
+
+    assert (first.status_code, first.json()) == (200, {"ok": True})
+    assert first.headers["CONTENT-TYPE"] == "application/json"
+    assert second.json() == {"a": 1}
+    assert third.json() == {"zipped": 1}
+    assert server.connections == 1
+    (_, line1, headers1, _), (_, line2, headers2, body2), _ = server.requests
+    assert line1 == "GET /x?a=1 HTTP/1.1"
+    assert headers1["user-agent"] == "hitbot-test" and headers1["accept"] == "application/json"
+    assert line2 == "POST /y HTTP/1.1"
+    assert headers2["content-type"] == "application/json" and json.loads(body2) == {"k": "v"}
+
+
+def test_stale_pooled_connection_is_resent_on_a_fresh_one():
+    server = _Server([_reply(b"{}"), None, _reply(b'{"again": true}')])
+
+    async def main():
+        transport = AsyncHTTPTransport()
+        async with server as base:
+            await transport.request("GET", f"{base}/a")
+            response = await transport.request("GET", f"{base}/b")
+            await transport.aclose()
+        return response
+
+    assert asyncio.run(main()).json() == {"again": True}
+    assert [(conn, line) for conn, line, _h, _b in server.requests] == [
+        (1, "GET /a HTTP/1.1"),
+        (1, "GET /b HTTP/1.1"),
+        (2, "GET /b HTTP/1.1"),
+    ]
+
+
+def test_fresh_connection_closed_without_reply_is_an_error():
+    server = _Server([None])
+
+    async def main():
+        async with server as base:
+            await AsyncHTTPTransport().request("GET", f"{base}/a")
+
+    with pytest.raises(TransportError, match="without a response"):
+        asyncio.run(main())
+
+
+def test_timeout_and_refused_connection_raise_transport_error():
+    async def never_answer(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await reader.read()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(never_answer, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            with pytest.raises(TransportError, match="Timed out"):
+                await AsyncHTTPTransport().request("GET", f"http://127.0.0.1:{port}/slow", timeout=0.05)
+        finally:
+            server.close()
+            await server.wait_closed()
+        with pytest.raises(TransportError):
+            await AsyncHTTPTransport().request("GET", f"http://127.0.0.1:{port}/gone", timeout=1.0)
+
+    asyncio.run(main())
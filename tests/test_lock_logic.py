@@ -26,3 +26,34 @@ def test_locked_yes_or_below_threshold():
 def test_locked_yes_or_above_threshold():
     out = evaluate_lock(70, None, observed_max=72, forecast_max_remaining=72, safety_bias_f=0, station_uncertainty_f=0)
     assert out.lock_status == "LOCKED_YES"
+
+
+def test_bracket_ladder_matches_evaluate_lock_for_every_bracket():
+    import random
+
+    from kalshi_weather_hitbot.strategy.model import BracketLadder
+
+    rng = random.Random(22)
+    for trial in range(400):
+        base = rng.randint(40, 90)
+        edges = sorted(rng.sample(range(base, base + 30), rng.randint(2, 8)))
+        # A Kalshi-style ladder: "X or below", two-degree brackets, "Y or above".
+        brackets = [(None, float(edges[0]))]
+        brackets += [(float(lo) + 1, float(hi)) for lo, hi in zip(edges, edges[1:])]
+        brackets += [(float(edges[-1]) + 1, None)]
+        if trial % 4 == 0:
+            # Nested/overlapping extras and an unparseable bracket force the fallback path.
+            brackets += [(float(edges[0]), float(edges[-1])), (None, None)]
+        rng.shuffle(brackets)
+        ladder = BracketLadder((i, lo, hi) for i, (lo, hi) in enumerate(brackets))
+        assert len(ladder) == len(brackets)
+        for _ in range(10):
+            observed = rng.choice([rng.uniform(base - 10, base + 40), float(rng.randint(base - 5, base + 35))])
+            kwargs = {
+                "forecast_max_remaining": float(rng.randint(base - 10, base + 40)),
+                "safety_bias_f": rng.choice([0.0, 1.5, 3.0]),
+                "station_uncertainty_f": rng.choice([0.0, 0.5, 1.0, -20.0]),
+            }
+            got = ladder.evaluate(observed, **kwargs)
+            for i, (lo, hi) in enumerate(brackets):
+                assert got[i] == evaluate_lock(lo, hi, observed, **kwargs)
@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from kalshi_weather_hitbot import cli
+from kalshi_weather_hitbot.config import AppConfig, RiskConfig
+from kalshi_weather_hitbot.strategy.triggers import LockTriggerIndex
+
+
+NOW = datetime(2026, 7, 1, 20, 0, tzinfo=timezone.utc)
+START = datetime(2026, 7, 1, 5, 0, tzinfo=timezone.utc)
+
+
+def _candidate(ticker: str, low, high, status: str, observed: float = 80.0, forecast: float = 78.0) -> dict:
+    return {
+        "market_ticker": ticker,
+        "metar_station_used": "KMDW",
+        "window_start": START.isoformat(),
+        "bracket_low": low,
+        "bracket_high": high,
+        "observed_max": observed,
+        "forecast_max_remaining": forecast,
+        "lock_status": status,
+    }
+
+
+def _index() -> LockTriggerIndex:
+    risk = RiskConfig(safety_bias_f=0.0, station_uncertainty_f=0.5)
+    candidates = [
+        _candidate("B80", 80, 81, "UNLOCKED"),
+        _candidate("B82", 82, 84, "LOCKED_NO"),
+        _candidate("B90", 90, None, "LOCKED_NO"),
+        {"market_ticker": "NOSTATION", "lock_status": "UNLOCKED"},
+    ]
+    return LockTriggerIndex.from_candidates(candidates, risk)
+
+
+def test_new_observation_reports_only_markets_whose_lock_flipped():
+    index = _index()
+    assert index.stations() == ["KMDW"] and len(index) == 3
+
+    # 81.4F passes one of B80's thresholds without changing any status.
+    assert index.observe("KMDW", [(NOW - timedelta(minutes=5), 81.4)], NOW) == []
+    hits = index.observe("KMDW", [(NOW - timedelta(minutes=5), 81.4), (NOW, 82.6)], NOW)
+
+    assert [(h.market_ticker, h.previous_status, h.lock_status) for h in hits] == [
+        ("B80", "UNLOCKED", "LOCKED_NO"),
+        ("B82", "LOCKED_NO", "LOCKED_YES"),
+    ]
+    # Same reading again, older readings and other stations are ignored.
+    assert index.observe("KMDW", [(NOW, 82.6)], NOW) == []
+    assert index.observe("KMDW", [(START - timedelta(hours=1), 95.0)], NOW) == []
+    assert index.observe("KORD", [(NOW, 95.0)], NOW) == []
+
+
+def test_wait_for_next_cycle_returns_early_on_trigger(monkeypatch):
+    class FakeMetar:
+        deadline = object()
+
+        def __init__(self):
+            self.polls = 0
+
+        def fetch_metar_bulk(self, stations):
+            self.polls += 1
+            temp_c = 27 if self.polls < 3 else 28.2  # 80.6F, then 82.8F
+            obs_time = datetime.now(timezone.utc) - timedelta(minutes=1)
+            return {s: [{"icaoId": s, "temp": temp_c, "obsTime": obs_time.isoformat()}] for s in stations}
+
+    slept: list[float] = []
+    monkeypatch.setattr(cli, "_sleep_while_running", slept.append)
+    metar = FakeMetar()
+    cfg = AppConfig()
+    cfg.lock_triggers.poll_seconds = 1.0
+    cfg.risk.safety_bias_f = 0.0
+    candidates = [
+        {**_candidate("B82", 82, 84, "LOCKED_NO"), "window_start": (datetime.now(timezone.utc) - timedelta(hours=6)).isoformat()}
+    ]
+    index = LockTriggerIndex.from_candidates(candidates, cfg.risk)
+
+    hits = cli._wait_for_next_cycle(cfg, 3600, metar, index)
+
+    assert [h.market_ticker for h in hits] == ["B82"]
+    assert metar.polls == 3 and slept == [1.0, 1.0, 1.0]
+    assert metar.deadline is None
+    assert "B82(KMDW" in cli._trigger_summary(hits)
+
+
+def test_wait_for_next_cycle_sleeps_out_the_interval_when_a_poll_fails(monkeypatch):
+    class FailingMetar:
+        deadline = None
+
+        def __init__(self):
+            self.polls = 0
+
+        def fetch_metar_bulk(self, stations):
+            self.polls += 1
+            raise requests.ConnectionError("metar down")
+
+    slept: list[float] = []
+    monkeypatch.setattr(cli, "_sleep_while_running", slept.append)
+    cfg = AppConfig()
+    cfg.lock_triggers.poll_seconds = 1.0
+    candidates = [
+        {**_candidate("B82", 82, 84, "LOCKED_NO"), "window_start": (datetime.now(timezone.utc) - timedelta(hours=6)).isoformat()}
+    ]
+    index = LockTriggerIndex.from_candidates(candidates, cfg.risk)
+
+    assert cli._wait_for_next_cycle(cfg, 60, FailingMetar(), index) == []
+    assert slept[0] == 1.0 and len(slept) == 2
+    assert 59.0 < slept[1] <= 60.0
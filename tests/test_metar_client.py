@@ -1,8 +1,8 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import requests
 
-from kalshi_weather_hitbot.data.metar import MetarClient, max_observed_temp_f
+from kalshi_weather_hitbot.data.metar import MetarClient, max_observed_temp_f, parse_observations
 
 
 class _Resp:
@@ -59,3 +59,88 @@ def test_max_observed_temp_f_handles_integer_obs_time():
     out = max_observed_temp_f(records, start, end)
     assert out is not None
     assert out > 86
+
+
+def test_malformed_reports_are_skipped():
+    records = [
+        {"obsTime": "2024-07-01T12:00:00Z", "temp": 30},
+        {"obsTime": "not-a-time", "temp": 40},
+        {"obsTime": "2024-07-01T13:00:00Z", "temp": "M"},
+        {"obsTime": "2024-07-01T14:00:00Z", "temp": None},
+        "garbage",
+    ]
+    start = datetime(2024, 7, 1, 0, 0, tzinfo=timezone.utc)
+    end = datetime(2024, 7, 2, 0, 0, tzinfo=timezone.utc)
+    assert parse_observations(records) == [(datetime(2024, 7, 1, 12, 0, tzinfo=timezone.utc), 86.0)]
+    assert max_observed_temp_f(records, start, end) == 86.0
+
+
+class _JSONResp:
+    status_code = 200
+    headers = {"Content-Type": "application/json"}
+
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._data
+
+
+class _HistorySession:
+    headers = {}
+
+    def __init__(self, reports):
+        self.reports = reports  # (obs time, temp C), as the server currently knows them
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        _ = url, timeout
+        self.calls.append(params)
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=params["hours"])
+        return _JSONResp(
+            [
+                {"icaoId": s, "obsTime": ts.isoformat(), "temp": temp}
+                for s in params["ids"].split(",")
+                for ts, temp in self.reports
+                if ts >= cutoff
+            ]
+        )
+
+
+def test_incremental_fetch_backfills_then_requests_short_window_and_merges():
+    now = datetime.now(timezone.utc)
+    session = _HistorySession([(now - timedelta(hours=h), 20 + h) for h in (30, 20, 5, 1)])
+    client = MetarClient("https://aviationweather.gov", "test-agent", ttl_seconds=0, incremental_hours=2)
+    client.session = session  # type: ignore[assignment]
+
+    first = client.fetch_metar("KMDW")
+    assert session.calls[-1]["hours"] == 24
+    assert [r["temp"] for r in first] == [21, 25, 40]
+
+    # No new report: short request, and the very same merged list comes back.
+    assert client.fetch_metar("KMDW") is first
+    assert session.calls[-1]["hours"] == 2
+
+    session.reports.append((now - timedelta(minutes=1), 19))
+    out = client.fetch_metar_bulk(["KMDW"])["KMDW"]
+    assert session.calls[-1]["hours"] == 2
+    assert [r["temp"] for r in out] == [19, 21, 25, 40]
+
+    # A gap since the last good fetch widens the next request to cover it.
+    client._history[("KMDW", 24)].fetched_at = now - timedelta(hours=6, minutes=30)
+    client.fetch_metar("KMDW")
+    assert session.calls[-1]["hours"] == 8
+
+
+def test_incremental_fetch_disabled_always_requests_full_window():
+    session = _HistorySession([(datetime.now(timezone.utc), 20)])
+    client = MetarClient("https://aviationweather.gov", "test-agent", ttl_seconds=0)
+    client.session = session  # type: ignore[assignment]
+
+    client.fetch_metar("KMDW")
+    client.fetch_metar("KMDW")
+
+    assert [c["hours"] for c in session.calls] == [24, 24]
@@ -48,7 +48,8 @@ class _SequenceSession:
 
 
 def _valid_records():
-    return [{"temp": 15, "obsTime": "2026-02-25T15:00:00Z"}]
+    obs_time = (datetime.now(timezone.utc) - timedelta(minutes=10)).replace(second=0, microsecond=0)
+    return [{"icaoId": "KMDW", "temp": 15, "obsTime": obs_time.isoformat()}]
 
 
 def test_204_then_success_uses_fallback_station():
@@ -110,8 +111,8 @@ def test_scan_once_reuses_injected_metar_client_cache(monkeypatch, tmp_path: Pat
         def __init__(self, _cfg=None):
             pass
 
-        def list_markets(self, series_ticker: str, limit: int = 100, status: str = "open"):
-            _ = series_ticker, limit, status
+        def iter_markets(self, series_ticker=None, status: str = "open", page_size: int = 100, max_items=None):
+            _ = series_ticker, status, page_size, max_items
             return [{"ticker": "KXHIGHCHI-TEST"}]
 
     class FakeNWS:
@@ -137,13 +138,7 @@ def test_scan_once_reuses_injected_metar_client_cache(monkeypatch, tmp_path: Pat
         bracket_high=75,
         close_ts=datetime.now(timezone.utc) + timedelta(hours=2),
     ))
-    monkeypatch.setattr("kalshi_weather_hitbot.cli.max_forecast_temp_f", lambda periods, now_utc, close_ts: 80.0)
-    monkeypatch.setattr("kalshi_weather_hitbot.cli.evaluate_lock", lambda *args, **kwargs: SimpleNamespace(
-        min_possible=76.0,
-        max_possible=85.0,
-        lock_status="LOCKED_YES",
-        p_yes=0.99,
-    ))
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.climate_window_start", lambda close_ts, _tz: close_ts - timedelta(days=1))
 
     metar = MetarClient("https://aviationweather.gov", "test-agent", timeout_seconds=5, cooldown_seconds=600)
     session = _SequenceSession([_Resp(status_code=200, payload=_valid_records(), headers={"Content-Type": "application/json"})])
@@ -154,6 +149,56 @@ def test_scan_once_reuses_injected_metar_client_cache(monkeypatch, tmp_path: Pat
     out2 = _scan_once(cfg, client=FakeClient(), metar=metar, nws=FakeNWS())
 
     assert out1 and out2
-    assert session.calls == ["KMDW"]  # second scan hits METAR cache on same client instance
+    assert session.calls == ["KMDW,KORD"]  # one bulk request; second scan hits METAR cache on same client instance
     assert out1[0]["metar_station_used"] == "KMDW"
     assert out1[0]["metar_status"] == "ok"
+
+
+def test_fetch_metar_bulk_splits_by_station_into_per_station_cache():
+    client = MetarClient("https://aviationweather.gov", "test-agent", timeout_seconds=5, cooldown_seconds=600)
+    session = _SequenceSession(
+        [
+            _Resp(
+                status_code=200,
+                payload=[
+                    {"icaoId": "KAAA", "temp": 10, "obsTime": "2026-02-25T15:00:00Z"},
+                    {"icaoId": "KAAA", "temp": 11, "obsTime": "2026-02-25T16:00:00Z"},
+                    {"icaoId": "KCCC", "temp": 12, "obsTime": "2026-02-25T16:00:00Z"},
+                ],
+                headers={"Content-Type": "application/json"},
+            )
+        ]
+    )
+    client.session = session  # type: ignore[assignment]
+
+    out = client.fetch_metar_bulk(["KAAA", "KBBB", "KCCC", "KAAA"])
+
+    assert session.calls == ["KAAA,KBBB,KCCC"]
+    assert len(out["KAAA"]) == 2
+    assert out["KBBB"] == []
+    assert len(out["KCCC"]) == 1
+
+    records, station_used, status = client.fetch_metar_with_fallbacks(["KBBB", "KCCC"])
+    assert status == "ok"
+    assert station_used == "KCCC"
+    assert records == out["KCCC"]
+    assert client.station_cooldown.get("KBBB") is True
+    assert session.calls == ["KAAA,KBBB,KCCC"]
+
+
+def test_fetch_metar_bulk_chunks_requests_and_marks_errors():
+    client = MetarClient("https://aviationweather.gov", "test-agent", bulk_chunk_size=2)
+    session = _SequenceSession(
+        [
+            requests.Timeout("timeout"),
+            _Resp(status_code=200, payload=[{"icaoId": "KCCC", "temp": 12, "obsTime": "2026-02-25T16:00:00Z"}]),
+        ]
+    )
+    client.session = session  # type: ignore[assignment]
+
+    out = client.fetch_metar_bulk(["KAAA", "KBBB", "KCCC"])
+
+    assert session.calls == ["KAAA,KBBB", "KCCC"]
+    assert out["KAAA"] == [] and out["KBBB"] == []
+    records, station_used, status = client.fetch_metar_with_fallbacks(["KAAA", "KBBB"])
+    assert (records, station_used, status) == ([], None, "error_all")
@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from kalshi_weather_hitbot.config import RiskConfig
+from kalshi_weather_hitbot.kalshi.models import Market, Order, OrderBookTop, Position
+from kalshi_weather_hitbot.strategy.execution import select_exit_order
+from kalshi_weather_hitbot.strategy.order_maintenance import order_age_seconds, parse_order_price_cents
+from kalshi_weather_hitbot.strategy.risk import (
+    check_entry_risk_limits,
+    compute_open_orders_exposure,
+    compute_positions_exposure,
+    count_open_positions,
+    exposure_dollars_for_ticker,
+)
+from kalshi_weather_hitbot.strategy.screener import parse_temperature_market
+
+
+def test_order_from_api_resolves_aliases_and_fixed_point_fields():
+    order = Order.from_api(
+        {
+            "id": "o1",
+            "market_ticker": "T1",
+            "side": "NO",
+            "action": "Buy",
+            "status": "resting",
+            "count_fp": "3.00",
+            "no_price_dollars": "0.4100",
+            "created_time": "2026-02-25T12:58:30Z",
+        }
+    )
+    assert (order.order_id, order.ticker, order.side, order.action) == ("o1", "T1", "no", "buy")
+    assert order.remaining_count == 3.0
+    assert order.price_cents == 41
+    assert order.buy_exposure_dollars == pytest.approx(1.23)
+    assert order_age_seconds(order, datetime(2026, 2, 25, 13, 0, tzinfo=timezone.utc)) == 90.0
+    assert parse_order_price_cents(order) == parse_order_price_cents(order.raw) == 41
+
+
+def test_position_from_api_prefers_market_exposure_and_falls_back_to_notional():
+    reported = Position.from_api({"ticker": "A", "position": 4, "market_exposure_dollars": "1.2000"})
+    fallback = Position.from_api({"market_ticker": "B", "contracts": -2, "average_price": 50, "position_side": "no"})
+    assert (reported.contracts, reported.exposure_dollars, reported.is_open) == (4.0, 1.2, True)
+    assert (fallback.ticker, fallback.side, fallback.avg_price_cents) == ("B", "NO", 50)
+    assert fallback.exposure_dollars == pytest.approx(1.1)
+
+
+def test_risk_functions_give_same_results_for_records_and_dicts():
+    positions = [
+        {"ticker": "T1", "market_exposure_dollars": "3.50", "position": 2},
+        {"ticker": "T2", "contracts": 1, "avg_price": 40},
+        {"ticker": "T3", "contracts": 0},
+    ]
+    orders = [
+        {"ticker": "T1", "action": "buy", "side": "yes", "remaining_count": 2, "yes_price": 15},
+        {"market_ticker": "T1", "action": "buy", "buy_max_cost_dollars": "1.25"},
+        {"ticker": "T2", "action": "sell", "side": "no", "count": 1, "no_price": 60},
+    ]
+    position_records = [Position.from_api(p) for p in positions]
+    order_records = [Order.from_api(o) for o in orders]
+    risk = RiskConfig(max_open_positions=5, max_orders_per_market=5, max_per_market_notional=5.0)
+
+    assert compute_positions_exposure(position_records) == compute_positions_exposure(positions)
+    assert compute_open_orders_exposure(order_records) == compute_open_orders_exposure(orders)
+    assert count_open_positions(position_records) == count_open_positions(positions) == 2
+    for ticker in ("T1", "T2", "T3"):
+        assert exposure_dollars_for_ticker(position_records, order_records, ticker) == exposure_dollars_for_ticker(
+            positions, orders, ticker
+        )
+        assert check_entry_risk_limits(ticker, 0.5, position_records, order_records, risk) == check_entry_risk_limits(
+            ticker, 0.5, positions, orders, risk
+        )
+
+
+def test_select_exit_order_accepts_position_record():
+    risk = RiskConfig(min_profit_cents=1, take_profit_cents=90, min_liquidity_contracts=1, max_spread_cents=5)
+    book = OrderBookTop(95, 97, 2, 4, yes_bid_size=10, yes_ask_size=10, no_bid_size=10, no_ask_size=10)
+    raw = {"side": "yes", "contracts": 2, "avg_price": 60}
+    assert select_exit_order(Position.from_api(raw), book, risk) == select_exit_order(raw, book, risk)
+
+
+def test_parse_temperature_market_accepts_market_record():
+    raw = {"ticker": "KXHIGHNY-1", "floor_strike": 70, "cap_strike": 71, "close_time": "2026-07-01T04:00:00Z"}
+    market = Market.from_api(raw)
+    assert market.close_ts == datetime(2026, 7, 1, 4, 0, tzinfo=timezone.utc)
+    assert parse_temperature_market(market) == parse_temperature_market(raw)
+    assert parse_temperature_market(Market.from_api({"floor_strike": 70})) is None
+
+
+def test_position_keeps_fractional_average_price():
+    raw = {"ticker": "T1", "side": "yes", "contracts": 2, "avg_price": "60.7"}
+    position = Position.from_api(raw)
+    assert position.avg_price_cents == 60.7
+    assert position.exposure_dollars == pytest.approx(2 * 0.607 * 1.1)
+    assert compute_positions_exposure([position]) == pytest.approx(compute_positions_exposure([raw]))
+
+    # Exit profit checks still truncate the entry price to whole cents, as before.
+    risk = RiskConfig(min_profit_cents=36, take_profit_cents=90, min_liquidity_contracts=1, max_spread_cents=5)
+    book = OrderBookTop(96, 97, 2, 4, yes_bid_size=10, yes_ask_size=10, no_bid_size=10, no_ask_size=10)
+    assert select_exit_order(position, book, risk).should_trade is True
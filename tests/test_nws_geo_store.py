@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+import requests
+
+from kalshi_weather_hitbot.data.city_bootstrap import _resolve_timezone
+from kalshi_weather_hitbot.data.geo_store import GeoMetadataStore
+from kalshi_weather_hitbot.data.nws import NWSClient
+
+
+POINTS = {
+    "properties": {
+        "forecastHourly": "https://api.weather.gov/gridpoints/LOT/75,72/forecast/hourly",
+        "gridId": "LOT",
+        "gridX": 75,
+        "gridY": 72,
+        "timeZone": "America/Chicago",
+    }
+}
+
+
+class _Resp:
+    def __init__(self, payload: dict, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+        self.text = ""
+        self.headers = {"Content-Type": "application/geo+json"}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+    def json(self):
+        return self._payload
+
+
+class _Session:
+    def __init__(self, fail_forecast: bool = False):
+        self.calls: list[str] = []
+        self.fail_forecast = fail_forecast
+        self.headers: dict = {}
+
+    def get(self, url, timeout=None):
+        _ = timeout
+        self.calls.append(url)
+        if "/points/" in url:
+            return _Resp(POINTS)
+        if self.fail_forecast:
+            return _Resp({}, status_code=500)
+        return _Resp({"properties": {"periods": [{"startTime": "2026-02-25T12:00:00+00:00", "temperature": 40}]}})
+
+
+def _client(store: GeoMetadataStore, session: _Session) -> NWSClient:
+    client = NWSClient("https://api.weather.gov", "test-agent", geo_store=store)
+    client.session = session
+    return client
+
+
+def test_points_lookup_persists_across_clients(tmp_path: Path):
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"))
+    first = _Session()
+    assert len(_client(store, first).hourly_forecast(41.7868, -87.7522)) == 1
+    assert sum("/points/" in c for c in first.calls) == 1
+
+    # A fresh client (e.g. after restart) goes straight to the forecast URL.
+    second = _Session()
+    _client(GeoMetadataStore(str(tmp_path / "geo.sqlite3")), second).hourly_forecast(41.7868, -87.7522)
+    assert second.calls == [POINTS["properties"]["forecastHourly"]]
+
+    point = store.get(41.7868, -87.7522)
+    assert point is not None
+    assert (point.grid_id, point.grid_x, point.grid_y, point.time_zone) == ("LOT", 75, 72, "America/Chicago")
+
+
+def test_forecast_failure_invalidates_cached_point(tmp_path: Path):
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"))
+    store.put(41.7868, -87.7522, POINTS)
+
+    with pytest.raises(requests.HTTPError):
+        _client(store, _Session(fail_forecast=True)).hourly_forecast(41.7868, -87.7522)
+    assert store.get(41.7868, -87.7522) is None
+
+
+def test_expired_points_are_refetched(tmp_path: Path):
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"), ttl_seconds=0)
+    store.put(41.7868, -87.7522, POINTS)
+    session = _Session()
+    _client(store, session).hourly_forecast(41.7868, -87.7522)
+    assert sum("/points/" in c for c in session.calls) == 1
+
+
+def test_bootstrap_timezone_reads_geo_store(tmp_path: Path):
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"))
+    store.put(41.7868, -87.7522, POINTS)
+    session = _Session()
+    assert _resolve_timezone(session, "https://api.weather.gov", 41.7868, -87.7522, geo_store=store) == "America/Chicago"
+    assert session.calls == []
+
+
+def test_repeat_lookups_are_served_from_memory(tmp_path: Path, monkeypatch):
+    GeoMetadataStore(str(tmp_path / "geo.sqlite3")).put(41.7868, -87.7522, POINTS)
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"))
+    assert store.get(41.7868, -87.7522) is not None
+
+    def _no_disk():
+        raise AssertionError("sqlite opened for a cached point")
+
+    monkeypatch.setattr(store, "_connect", _no_disk)
+    for _ in range(3):
+        assert store.get(41.7868, -87.7522).grid_id == "LOT"
+
+
+@pytest.mark.parametrize("payload", [[POINTS], "oops", {"properties": ["not", "an", "object"]}])
+def test_bootstrap_timezone_tolerates_non_object_points_payload(tmp_path: Path, payload):
+    class _OddSession:
+        def get(self, url, timeout=None):
+            _ = url, timeout
+            return _Resp(payload)
+
+    store = GeoMetadataStore(str(tmp_path / "geo.sqlite3"))
+    assert _resolve_timezone(_OddSession(), "https://api.weather.gov", 41.7868, -87.7522, geo_store=store) is None
+    assert _resolve_timezone(_OddSession(), "https://api.weather.gov", 41.7868, -87.7522) is None
+
+
+def test_bootstrap_timezone_survives_geo_store_write_failure(tmp_path: Path):
+    class _BrokenStore:
+        def get(self, lat, lon):
+            return None
+
+        def put(self, lat, lon, payload):
+            raise sqlite3.OperationalError("database is locked")
+
+        def invalidate(self, lat, lon):
+            raise sqlite3.OperationalError("database is locked")
+
+    assert _resolve_timezone(_Session(), "https://api.weather.gov", 41.7868, -87.7522, geo_store=_BrokenStore()) is None
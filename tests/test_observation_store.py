@@ -0,0 +1,94 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from kalshi_weather_hitbot.data import observations
+from kalshi_weather_hitbot.data.metar import max_observed_temp_f
+from kalshi_weather_hitbot.data.observations import ObservationStore
+from kalshi_weather_hitbot.data.weather_context import build_city_weather_context
+from kalshi_weather_hitbot.strategy.screener import climate_window_start
+
+
+TZ = "America/Chicago"
+
+
+def _record(ts: datetime, temp_c: float | None) -> dict:
+    return {"icaoId": "KMDW", "obsTime": ts.isoformat().replace("+00:00", "Z"), "temp": temp_c}
+
+
+def test_window_max_matches_linear_scan_across_dst_and_appends():
+    rng = random.Random(24)
+    # Spans the November fall-back, where climate-day keys briefly run backwards.
+    t = datetime(2026, 10, 30, 0, 7, tzinfo=timezone.utc)
+    history = ObservationStore(horizon_hours=1000).station("kmdw", TZ)
+    records: list[dict] = []
+    while t < datetime(2026, 11, 4, tzinfo=timezone.utc):
+        batch = [_record(t, rng.choice([None, round(rng.uniform(-5, 25), 1)]))]
+        if rng.random() < 0.2 and records:
+            batch.append(rng.choice(records))  # resent report
+        t += timedelta(minutes=rng.choice([20, 53, 60, 75]))
+        records.extend(batch)
+        history.ingest(batch)
+
+        now = t - timedelta(minutes=1)
+        starts = {climate_window_start(now - timedelta(hours=h), TZ) for h in (0, 12, 30)}
+        for start in starts | {now - timedelta(hours=3)}:
+            assert history.max_between(start, now) == max_observed_temp_f(records, start, now)
+
+
+def test_dedup_correction_and_rolling_horizon():
+    base = datetime(2026, 7, 1, 12, 0, tzinfo=timezone.utc)
+    history = ObservationStore(horizon_hours=24).station("KMDW", TZ)
+    start = climate_window_start(base, TZ)
+    batch = [_record(base, 30), _record(base + timedelta(hours=1), 25)]
+
+    assert history.ingest(batch) == 2
+    assert history.ingest(batch) == 0
+    assert history.max_between(start, base + timedelta(hours=2)) == 86.0
+    # A corrected report for the same time replaces the reading and lowers the day max.
+    assert history.ingest([_record(base, 20)]) == 0
+    assert history.max_between(start, base + timedelta(hours=2)) == 77.0
+
+    history.ingest([_record(base + timedelta(hours=h), 10) for h in range(2, 40)])
+    assert len(history) == 25
+    assert history.max_between(start, base + timedelta(hours=40)) == 50.0
+
+
+def test_refreshed_window_only_parses_new_or_corrected_reports(monkeypatch):
+    parsed: list[str] = []
+    real = observations._parse_observation
+
+    def counting(record):
+        parsed.append(record["obsTime"])
+        return real(record)
+
+    monkeypatch.setattr(observations, "_parse_observation", counting)
+    base = datetime(2026, 7, 1, 12, 0, tzinfo=timezone.utc)
+    history = ObservationStore().station("KMDW", TZ)
+    window = [_record(base + timedelta(hours=h), 20 + h) for h in range(6)]
+
+    assert history.ingest(list(window)) == 6
+    assert len(parsed) == 6
+    # A refetched window (new list object) with one new and one corrected report.
+    window[2] = _record(base + timedelta(hours=2), 10)
+    parsed.clear()
+    assert history.ingest([*window, _record(base + timedelta(hours=6), 21)]) == 1
+    assert parsed == [window[2]["obsTime"], _record(base + timedelta(hours=6), 0)["obsTime"]]
+    assert history.max_between(climate_window_start(base, TZ), base + timedelta(hours=7)) == 77.0
+
+
+def test_weather_context_reads_station_history_across_cycles():
+    now = datetime(2026, 7, 1, 20, 0, tzinfo=timezone.utc)
+    store = ObservationStore()
+    fetched = [[_record(now - timedelta(hours=3), 30)], [_record(now - timedelta(hours=1), 28)]]
+
+    class FakeMetar:
+        def fetch_metar_with_fallbacks(self, stations):
+            return fetched.pop(0), stations[0], "ok"
+
+    city = {"lat": 41.8, "lon": -87.7, "tz": TZ}
+    start = climate_window_start(now, TZ)
+    first = build_city_weather_context(FakeMetar(), None, city, ["KMDW"], now, observations=store)
+    second = build_city_weather_context(FakeMetar(), None, city, ["KMDW"], now, observations=store)
+
+    assert first.observed_max(start) == second.observed_max(start) == 86.0
+    assert len(store.station("KMDW", TZ)) == 2
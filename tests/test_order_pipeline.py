@@ -0,0 +1,70 @@
+import threading
+import time
+
+from kalshi_weather_hitbot.cli import _submit_entry_orders
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import APIError
+from kalshi_weather_hitbot.kalshi.order_pipeline import OrderSubmitPipeline, OrderSubmitStats
+
+
+def test_pipeline_bounds_in_flight_and_keeps_input_order():
+    pipeline = OrderSubmitPipeline(max_in_flight=2)
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def submit(item):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        if item == "bad":
+            raise APIError("rejected")
+        return {"item": item}
+
+    outcomes = pipeline.submit_all(["a", "b", "bad", "d", "e"], submit)
+
+    assert [o.response["item"] if o.response else None for o in outcomes] == ["a", "b", None, "d", "e"]
+    assert str(outcomes[2].error) == "rejected"
+    assert state["peak"] == 2
+    assert pipeline.peak_in_flight == 2
+    assert all(o.latency_ms >= 15 for o in outcomes)
+    stats = OrderSubmitStats.from_outcomes(outcomes, pipeline.peak_in_flight)
+    assert stats.submitted == 5 and stats.errors == 1
+
+
+def test_pipeline_starts_items_in_priority_order():
+    started: list[str] = []
+    pipeline = OrderSubmitPipeline(max_in_flight=1)
+    pipeline.submit_all(["high", "mid", "low"], lambda item: started.append(item) or {})
+    assert started == ["high", "mid", "low"]
+
+
+def test_submit_entry_orders_without_batch_support_runs_concurrently():
+    class _Client:
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.in_flight = 0
+            self.peak = 0
+
+        def place_order(self, payload):
+            with self.lock:
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+            time.sleep(0.02)
+            with self.lock:
+                self.in_flight -= 1
+            return {"order": {"client_order_id": payload["client_order_id"]}}
+
+    cfg = AppConfig()
+    cfg.risk.max_in_flight_orders = 3
+    client = _Client()
+    planned = [
+        {"ticker": f"T{i}", "side": "YES", "order": {"client_order_id": f"c{i}", "yes_price": 50}} for i in range(6)
+    ]
+
+    outcomes = _submit_entry_orders(client, planned, cfg=cfg)
+
+    assert [o.response["order"]["client_order_id"] for o in outcomes] == [f"c{i}" for i in range(6)]
+    assert client.peak == 3
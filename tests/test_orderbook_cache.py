@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from kalshi_weather_hitbot.cli import _place_entry_order_with_post_only_cross_fallback
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import APIError
+from kalshi_weather_hitbot.kalshi.orderbook_cache import OrderbookCache
+
+
+def _book(no_bid: int) -> dict:
+    return {"orderbook": {"yes": [[10, 1]], "no": [[no_bid, 5]]}}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_hits_within_cycle_and_refreshes_for_strict_uses():
+    calls: list[str] = []
+    clock = _Clock()
+
+    def fetch(ticker: str) -> dict:
+        calls.append(ticker)
+        return _book(40)
+
+    cache = OrderbookCache(fetch, clock=clock)
+    first = cache.get("T1", use="entry")
+    clock.now += 30
+    assert cache.get("T1", use="maintenance") is first
+    assert calls == ["T1"]
+
+    # Retry demands a book under 1s old, so the 30s-old entry book is refetched.
+    cache.get("T1", use="retry")
+    assert calls == ["T1", "T1"]
+    clock.now += 0.5
+    cache.get("T1", use="retry")
+    assert calls == ["T1", "T1"]
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stale_refreshes) == (2, 2, 1)
+
+
+def test_concurrent_gets_share_one_fetch():
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[str] = []
+
+    def fetch(ticker: str) -> dict:
+        calls.append(ticker)
+        started.set()
+        release.wait(5.0)
+        return _book(40)
+
+    cache = OrderbookCache(fetch)
+    results = []
+    owner = threading.Thread(target=lambda: results.append(cache.get("T1")))
+    owner.start()
+    started.wait(5.0)
+    waiters = [threading.Thread(target=lambda: results.append(cache.get("T1"))) for _ in range(3)]
+    for t in waiters:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in [owner, *waiters]:
+        t.join()
+
+    assert calls == ["T1"]
+    assert len(results) == 4 and all(r is results[0] for r in results)
+    assert cache.stats().single_flight_waits == 3
+
+
+def test_fetch_errors_are_not_cached():
+    attempts = {"n": 0}
+
+    def fetch(ticker: str) -> dict:
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            raise APIError("boom")
+        return _book(40)
+
+    cache = OrderbookCache(fetch)
+    with pytest.raises(APIError):
+        cache.get("T1")
+    assert cache.get("T1").best_yes_ask_cents == 60
+    assert cache.stats().errors == 1
+
+
+def test_post_only_retry_reads_through_shared_cache():
+    class _Client:
+        def __init__(self) -> None:
+            self.orders: list[dict] = []
+            self.book_calls = 0
+
+        def place_order(self, payload):
+            self.orders.append(dict(payload))
+            if len(self.orders) == 1:
+                raise APIError("post only cross")
+            return {"ok": True}
+
+        def get_orderbook(self, ticker):
+            _ = ticker
+            self.book_calls += 1
+            return _book(40)
+
+    client = _Client()
+    cfg = AppConfig()
+    cfg.risk.send_price_in_dollars = False
+    cache = OrderbookCache(client.get_orderbook)
+    cache.get("TEST", use="entry")
+    order = {"ticker": "TEST", "side": "yes", "action": "buy", "count": 1, "post_only": True, "yes_price": 60}
+
+    out = _place_entry_order_with_post_only_cross_fallback(client, order, ticker="TEST", side="YES", cfg=cfg, orderbooks=cache)
+
+    assert out == {"ok": True}
+    assert client.book_calls == 1
+    assert client.orders[1]["yes_price"] == 59
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import AsyncKalshiClient, RateLimitError
+from kalshi_weather_hitbot.utils.rate_governor import (
+    Priority,
+    RateGovernor,
+    kalshi_rates_from_account_limits,
+    request_priority,
+)
+
+
+def test_request_priority_lanes():
+    assert request_priority("POST", "/trade-api/v2/portfolio/orders") == Priority.ORDER
+    assert request_priority("DELETE", "/trade-api/v2/portfolio/orders/abc") == Priority.ORDER
+    assert request_priority("GET", "/trade-api/v2/markets/T1/orderbook") == Priority.READ
+    assert request_priority("GET", "/trade-api/v2/portfolio/positions") == Priority.READ
+    assert request_priority("GET", "/trade-api/v2/markets") == Priority.DISCOVERY
+
+
+def test_bucket_spaces_requests_at_configured_rate():
+    governor = RateGovernor()
+    governor.configure("https://example.test/api", 20.0, burst=1.0)
+
+    started = time.monotonic()
+    waits = [governor.acquire("https://example.test/other", Priority.READ) for _ in range(4)]
+    elapsed = time.monotonic() - started
+
+    assert waits[0] == 0.0
+    assert elapsed >= 0.14
+    stats = governor.stats()["example.test"]
+    assert stats.acquired == 4
+    assert stats.waited == 3
+    assert stats.wait_seconds_by_priority["read"] > 0
+
+
+def test_async_acquire_waits_on_the_loop_and_shares_the_bucket():
+    governor = RateGovernor()
+    governor.configure("host.test", 20.0, burst=1.0)
+    assert governor.acquire("host.test", Priority.READ) == 0.0
+    ticks: list[float] = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def acquire():
+        waited = await governor.acquire_async("host.test", Priority.ORDER)
+        return waited, time.monotonic()
+
+    async def main():
+        _, (waited, granted_at) = await asyncio.gather(ticker(), acquire())
+        return waited, granted_at
+
+    waited, granted_at = asyncio.run(main())
+
+    assert waited >= 0.03
+    # The loop kept running while the token refilled.
+    assert sum(tick < granted_at for tick in ticks) >= 3
+    stats = governor.stats()["host.test"]
+    assert stats.acquired == 2 and stats.waited == 1
+
+
+def test_unconfigured_host_is_not_throttled():
+    governor = RateGovernor()
+    assert governor.acquire("https://unknown.test/x") == 0.0
+    assert governor.stats() == {}
+
+
+def test_saturated_host_serves_orders_before_discovery():
+    governor = RateGovernor()
+    governor.configure("host.test", 10.0, burst=1.0)
+    governor.acquire("host.test")
+    governor.penalize("host.test", 0.2)
+    order: list[str] = []
+
+    def worker(name: str, priority: Priority) -> None:
+        governor.acquire("host.test", priority)
+        order.append(name)
+
+    threads = [threading.Thread(target=worker, args=(f"discovery{i}", Priority.DISCOVERY)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    urgent = threading.Thread(target=worker, args=("order", Priority.ORDER))
+    urgent.start()
+    for thread in [*threads, urgent]:
+        thread.join(timeout=2.0)
+
+    assert order[0] == "order"
+    assert governor.stats()["host.test"].penalties == 1
+
+
+def test_kalshi_rates_from_account_limits_payload_shapes():
+    assert kalshi_rates_from_account_limits({"read_limit": 30, "write_limit": 15}) == (30.0, 15.0)
+    assert kalshi_rates_from_account_limits({"limits": {"read_limit": {"per_second": 100}}}) == (100.0, None)
+    assert kalshi_rates_from_account_limits({"max_open_orders": 100}) == (None, None)
+
+
+def test_client_penalizes_governor_instead_of_sleeping_on_429(monkeypatch):
+    governor = RateGovernor()
+    cfg = AppConfig()
+    governor.configure(cfg.base_url, 50.0)
+    governor.configure(f"{RateGovernor.key_for(cfg.base_url)}#write", 50.0)
+    client = AsyncKalshiClient(cfg, rate_governor=governor)
+
+    async def fake_request(*_args, **_kwargs):
+        return SimpleNamespace(status_code=429, text="slow down", headers={"Retry-After": "2"}, json=lambda: {})
+
+    monkeypatch.setattr(client.transport, "request", fake_request)
+    slept: list[float] = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr("kalshi_weather_hitbot.kalshi.client.asyncio.sleep", fake_sleep)
+
+    try:
+        asyncio.run(AsyncKalshiClient._request.__wrapped__(client, "POST", "/trade-api/v2/portfolio/orders"))
+    except RateLimitError:
+        pass
+
+    assert slept == []
+    stats = governor.stats()
+    assert stats[f"{RateGovernor.key_for(cfg.base_url)}#write"].penalties == 1
+    assert stats[RateGovernor.key_for(cfg.base_url)].penalties == 0
@@ -56,3 +56,44 @@ def test_check_entry_risk_limits_blocks_max_per_market_notional():
     allowed, reason = check_entry_risk_limits("T1", 0.50, positions, active_orders, risk)
     assert allowed is False
     assert reason == "Max per-market notional exceeded"
+
+
+def test_exposure_index_matches_list_scans_through_incremental_updates():
+    import random
+
+    from kalshi_weather_hitbot.strategy.risk import ExposureIndex
+
+    rng = random.Random(7)
+    tickers = [f"T{i}" for i in range(6)]
+    positions = [
+        {"ticker": rng.choice(tickers), "market_exposure": rng.randint(0, 500), "position": rng.randint(-3, 3), "avg_price": 37}
+        for _ in range(20)
+    ]
+    orders = [
+        {
+            "market_ticker" if i % 3 == 0 else "ticker": rng.choice(tickers),
+            "action": rng.choice(["buy", "sell"]),
+            "side": rng.choice(["yes", "no"]),
+            "count": rng.randint(1, 9),
+            "yes_price": rng.randint(1, 99),
+            "no_price": rng.randint(1, 99),
+        }
+        for i in range(30)
+    ]
+    index = ExposureIndex(positions, orders)
+    added = [{"ticker": rng.choice(tickers), "action": "buy", "side": "yes", "count": 2, "buy_max_cost_dollars": 0.37} for _ in range(5)]
+    for order in added:
+        orders.append(order)
+        index.add_order(order)
+    orders.remove(added[2])
+    index.remove_order(added[2])
+
+    assert index.open_positions == count_open_positions(positions)
+    for ticker in [*tickers, "MISSING"]:
+        assert index.active_orders_for_ticker(ticker) == count_active_orders_for_ticker(orders, ticker)
+        assert index.exposure_for_ticker(ticker) == exposure_dollars_for_ticker(positions, orders, ticker)
+    risk = RiskConfig(max_open_positions=50, max_orders_per_market=4, max_per_market_notional=12.0)
+    for ticker in tickers:
+        assert check_entry_risk_limits(ticker, 1.5, positions, orders, risk, index=index) == check_entry_risk_limits(
+            ticker, 1.5, positions, orders, risk
+        )
@@ -6,14 +6,16 @@ from kalshi_weather_hitbot.config import AppConfig
 
 def test_scan_uses_city_series_tickers(monkeypatch, tmp_path: Path):
     calls = []
+    paging = []
 
     class FakeClient:
         def __init__(self, cfg):
             _ = cfg
 
-        def list_markets(self, series_ticker: str, status: str = "open", limit: int = 100):
-            _ = status, limit
+        def iter_markets(self, series_ticker=None, status: str = "open", page_size: int = 100, max_items=None):
+            _ = status
             calls.append(series_ticker)
+            paging.append((page_size, max_items))
             return []
 
     monkeypatch.setattr("kalshi_weather_hitbot.cli.KalshiClient", FakeClient)
@@ -31,7 +33,10 @@ def test_scan_uses_city_series_tickers(monkeypatch, tmp_path: Path):
     )
 
     cfg = AppConfig(db_path=str(tmp_path / "x.db"))
+    cfg.scan.limit_markets = 50
     _scan_once(cfg)
 
     assert "KXHIGHTEMP-CHI" in calls
     assert "KXSNOW-CHI" not in calls
+    # limit_markets is the page size; every page is read unless a cap is configured.
+    assert paging == [(50, None)]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from kalshi_weather_hitbot.cli import _scan_once
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.utils.concurrency import HostConcurrencyLimiter
+
+
+def _cities(n: int) -> dict:
+    return {
+        f"city{i:02d}": {
+            "kalshi_series_tickers": [f"KXHIGHTEMP-C{i:02d}"],
+            "icao_station": f"K{i:03d}",
+            "lat": 40.0 + i,
+            "lon": -90.0,
+            "tz": "UTC",
+        }
+        for i in range(n)
+    }
+
+
+class _FakeClient:
+    def iter_markets(self, series_ticker=None, status: str = "open", page_size: int = 100, max_items=None):
+        _ = status, page_size, max_items
+        time.sleep(0.001)
+        close = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+        return [
+            {"ticker": f"{series_ticker}-B{low}", "floor_strike": low, "cap_strike": low + 1, "close_time": close}
+            for low in (60, 62, 64)
+        ]
+
+
+class _FakeMetar:
+    def fetch_metar_with_fallbacks(self, stations: list[str], hours: int = 24):
+        _ = hours
+        obs_time = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+        return [{"temp": 17, "obsTime": obs_time}], stations[0], "ok"
+
+
+class _FakeNWS:
+    def hourly_forecast(self, lat: float, lon: float):
+        _ = lat, lon
+        return []
+
+
+def test_concurrent_scan_matches_sequential_order(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.load_city_mapping", lambda _p: _cities(12))
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.climate_window_start", lambda close_ts, _tz: close_ts - timedelta(days=1))
+
+    seq_cfg = AppConfig(db_path=str(tmp_path / "seq.db"))
+    seq_cfg.scan.max_workers = 1
+    par_cfg = AppConfig(db_path=str(tmp_path / "par.db"))
+    par_cfg.scan.max_workers = 6
+
+    seq = _scan_once(seq_cfg, client=_FakeClient(), metar=_FakeMetar(), nws=_FakeNWS())
+    par = _scan_once(par_cfg, client=_FakeClient(), metar=_FakeMetar(), nws=_FakeNWS())
+
+    assert len(seq) == 36
+    assert [r["market_ticker"] for r in par] == [r["market_ticker"] for r in seq]
+    assert [r["lock_status"] for r in par] == [r["lock_status"] for r in seq]
+
+
+def test_host_limiter_caps_in_flight_requests_per_host():
+    limiter = HostConcurrencyLimiter(max_per_host=2)
+    lock = threading.Lock()
+    in_flight = {"aviationweather.gov": 0, "api.weather.gov": 0}
+    peak = {"aviationweather.gov": 0, "api.weather.gov": 0}
+
+    def _call(url: str) -> None:
+        host = HostConcurrencyLimiter.host_for(url)
+        with limiter.slot(url):
+            with lock:
+                in_flight[host] += 1
+                peak[host] = max(peak[host], in_flight[host])
+            time.sleep(0.01)
+            with lock:
+                in_flight[host] -= 1
+
+    threads = [
+        threading.Thread(target=_call, args=(url,))
+        for url in ["https://aviationweather.gov/api/data/metar", "https://api.weather.gov/points/1,2"] * 6
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak["aviationweather.gov"] == 2
+    assert peak["api.weather.gov"] == 2
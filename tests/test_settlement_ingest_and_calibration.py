@@ -4,7 +4,8 @@ from pathlib import Path
 from kalshi_weather_hitbot.cli import _maybe_calibrated_p_yes, sync_settlements
 from kalshi_weather_hitbot.config import AppConfig
 from kalshi_weather_hitbot.db import DB
-from kalshi_weather_hitbot.strategy.calibration import beta_posterior_mean
+from kalshi_weather_hitbot.kalshi.client import KalshiClient
+from kalshi_weather_hitbot.strategy.calibration import beta_posterior_mean, build_lock_calibration, record_settlement_outcomes
 
 
 def test_beta_calibration_posterior_mean():
@@ -12,31 +13,40 @@ def test_beta_calibration_posterior_mean():
     assert beta_posterior_mean(1, 1, 3, 1) == 4 / 6
 
 
+def _settlement(ticker: str) -> dict:
+    return {
+        "ticker": ticker,
+        "market_result": "YES",
+        "revenue_cents": 123,
+        "fee_cost_dollars": "0.01",
+        "settled_time": "2026-02-25T00:00:00Z",
+    }
+
+
+def _paged_settlements_client(pages: dict):
+    class FakeClient(KalshiClient):
+        def __init__(self, cfg):
+            super().__init__(cfg)
+            self.cursors: list[str | None] = []
+            self.aio.get_settlements = self._get_settlements  # type: ignore[method-assign]
+
+        async def _get_settlements(self, limit=200, cursor=None):
+            _ = limit
+            self.cursors.append(cursor)
+            items, next_cursor = pages[cursor]
+            return {"settlements": items, "cursor": next_cursor}
+
+    return FakeClient
+
+
 def test_settlement_ingest_writes_rows(monkeypatch, tmp_path: Path):
     db_path = tmp_path / "test.db"
     cfg = AppConfig(db_path=str(db_path))
 
-    class FakeClient:
-        def __init__(self, _cfg):
-            pass
-
-        def get_settlements(self, limit=200, cursor=None):
-            _ = limit, cursor
-            return {
-                "settlements": [
-                    {
-                        "ticker": "KXHIGHCHI-TEST",
-                        "market_result": "YES",
-                        "revenue_cents": 123,
-                        "fee_cost_dollars": "0.01",
-                        "settled_time": "2026-02-25T00:00:00Z",
-                    }
-                ],
-                "cursor": None,
-            }
-
     monkeypatch.setattr("kalshi_weather_hitbot.cli._load_cfg", lambda: cfg)
-    monkeypatch.setattr("kalshi_weather_hitbot.cli.KalshiClient", FakeClient)
+    monkeypatch.setattr(
+        "kalshi_weather_hitbot.cli.KalshiClient", _paged_settlements_client({None: ([_settlement("KXHIGHCHI-TEST")], None)})
+    )
 
     sync_settlements(max_pages=1, limit=50)
 
@@ -46,6 +56,32 @@ def test_settlement_ingest_writes_rows(monkeypatch, tmp_path: Path):
     assert row == ("KXHIGHCHI-TEST", "YES", 123, "0.01")
 
 
+def test_settlement_sync_follows_cursor_up_to_max_pages(monkeypatch, tmp_path: Path):
+    cfg = AppConfig(db_path=str(tmp_path / "test.db"))
+    pages = {
+        None: ([_settlement("T1"), _settlement("T2")], "c1"),
+        "c1": ([_settlement("T3"), _settlement("T4")], "c2"),
+        "c2": ([_settlement("T5")], None),
+    }
+    clients = []
+
+    def _client(cfg):
+        clients.append(_paged_settlements_client(pages)(cfg))
+        return clients[-1]
+
+    monkeypatch.setattr("kalshi_weather_hitbot.cli._load_cfg", lambda: cfg)
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.KalshiClient", _client)
+
+    sync_settlements(max_pages=2, limit=2)
+    assert clients[-1].cursors == [None, "c1"]
+    sync_settlements(max_pages=5, limit=2)
+    assert clients[-1].cursors == [None, "c1", "c2"]
+
+    with DB(cfg.db_path).connect() as con:
+        tickers = {r[0] for r in con.execute("SELECT ticker FROM settlements")}
+    assert tickers == {"T1", "T2", "T3", "T4", "T5"}
+
+
 def test_probability_override_only_when_enabled():
     cfg_disabled = AppConfig()
     cfg_disabled.calibration.enabled = False
@@ -70,3 +106,53 @@ def test_probability_override_only_when_enabled():
         calibration_lookup=lambda *_args: 0.61,
     )
     assert out_enabled == 0.61
+
+
+def _seed_trade(db: DB, ticker: str, side: str, hours_to_close: float) -> None:
+    db.insert_order(ticker, f"cid-{ticker}", {"side": side, "action": "buy", "count": 1, f"{side}_price": 90}, {}, "SUBMITTED")
+    db.insert_evaluation({"market_ticker": ticker, "city_key": "chicago", "lock_status": "LOCKED_YES", "hours_to_close": hours_to_close})
+
+
+def test_calibration_store_updates_incrementally(tmp_path: Path):
+    db_path = tmp_path / "calib.db"
+    db = DB(str(db_path))
+    buckets = [1.0, 3.0]
+    _seed_trade(db, "T1", "yes", 2.0)
+    db.insert_settlement({"ticker": "T1", "market_result": "yes"})
+
+    lookup = build_lock_calibration(str(db_path), by_city=True, buckets_hours_to_close=buckets, min_samples_per_bucket=1)
+    assert lookup("chicago", 2.0, "LOCKED_YES", 0.5) == 2 / 3
+    with db.connect() as con:
+        # Building a lookup only reads; the store is written on settlement sync.
+        assert con.execute("SELECT COUNT(*) FROM calibration_outcomes").fetchone() == (0,)
+
+    assert record_settlement_outcomes(db, ["T1"], buckets) == 1
+    _seed_trade(db, "T2", "yes", 2.5)
+    db.insert_settlement({"ticker": "T2", "market_result": "no"})
+    db.insert_settlement({"ticker": "T1", "market_result": "yes"})  # re-synced duplicate
+    assert record_settlement_outcomes(db, ["T2", "T1"], buckets) == 1
+
+    with db.connect() as con:
+        assert con.execute("SELECT city_key, bucket, wins, losses FROM calibration_counts").fetchall() == [("chicago", 3.0, 1, 1)]
+    lookup = build_lock_calibration(str(db_path), by_city=False, buckets_hours_to_close=buckets, min_samples_per_bucket=1)
+    assert lookup("denver", 2.0, "LOCKED_YES", 0.5) == 0.5
+
+    # Changing bucket edges re-buckets stored outcomes without touching history.
+    lookup = build_lock_calibration(str(db_path), by_city=True, buckets_hours_to_close=[2.0, 6.0], min_samples_per_bucket=1)
+    assert lookup("chicago", 1.0, "LOCKED_YES", 0.5) == 2 / 3
+    assert lookup("chicago", 2.5, "LOCKED_YES", 0.5) == 1 / 3
+
+
+def test_corrected_settlement_replaces_stored_outcome(tmp_path: Path):
+    db = DB(str(tmp_path / "corrected.db"))
+    buckets = [1.0, 3.0]
+    _seed_trade(db, "T1", "yes", 2.0)
+    db.insert_settlement({"ticker": "T1", "market_result": "yes"})
+    assert record_settlement_outcomes(db, ["T1"], buckets) == 1
+
+    db.insert_settlement({"ticker": "T1", "market_result": "no"})
+    assert record_settlement_outcomes(db, ["T1"], buckets) == 1
+
+    with db.connect() as con:
+        assert con.execute("SELECT ticker, won FROM calibration_outcomes").fetchall() == [("T1", 0)]
+        assert con.execute("SELECT city_key, bucket, wins, losses FROM calibration_counts").fetchall() == [("chicago", 3.0, 0, 1)]
@@ -0,0 +1,111 @@
+import pytest
+
+from kalshi_weather_hitbot import cli
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.kalshi.client import APIError
+from kalshi_weather_hitbot.kalshi.ledger import ShadowLedger
+from kalshi_weather_hitbot.strategy.risk import compute_open_orders_exposure, compute_positions_exposure
+
+
+def _resting(order_id: str, ticker: str = "T1", count: int = 2, price: int = 40) -> dict:
+    return {
+        "order_id": order_id,
+        "client_order_id": f"c-{order_id}",
+        "ticker": ticker,
+        "action": "buy",
+        "side": "yes",
+        "count": count,
+        "yes_price": price,
+        "status": "resting",
+    }
+
+
+def test_reconcile_dedupes_orders_and_matches_rest_exposure():
+    positions = [{"ticker": "P1", "market_exposure": 250, "position": 5}]
+    orders = [_resting("o1"), _resting("o1"), _resting("o2", ticker="T2"), {"client_order_id": "noid", "action": "buy"}]
+    ledger = ShadowLedger(reconcile_every_cycles=3)
+    assert ledger.needs_reconcile()
+
+    ledger.reconcile(100.0, positions, orders)
+
+    assert [o.order_id for o in ledger.active_orders()] == ["o1", "o2", ""]
+    expected = compute_positions_exposure(positions) + compute_open_orders_exposure(ledger.active_orders())
+    assert ledger.exposure_dollars() == pytest.approx(expected)
+    assert not ledger.needs_reconcile()
+
+
+def test_place_amend_cancel_update_orders_cash_and_exposure_incrementally():
+    ledger = ShadowLedger()
+    ledger.reconcile(100.0, [], [_resting("o1")])
+
+    payload = {"ticker": "T2", "action": "buy", "side": "no", "count": 3, "no_price": 30, "client_order_id": "c-new"}
+    ledger.apply_place(payload, {"order": {"order_id": "o2", "status": "resting"}}, exposure_dollars=0.9, cost_dollars=0.95)
+    assert ledger.available_dollars == pytest.approx(99.05)
+    assert ledger.exposure_dollars() == pytest.approx(0.8 + 0.9)
+
+    ledger.apply_amend("o1", {"order_id": "o1", "yes_price": 45}, {"order": {"order_id": "o1", "status": "resting"}})
+    assert ledger.exposure_dollars() == pytest.approx(0.9 + 0.9)
+
+    ledger.apply_cancel("o2", {"order": {"order_id": "o2", "status": "canceled"}})
+    assert [o.order_id for o in ledger.active_orders()] == ["o1"]
+    assert ledger.available_dollars == pytest.approx(99.95)
+    assert not ledger.needs_reconcile()
+
+
+def test_fills_and_unknown_orders_force_reconcile_next_cycle():
+    ledger = ShadowLedger(reconcile_every_cycles=10)
+    ledger.reconcile(50.0, [], [])
+
+    ledger.apply_place({"ticker": "T1", "client_order_id": "x"}, {"order": {"order_id": "o9", "status": "executed"}})
+    assert ledger.active_orders() == []
+    assert ledger.needs_reconcile()
+    assert ledger.stats().drift_reasons == ["fill:T1"]
+
+    ledger.reconcile(50.0, [], [])
+    ledger.apply_cancel("missing", {})
+    assert ledger.needs_reconcile()
+
+
+def test_reconcile_cadence_counts_cycles():
+    ledger = ShadowLedger(reconcile_every_cycles=2)
+    ledger.reconcile(0.0, [], [])
+    ledger.start_cycle()
+    assert not ledger.needs_reconcile()
+    ledger.start_cycle()
+    assert ledger.needs_reconcile()
+
+
+def test_fills_between_cycles_are_probed_from_last_reconcile():
+    class FakeClient:
+        def __init__(self, fills):
+            self.fills = fills
+            self.calls: list[int | None] = []
+
+        def get_fills(self, min_ts=None, limit=1):
+            self.calls.append(min_ts)
+            if isinstance(self.fills, Exception):
+                raise self.fills
+            return self.fills
+
+    cfg = AppConfig(api_key_id="k")
+    ledger = ShadowLedger(reconcile_every_cycles=10)
+    ledger.reconcile(50.0, [], [_resting("o1")], now=1_700_000_000.5)
+
+    quiet = FakeClient([])
+    cli._probe_ledger_fills(cfg, quiet, ledger)
+    assert quiet.calls == [1_700_000_000]
+    assert not ledger.needs_reconcile()
+
+    filled = FakeClient([{"ticker": "T1", "order_id": "o1", "count": 2}])
+    cli._probe_ledger_fills(cfg, filled, ledger)
+    assert ledger.needs_reconcile()
+    assert ledger.stats().drift_reasons == ["fill:T1"]
+
+    # Already due for a snapshot: no probe needed.
+    cli._probe_ledger_fills(cfg, filled, ledger)
+    assert len(filled.calls) == 1
+
+    ledger.reconcile(50.0, [], [])
+    failing = FakeClient(APIError("boom"))
+    cli._probe_ledger_fills(cfg, failing, ledger)
+    assert ledger.stats().drift_reasons == ["fills_probe_failed"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from kalshi_weather_hitbot.cli import _scan_once
+from kalshi_weather_hitbot.config import AppConfig
+from kalshi_weather_hitbot.data.metar import max_observed_temp_f
+from kalshi_weather_hitbot.data.nws import max_forecast_temp_f
+from kalshi_weather_hitbot.data.weather_context import CityWeatherContext
+
+
+NOW = datetime(2026, 7, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _records():
+    return [
+        {"obsTime": "2026-07-01T05:00:00Z", "temp": 30},
+        {"obsTime": "2026-07-01T15:00:00Z", "temp": 24},
+        {"obsTime": "2026-06-30T20:00:00Z", "temp": 33},
+        {"obsTime": "2026-07-01T12:00:00Z", "temp": None},
+        {"obsTime": "2026-07-01T19:00:00Z", "temp": 35},
+    ]
+
+
+def _periods():
+    return [
+        {"startTime": "2026-07-01T15:00:00-05:00", "temperature": 88, "temperatureUnit": "F"},
+        {"startTime": "2026-07-01T16:00:00-05:00", "temperature": 31, "temperatureUnit": "C"},
+        {"startTime": "2026-07-01T20:00:00-05:00", "temperature": 95, "temperatureUnit": "F"},
+        {"startTime": "2026-07-01T11:00:00-05:00", "temperature": 99, "temperatureUnit": "F"},
+    ]
+
+
+def test_context_matches_per_market_helpers():
+    loads = []
+
+    def _loader():
+        loads.append(1)
+        return _periods()
+
+    ctx = CityWeatherContext(
+        stations=["KMDW"],
+        records=_records(),
+        used_station="KMDW",
+        metar_status="ok",
+        now_utc=NOW,
+        forecast_loader=_loader,
+    )
+    for start in [NOW - timedelta(hours=h) for h in (2, 6, 13, 30)]:
+        assert ctx.observed_max(start) == max_observed_temp_f(_records(), start, NOW)
+    for close in [NOW + timedelta(hours=h) for h in (1, 3, 6)]:
+        assert ctx.forecast_max(NOW, close) == max_forecast_temp_f(_periods(), NOW, close)
+    assert loads == [1]
+
+
+def test_scan_builds_one_weather_context_per_city(monkeypatch, tmp_path: Path):
+    close = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+    metar_calls: list[list[str]] = []
+    nws_calls: list[tuple[float, float]] = []
+
+    class FakeClient:
+        def iter_markets(self, series_ticker=None, status: str = "open", page_size: int = 100, max_items=None):
+            _ = status, page_size, max_items
+            return [
+                {"ticker": f"{series_ticker}-B{low}", "floor_strike": low, "cap_strike": low + 1, "close_time": close}
+                for low in (60, 62, 64, 66)
+            ]
+
+    class FakeMetar:
+        def fetch_metar_with_fallbacks(self, stations, hours=24):
+            _ = hours
+            metar_calls.append(list(stations))
+            obs = (datetime.now(timezone.utc) - timedelta(minutes=5)).isoformat()
+            return [{"temp": 17, "obsTime": obs}], stations[0], "ok"
+
+    class FakeNWS:
+        def hourly_forecast(self, lat, lon):
+            nws_calls.append((lat, lon))
+            return []
+
+    monkeypatch.setattr(
+        "kalshi_weather_hitbot.cli.load_city_mapping",
+        lambda _p: {
+            "chicago": {
+                "kalshi_series_tickers": ["KXHIGHTEMP-CHI"],
+                "icao_station": "KMDW",
+                "lat": 41.7868,
+                "lon": -87.7522,
+                "tz": "America/Chicago",
+            }
+        },
+    )
+    monkeypatch.setattr("kalshi_weather_hitbot.cli.climate_window_start", lambda close_ts, _tz: close_ts - timedelta(days=1))
+
+    out = _scan_once(AppConfig(db_path=str(tmp_path / "ctx.db")), client=FakeClient(), metar=FakeMetar(), nws=FakeNWS())
+
+    assert len(out) == 4
+    assert metar_calls == [["KMDW"]]
+    assert len(nws_calls) == 1